@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import math
 from dataclasses import replace
 from datetime import date
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Sequence
 from fractions import Fraction
 
@@ -55,6 +55,13 @@ def get_calendar(name: str, *, location: Optional[LocationSpec] = None) -> Calen
     from .engines.specs import ALL_SPECS
     if name not in ALL_SPECS:
         raise KeyError(f"Unknown engine spec '{name}'")
+    return _cached_calendar(name, location)
+
+# Built engines are immutable and carry their own boundary/month caches, so
+# repeated lookups (web handlers, diagnostics) reuse one instance per key.
+@lru_cache(maxsize=64)
+def _cached_calendar(name: str, location: Optional[LocationSpec]) -> CalendarEngine:
+    from .engines.specs import ALL_SPECS
     
     # spec is now natively a CalendarSpec!
     spec = ALL_SPECS[name]
@@ -196,14 +203,14 @@ def days_in_month(Y: int, M: int, *, is_leap_month: bool = False, engine: str =
 def true_date_dn(d: int, n: int, *, engine: str = "phugpa"):
     """Returns absolute true_date (Days since J2000.0) via continuous x."""
     eng = _reg().get(engine)
-    x = Fraction(30 * n + d, 1)
+    x = 30 * n + d
     return eng.day.true_date(x)
 
 def end_jd_dn(d: int, n: int, *, engine: str = "phugpa") -> int:
     """Returns absolute Julian Day Number via continuous x."""
     eng = _reg().get(engine)
-    x = Fraction(30 * n + d, 1)
-    return math.floor(eng.day.local_civil_date(x) + JD_J2000)
+    x = 30 * n + d
+    return eng.day.civil_jdn(x)
 
 def civil_month_n(n: int, *, engine: str = "phugpa") -> List[Dict[str, Any]]:
     """Diagnostic: list civil day records for a specific lunation n."""
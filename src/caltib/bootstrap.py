@@ -1,10 +1,11 @@
 from __future__ import annotations
+from functools import partial
 from caltib.core.engine import EngineRegistry
 from caltib.engines.specs import ALL_SPECS
-from caltib.engines.factory import make_engine
+from caltib.api import get_calendar
 
 def build_registry() -> EngineRegistry:
-    engines = {}
-    for name, spec in ALL_SPECS.items():
-        engines[name] = make_engine(spec)
-    return EngineRegistry(engines)
+    # Engines are built lazily on first use and shared (with their caches)
+    # with get_calendar(name)
+    factories = {name: partial(get_calendar, name) for name in ALL_SPECS}
+    return EngineRegistry({}, factories)
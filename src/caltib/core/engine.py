@@ -1,6 +1,6 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Dict, List
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List
 
 # Import our concrete orchestrator directly
 from caltib.engines.calendar import CalendarEngine
@@ -8,16 +8,21 @@ from caltib.engines.calendar import CalendarEngine
 @dataclass
 class EngineRegistry:
     _engines: Dict[str, CalendarEngine]
+    # Engines built on first get(); most callers only ever touch one or two
+    _factories: Dict[str, Callable[[], CalendarEngine]] = field(default_factory=dict)
 
     def get(self, name: str) -> CalendarEngine:
         if name not in self._engines:
-            raise KeyError(f"Unknown engine '{name}'. Available: {sorted(self._engines)}")
+            factory = self._factories.get(name)
+            if factory is None:
+                raise KeyError(f"Unknown engine '{name}'. Available: {self.list()}")
+            self._engines[name] = factory()
         return self._engines[name]
 
     def list(self) -> List[str]:
-        return sorted(self._engines.keys())
+        return sorted(self._engines.keys() | self._factories.keys())
 
     def register(self, name: str, engine: CalendarEngine, *, overwrite: bool = False) -> None:
-        if (not overwrite) and (name in self._engines):
+        if (not overwrite) and (name in self._engines or name in self._factories):
             raise KeyError(f"Engine '{name}' already exists. Use overwrite=True to replace.")
         self._engines[name] = engine
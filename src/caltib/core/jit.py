@@ -0,0 +1,94 @@
+"""
+caltib.core.jit
+---------------
+Optional numba JIT for the float64 and integer kernels (pip install "caltib[jit]").
+
+Kernels are decorated with maybe_njit at import time, but numba itself is
+only imported when the first kernel is called, so `import caltib` and the
+exact Fraction engines never pay for it. Without numba every kernel runs as
+plain Python (or its fallback).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+_UNPROBED = object()
+_numba: Any = _UNPROBED
+
+
+def numba_module() -> Optional[Any]:
+    """The numba module, imported on first use; None when it is not installed."""
+    global _numba
+    if _numba is _UNPROBED:
+        try:
+            import numba
+        except ImportError:  # pragma: no cover - optional dependency
+            numba = None
+        _numba = numba
+    return _numba
+
+
+def jit_enabled() -> bool:
+    """True when numba is installed (imports it on the first call)."""
+    return numba_module() is not None
+
+
+def __getattr__(name: str) -> Any:
+    # numba.prange for parallel kernel bodies, resolved only once numba is in use
+    if name == "prange":
+        nb = numba_module()
+        return nb.prange if nb is not None else range
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _LazyKernel:
+    """
+    Stand-in for a kernel until its first call. The first call compiles it
+    (or picks the Python fallback) and rebinds the module global to the
+    result, so later calls go straight to the numba dispatcher.
+    """
+
+    def __init__(self, fn: Callable, parallel: bool, fallback: Optional[Callable]):
+        self.py_func = fn
+        self._parallel = parallel
+        self._fallback = fallback
+        self._impl: Optional[Callable] = None
+        self.__name__ = fn.__name__
+        self.__qualname__ = fn.__qualname__
+        self.__doc__ = fn.__doc__
+        self.__module__ = fn.__module__
+
+    def resolve(self) -> Callable:
+        impl = self._impl
+        if impl is None:
+            fn = self.py_func
+            g = fn.__globals__
+            # Kernels called from this one must be dispatchers before numba types it
+            for name in fn.__code__.co_names:
+                dep = g.get(name)
+                if isinstance(dep, _LazyKernel) and dep is not self:
+                    dep.resolve()
+            nb = numba_module()
+            if nb is None:
+                impl = self._fallback or fn
+            else:
+                # No fastmath: FMA contraction would break cross-platform reproducibility
+                impl = nb.njit(cache=True, parallel=self._parallel)(fn)
+            self._impl = impl
+            if g.get(fn.__name__) is self:
+                g[fn.__name__] = impl
+        return impl
+
+    def __call__(self, *args: Any) -> Any:
+        return self.resolve()(*args)
+
+
+def maybe_njit(fn: Optional[Callable] = None, *, parallel: bool = False, fallback: Optional[Callable] = None):
+    """
+    Decorator: njit(cache=True) the kernel on its first call when numba is
+    installed, else run `fallback` (default: the function itself).
+    """
+    if fn is None:
+        return lambda f: _LazyKernel(f, parallel, fallback)
+    return _LazyKernel(fn, parallel, fallback)
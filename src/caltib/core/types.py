@@ -1,10 +1,14 @@
 from __future__ import annotations
+import sys
 from dataclasses import dataclass, field
 from datetime import date
 from fractions import Fraction
 from enum import Enum
 from typing import Any, Dict, List, Literal, Optional, Tuple
 
+# Per-day records are built ~30 per month query; slot them where dataclasses can (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 @dataclass(frozen=True)
 class EngineId:
     family: Literal["trad", "reform", "custom"]
@@ -29,7 +33,7 @@ class SunriseState(Enum):
     POLAR_DAY = "polar_day"      # Midnight sun (never sets)
     POLAR_NIGHT = "polar_night"  # Sun never rises
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class TibetanDate:
     """Pure mathematical coordinate of a Tibetan day."""
     engine: EngineId
@@ -45,7 +49,7 @@ class TibetanDate:
     def lunar_day(self) -> int:
         return self.tithi
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class DayInfo:
     """Rich UI container for a specific civil day."""
     civil_date: date
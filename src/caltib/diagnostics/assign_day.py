@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import argparse
+from collections import defaultdict
 from datetime import datetime, timedelta
 from fractions import Fraction
 from typing import List, Optional
@@ -128,11 +129,11 @@ def main(argv: Optional[List[str]] = None) -> int:
     # 2. Map Civil Grid & Assure Complete Tithi Coverage
     civil_bounds = list(range(J_start, J_end + 2))
     
-    jdn_to_x = {J: [] for J in range(J_start, J_end + 1)}
+    # One pass over the tithi range; every lookup below reads from this map
+    hits = defaultdict(list)
     for x in range(x_lo - 15, x_hi + 16):
-        J = eng.day.civil_jdn(x)
-        if J in jdn_to_x:
-            jdn_to_x[J].append(x)
+        hits[eng.day.civil_jdn(x)].append(x)
+    jdn_to_x = {J: hits.get(J, []) for J in range(J_start, J_end + 1)}
 
     # Trim the vertical plot bounds cleanly to exactly what falls in the viewable window
     active_xs = []
@@ -153,8 +154,8 @@ def main(argv: Optional[List[str]] = None) -> int:
         if jdn in jdn_to_x and len(jdn_to_x[jdn]) > 0:
             return sorted(jdn_to_x[jdn])[0]
         curr = jdn + 1
-        while curr <= max(jdn_to_x.keys()) + 15:
-            ends = sorted([x for x in range(x_lo - 15, x_hi + 16) if eng.day.civil_jdn(x) == curr])
+        while curr <= J_end + 15:
+            ends = hits.get(curr)
             if ends:
                 return ends[0]
             curr += 1
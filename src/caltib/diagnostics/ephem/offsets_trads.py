@@ -11,7 +11,7 @@ import caltib
 from caltib.ephemeris.de422 import (
     DE422Elongation,
     build_new_moons,
-    tithi_boundary_in_lunation,
+    tithi_boundaries_in_lunation,
     wrap180,
 )
 
@@ -152,9 +152,9 @@ def main(argv: Optional[List[str]] = None) -> int:
             k = n_to_k[n]
             t0 = moons[k]
             t1 = moons[k + 1]
-            for d in day_list:
+            t_des = tithi_boundaries_in_lunation(el, t0, t1, day_list)
+            for d, t_de in zip(day_list, t_des):
                 t_tib = float(eng_obj.day.true_date(d, n))
-                t_de = tithi_boundary_in_lunation(el, t0, t1, d)
                 dh = 24.0 * (t_tib - t_de)
                 diffs_h.append(dh)
                 rows.append((Y, n, d, t_tib, t_de, dh, k))
@@ -11,16 +11,15 @@ from dataclasses import dataclass
 from fractions import Fraction
 from typing import Tuple
 
-from caltib.core.types import LocationSpec, SunriseState
+from caltib.core.types import LocationSpec, SunriseState, _SLOTS
 from caltib.engines.interfaces import DayEngineProtocol, NumT
+from caltib.engines.astro.rational import frac_turn_nd
 
+JD_J2000 = Fraction(2451545, 1)
+JDN_J2000 = 2451545
 
-def frac_turn(x: Fraction) -> Fraction:
-    """Wraps a fractional turn to [0, 1)."""
-    q = x.numerator // x.denominator
-    return x - Fraction(q, 1)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class ArithmeticDayParams:
     epoch_k: int
     location: LocationSpec  # The new standardized anchor
@@ -83,6 +82,13 @@ class ArithmeticDayEngine(DayEngineProtocol):
         jdn_floor = p.m0_loc.numerator // p.m0_loc.denominator
         self._epoch_t2000 = Fraction(jdn_floor - 2451545, 1)
 
+        # Mean sun s0 + x*s2 over one common denominator (s2 = s1/30 is a
+        # property): mean_sun becomes one integer sum wrapped with one gcd.
+        s0, s2 = p.s0, p.s2
+        self._s_den = s0.denominator * s2.denominator
+        self._s0_num = s0.numerator * s2.denominator
+        self._s2_num = s2.numerator * s0.denominator
+
     # ---------------------------------------------------------
     # Protocol Properties
     # ---------------------------------------------------------
@@ -99,7 +105,9 @@ class ArithmeticDayEngine(DayEngineProtocol):
     # Protocol Methods
     # ---------------------------------------------------------
     def mean_date(self, x: NumT) -> Fraction:
-        return self._m0_loc_t2000 + Fraction(x) * self.p.m2
+        if not isinstance(x, (int, Fraction)):
+            x = Fraction(x)
+        return self._m0_loc_t2000 + x * self.p.m2
 
     def true_date(self, x: NumT) -> Fraction:
         """In a purely arithmetic mean model, true syzygy IS mean syzygy."""
@@ -108,13 +116,21 @@ class ArithmeticDayEngine(DayEngineProtocol):
     def get_x_from_t2000(self, t2000: NumT) -> int:
         """Inverse lookup of active tithi using pure rational arithmetic."""
         # Calculate the exact fractional tithi index
-        x_frac = (Fraction(t2000) - self._m0_loc_t2000) / self.p.m2
+        if not isinstance(t2000, (int, Fraction)):
+            t2000 = Fraction(t2000)
+        x_frac = (t2000 - self._m0_loc_t2000) / self.p.m2
         
         # Pure rational floor via unbounded integer division
         return x_frac.numerator // x_frac.denominator
 
     def mean_sun(self, x: NumT) -> Fraction:
-        return frac_turn(self.p.s0 + Fraction(x) * self.p.s2)
+        if isinstance(x, float):
+            xn, xd = x.as_integer_ratio()
+        else:
+            if not isinstance(x, (int, Fraction)):
+                x = Fraction(x)
+            xn, xd = x.numerator, x.denominator
+        return frac_turn_nd(self._s0_num * xd + self._s2_num * xn, self._s_den * xd)
 
     def true_sun(self, x: NumT) -> Fraction:
         return self.mean_sun(x)
@@ -125,7 +141,11 @@ class ArithmeticDayEngine(DayEngineProtocol):
         Taking floor(local_civil_date) will yield exact civil day bounds.
         """
         # Continuous equivalent of J(x) = floor((V*x + V + delta_star) / U)
-        continuous_j = (Fraction(self.p.V) * Fraction(x) + self.p.V + self.p.delta_star) / self.p.U
+        if isinstance(x, int):
+            # Integer tithis keep the whole numerator in ints: one Fraction, one gcd
+            continuous_j = Fraction(self.p.V * x + self.p.V + self.p.delta_star, self.p.U)
+        else:
+            continuous_j = (Fraction(self.p.V) * Fraction(x) + self.p.V + self.p.delta_star) / self.p.U
         return self._epoch_t2000 + continuous_j
 
     def civil_jdn(self, x: NumT) -> int:
@@ -133,13 +153,13 @@ class ArithmeticDayEngine(DayEngineProtocol):
         Returns the absolute discrete JDN using pure rational integer arithmetic.
         Completely bypasses FPU and math.floor.
         """
-        from fractions import Fraction
-        
-        # 1. Get the continuous fraction (t2000) and add the exact J2000 offset
-        abs_date = self.local_civil_date(x) + Fraction(2451545, 1)
-        
-        # 2. Pure rational floor via unbounded integer division
-        return abs_date.numerator // abs_date.denominator
+        # 1. Get the continuous fraction (t2000)
+        t = self.local_civil_date(x)
+
+        # 2. Pure rational floor via unbounded integer division; J2000 is a
+        #    whole day, so it is added after the floor as a plain int.
+        n, d = t.numerator, t.denominator
+        return n // d + JDN_J2000
 
     # ---------------------------------------------------------
     # Diagnostic / Appendix E Helpers
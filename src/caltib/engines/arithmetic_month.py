@@ -23,6 +23,30 @@ def amod12(x: int) -> int:
     return ((x - 1) % 12) + 1
 
 
+def _label_core(n, P, Q, beta_int, M0, Y0):
+    """(Y, M, leap_state) of lunation n; pure integer arithmetic over the cycle constants."""
+    c = -beta_int - 1
+    cumul = (P * n + c) // Q + 1 + M0
+    cumul_next = (P * (n + 1) + c) // Q + 1 + M0
+    cumul_prev = (P * (n - 1) + c) // Q + 1 + M0
+
+    q, r = divmod(cumul - 1, 12)
+    M = r + 1
+    Y = Y0 + q
+    if cumul == cumul_next:
+        return Y, M, 1
+    if cumul == cumul_prev:
+        return Y, M, 2
+    return Y, M, 0
+
+
+def _lunations_core(Y, M, P, Q, beta_int, ell, M0, Y0):
+    """(n_plus, is_trigger) for label (Y, M); the closed-form forward map."""
+    Mst = 12 * (Y - Y0) + (M - M0)
+    nplus = (Q * Mst + beta_int) // P
+    return nplus, (ell * Mst + beta_int) % P < ell
+
+
 @dataclass(frozen=True)
 class ArithmeticMonthParams:
     epoch_k: int       # The absolute Meeus lunation index corresponding to internal n=0
@@ -46,6 +70,14 @@ class ArithmeticMonthParams:
             raise ValueError("M0 must be in 1..12")
         if not (0 <= self.tau < self.P):
             raise ValueError("tau must be in 0..P-1")
+
+        # Derived cycle constants are read on every label lookup: compute once
+        ell = self.Q - self.P
+        gamma_shift = (self.P - self.tau) % self.P
+        object.__setattr__(self, "_ell", ell)
+        object.__setattr__(self, "_gamma_shift", gamma_shift)
+        object.__setattr__(self, "_beta_int", self.beta_star + gamma_shift)
+        object.__setattr__(self, "_trigger_set", tuple((self.tau + k) % self.P for k in range(ell)))
     
     @property
     def s1(self) -> Fraction:
@@ -54,11 +86,11 @@ class ArithmeticMonthParams:
 
     @property
     def ell(self) -> int:
-        return self.Q - self.P
+        return self._ell
 
     @property
     def trigger_set(self) -> Tuple[int, ...]:
-        return tuple(((self.tau + k) % self.P) for k in range(self.ell))
+        return self._trigger_set
 
     @property
     def gamma_shift(self) -> int:
@@ -66,7 +98,7 @@ class ArithmeticMonthParams:
         Shift sending TriggerSet to {0,...,ell-1}:
           gamma_shift ≡ -tau (mod P), in {0,...,P-1}.
         """
-        return (self.P - self.tau) % self.P
+        return self._gamma_shift
 
     @property
     def beta_int(self) -> int:
@@ -74,7 +106,7 @@ class ArithmeticMonthParams:
         Combined constant used in internal index and n_+:
           beta_int := beta_star + gamma_shift.
         """
-        return self.beta_star + self.gamma_shift
+        return self._beta_int
 
 
 class ArithmeticMonthEngine(MonthEngineProtocol):
@@ -86,6 +118,13 @@ class ArithmeticMonthEngine(MonthEngineProtocol):
         self.p = p
         # Cache the shifted physical anchor immediately
         self._m0_t2000 = p.m0 - Fraction(2451545, 1)
+        self._sgang_base = (p.sgang1_deg / Fraction(360, 1)) % 1
+
+        # Cycle constants as plain engine ints: the label maps read them on
+        # every call and pass them straight to the (optionally jitted) kernels.
+        self._P, self._Q, self._ell = p.P, p.Q, p.ell
+        self._beta_int, self._beta_star = p.beta_int, p.beta_star
+        self._M0, self._Y0 = p.M0, p.Y0
 
     # ---------------------------------------------------------
     # Protocol Properties
@@ -97,7 +136,7 @@ class ArithmeticMonthEngine(MonthEngineProtocol):
     @property
     def sgang_base(self) -> Fraction:
         """Converts degrees to a normalized continuous zodiac offset in turns [0, 1)."""
-        return (self.p.sgang1_deg / Fraction(360, 1)) % 1
+        return self._sgang_base
 
     # ---------------------------------------------------------
     # Civil / Human Labels (The Orchestrator's Interface)
@@ -107,8 +146,10 @@ class ArithmeticMonthEngine(MonthEngineProtocol):
         Returns the internal lunation indices n for the given label (year, month).
         Internal convention: n=0 is the epoch anchor of this engine.
         """
-        nplus = self.n_plus(year, month)
-        if self.is_trigger_label(year, month):
+        nplus, trigger = _lunations_core(
+            year, month, self._P, self._Q, self._beta_int, self._ell, self._M0, self._Y0
+        )
+        if trigger:
             # A leap month pair chronologically spans [nplus - 1, nplus]
             return [nplus - 1, nplus]
         return [nplus]
@@ -141,7 +182,9 @@ class ArithmeticMonthEngine(MonthEngineProtocol):
     # ---------------------------------------------------------
     def mean_date(self, l: NumT) -> Fraction:
         """Physical time t (Days since J2000.0 TT) when Mean Elongation equals l turns."""
-        return self._m0_t2000 + self.p.m1 * Fraction(l)
+        if not isinstance(l, (int, Fraction)):
+            l = Fraction(l)
+        return self._m0_t2000 + self.p.m1 * l
 
     def true_date(self, l: NumT) -> Fraction:
         """Physical time t when True Elongation equals l turns. (True = Mean for Traditional)."""
@@ -149,11 +192,15 @@ class ArithmeticMonthEngine(MonthEngineProtocol):
 
     def get_l_from_t2000(self, t2000: NumT) -> Fraction:
         """Inverse kinematic lookup: true elongation (in turns) at physical time t."""
-        return (Fraction(t2000) - self._m0_t2000) / self.p.m1
+        if not isinstance(t2000, (int, Fraction)):
+            t2000 = Fraction(t2000)
+        return (t2000 - self._m0_t2000) / self.p.m1
 
     def mean_sun(self, l: NumT) -> Fraction:
         """Mean solar longitude (turns) at the moment true_date(l)."""
-        s = self.p.s0 + self.p.s1 * Fraction(l)
+        if not isinstance(l, (int, Fraction)):
+            l = Fraction(l)
+        s = self.p.s0 + self.p.s1 * l
         return s - Fraction(s.numerator // s.denominator, 1)
 
     def true_sun(self, l: NumT) -> Fraction:
@@ -164,18 +211,34 @@ class ArithmeticMonthEngine(MonthEngineProtocol):
     # Core Mathematical Forward Tracking
     # ---------------------------------------------------------
     def mstar(self, Y: int, M: int) -> int:
-        return 12 * (Y - self.p.Y0) + (M - self.p.M0)
+        return 12 * (Y - self._Y0) + (M - self._M0)
 
     def intercalation_index(self, Y: int, M: int) -> int:
         """I ≡ ell*M* + beta_star  (mod P)."""
-        return (self.p.ell * self.mstar(Y, M) + self.p.beta_star) % self.p.P
+        return (self._ell * self.mstar(Y, M) + self._beta_star) % self._P
 
     def intercalation_index_internal(self, Y: int, M: int) -> int:
         """I_int ≡ ell*M* + beta_int  (mod P). Trigger iff I_int < ell."""
-        return (self.p.ell * self.mstar(Y, M) + self.p.beta_int) % self.p.P
+        return (self._ell * self.mstar(Y, M) + self._beta_int) % self._P
 
     def is_trigger_label(self, Y: int, M: int) -> bool:
-        return self.intercalation_index_internal(Y, M) < self.p.ell
+        return self.intercalation_index_internal(Y, M) < self._ell
+
+    def trigger_labels(self, Y: int, M: int, count: int) -> List[bool]:
+        """
+        is_trigger_label for `count` consecutive labels starting at (Y, M).
+        Each step advances M* by one, so I_int rolls forward by ell (mod P):
+        one add and compare per month instead of a product and modulo.
+        """
+        P, ell = self._P, self._ell
+        I = self.intercalation_index_internal(Y, M)
+        out = []
+        for _ in range(count):
+            out.append(I < ell)
+            I += ell
+            if I >= P:
+                I -= P
+        return out
 
     def intercalation_index_traditional(self, Y: int, M: int, *, wrap: str = "extended") -> int:
         """
@@ -198,7 +261,7 @@ class ArithmeticMonthEngine(MonthEngineProtocol):
           n_+(M*) = floor((Q*M* + beta_int)/P).
         """
         Mst = self.mstar(Y, M)
-        return _floor_div(self.p.Q * Mst + self.p.beta_int, self.p.P)
+        return _floor_div(self._Q * Mst + self._beta_int, self._P)
 
     # ---------------------------------------------------------
     # Core Mathematical Inverse Tracking
@@ -207,11 +270,11 @@ class ArithmeticMonthEngine(MonthEngineProtocol):
         """
         Right-end inverse: M*(n) = floor((P*n - beta_int - 1)/Q) + 1.
         """
-        return _floor_div(self.p.P * n - self.p.beta_int - 1, self.p.Q) + 1
+        return _floor_div(self._P * n - self._beta_int - 1, self._Q) + 1
 
     def cumul_month_from_lunation(self, n: int) -> int:
         """x = M* + M0 = 12(Y-Y0)+M."""
-        return self.mstar_from_lunation(n) + self.p.M0
+        return self.mstar_from_lunation(n) + self._M0
 
     def label_from_lunation(self, n: int) -> Tuple[int, int, int]:
         """
@@ -219,20 +282,31 @@ class ArithmeticMonthEngine(MonthEngineProtocol):
         Returns (Year, Month, leap_state) where leap_state is:
         0 = regular, 1 = first occurrence, 2 = second occurrence.
         """
-        cumul = self.cumul_month_from_lunation(n)
-        M = amod12(cumul)
-        Y = self.p.Y0 + _floor_div(cumul - M, 12)
-
-        cumul_next = self.cumul_month_from_lunation(n + 1)
-        cumul_prev = self.cumul_month_from_lunation(n - 1)
-
-        if cumul == cumul_next:
-            leap_state = 1
-        elif cumul == cumul_prev:
-            leap_state = 2
-        else:
-            leap_state = 0
+        return _label_core(n, self._P, self._Q, self._beta_int, self._M0, self._Y0)
 
+    def label_from_lunation_array(self, n):
+        """
+        Batch label_from_lunation over a NumPy integer array of lunations.
+        Returns (Y, M, leap_state) as int64 arrays, element-wise identical.
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise RuntimeError("This function needs numpy. Install: pip install numpy") from e
+
+        n = np.asarray(n, dtype=np.int64)
+        P, Q, M0 = self._P, self._Q, self._M0
+        c = -self._beta_int - 1
+
+        # cumul(n) = floor((P*n - beta_int - 1)/Q) + 1 + M0; numpy // floors like Python
+        cumul = (P * n + c) // Q + (1 + M0)
+        cumul_next = (P * (n + 1) + c) // Q + (1 + M0)
+        cumul_prev = (P * (n - 1) + c) // Q + (1 + M0)
+
+        q, r = np.divmod(cumul - 1, 12)
+        M = r + 1
+        Y = self._Y0 + q
+        leap_state = np.where(cumul == cumul_next, 1, np.where(cumul == cumul_prev, 2, 0))
         return Y, M, leap_state
 
     # ---------------------------------------------------------
@@ -283,8 +357,9 @@ class ArithmeticMonthEngine(MonthEngineProtocol):
 
     def debug_lunation(self, n: int) -> Dict[str, object]:
         cumul = self.cumul_month_from_lunation(n)
-        M = amod12(cumul)
-        Y = self.p.Y0 + _floor_div(cumul - M, 12)
+        q, r = divmod(cumul - 1, 12)
+        M = r + 1
+        Y = self._Y0 + q
 
         cumul_prev = self.cumul_month_from_lunation(n - 1)
         cumul_next = self.cumul_month_from_lunation(n + 1)
@@ -1,13 +1,49 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from fractions import Fraction
-from typing import Callable, Dict, Tuple, Any
+from functools import lru_cache
+from math import lcm
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Any
 
+from caltib.core.jit import jit_enabled
+from caltib.engines.astro.rational import USE_GMPY2, frac_turn, to_fraction, to_rat
+from caltib.engines.astro import tables as _tables
+from caltib.engines.astro.tables import QuarterWaveTable, get_quarter_wave_table
 
-def frac_turn(x: Fraction) -> Fraction:
-    q = x.numerator // x.denominator
-    return x - Fraction(q, 1)
+# Term records are read on every series evaluation; slot them where dataclasses can (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Picard early-exit threshold: successive iterates closer than 2^-PICARD_TOL_BITS
+# days are treated as converged.
+PICARD_TOL_BITS = 50
+
+
+def _iterates_agree(a: Fraction, b: Fraction, bits: Optional[int] = PICARD_TOL_BITS) -> bool:
+    """
+    Exact test for |a - b| < 2^-bits, cross-multiplying numerators so that
+    no intermediate Fraction (and no gcd) is built. bits=None tests a == b.
+    """
+    if bits is None:
+        return a == b
+    ad, bd = a.denominator, b.denominator
+    return abs(a.numerator * bd - b.numerator * ad) << bits < ad * bd
+
+
+def _scaled(c: Any, scale: int) -> int:
+    """Numerator of the rational c over the denominator scale (a multiple of c's)."""
+    c = Fraction(c)
+    return c.numerator * (scale // c.denominator)
+
+
+def _fraction_kernel(fn: Callable[[Fraction], Fraction]) -> Callable[[int, int], Tuple[int, int]]:
+    """(num, den) -> (vn, vd) adapter for a table lookup without an integer kernel."""
+    def kernel(num: int, den: int) -> Tuple[int, int]:
+        v = fn(frac_turn(Fraction(num, den)))
+        return v.numerator, v.denominator
+    return kernel
 
 
 # ============================================================
@@ -48,21 +84,98 @@ class AffineTabSeriesDN:
     base_cd: Fraction
     terms: Tuple[TabTermDN, ...]
 
+    def __post_init__(self) -> None:
+        # Integer plan for eval_nd: the base and every phase are rescaled to
+        # one common denominator each, so (d, n) -> value is pure int arithmetic.
+        base = (self.base_c0, self.base_cn, self.base_cd)
+        bscale = lcm(*(Fraction(c).denominator for c in base))
+        object.__setattr__(self, "_base_nd", tuple(_scaled(c, bscale) for c in base) + (bscale,))
+
+        plan = []
+        for term in self.terms:
+            ph = (term.phase.c0, term.phase.c1, term.phase.c2)
+            pscale = lcm(*(Fraction(c).denominator for c in ph))
+            kernel = _table_kernel(term.table_eval_turn)
+            amp = Fraction(term.amp)
+            if kernel is None:
+                fn, tscale = _fraction_kernel(term.table_eval_turn), 1
+            else:
+                fn, tscale = kernel
+            plan.append(
+                tuple(_scaled(c, pscale) for c in ph)
+                + (pscale, fn, amp.numerator, amp.denominator * tscale)
+            )
+        object.__setattr__(self, "_plan", tuple(plan))
+
     def base(self, d: int, n: int) -> Fraction:
         return self.base_c0 + Fraction(n, 1) * self.base_cn + Fraction(d, 1) * self.base_cd
 
+    def eval_nd(self, n: int, dn: int, dd: int) -> Tuple[int, int]:
+        """
+        eval(dn/dd, n) as an unreduced (numerator, denominator > 0) pair.
+        Phases feed the table's integer kernel directly and the sum is
+        accumulated over raw numerators, so no gcd is paid here; the
+        caller reduces once (or floors the pair) at the very end.
+        """
+        B0, Bn, Bd, bscale = self._base_nd
+        num = (B0 + Bn * n) * dd + Bd * dn
+        den = bscale * dd
+        for P0, P1, P2, pscale, kernel, an, ad in self._plan:
+            vn, vd = kernel((P0 + P1 * n) * dd + P2 * dn, pscale * dd)
+            ad *= vd
+            num = num * ad + an * vn * den
+            den *= ad
+        return num, den
+
     def eval(self, d: int, n: int) -> Fraction:
-        t = self.base(d, n)
-        for term in self.terms:
-            t += term.amp * term.table_eval_turn(term.phase.eval(d, n))
-        return t
+        if not isinstance(d, (int, Fraction)):
+            d = Fraction(d)
+        return Fraction(*self.eval_nd(int(n), d.numerator, d.denominator))
+
+    def eval_nd_run(self, n: int, d: int, count: int, period: int = 30) -> Iterator[Tuple[int, int]]:
+        """
+        eval_nd over `count` consecutive integer steps starting at (n, d),
+        with d wrapping to 0 (and n advancing) after period - 1. The affine
+        base and phase numerators are advanced by constant first differences
+        instead of being re-multiplied, so each step costs a few int adds
+        plus the table lookups. Yields exactly the pairs eval_nd(n, d, 1) gives.
+        """
+        B0, Bn, Bd, bscale = self._base_nd
+        base = B0 + Bn * n + Bd * d
+        base_wrap = Bn - (period - 1) * Bd
+        plan = self._plan
+        phases = [P0 + P1 * n + P2 * d for P0, P1, P2, *_ in plan]
+        wraps = [P1 - (period - 1) * P2 for _, P1, P2, *_ in plan]
+        steps = [P2 for _, _, P2, *_ in plan]
+        k_range = range(len(plan))
+
+        for _ in range(count):
+            num, den = base, bscale
+            for k in k_range:
+                _, _, _, pscale, kernel, an, ad = plan[k]
+                vn, vd = kernel(phases[k], pscale)
+                ad *= vd
+                num = num * ad + an * vn * den
+                den *= ad
+            yield num, den
+
+            if d == period - 1:
+                d = 0
+                base += base_wrap
+                for k in k_range:
+                    phases[k] += wraps[k]
+            else:
+                d += 1
+                base += Bd
+                for k in k_range:
+                    phases[k] += steps[k]
 
 
 # ============================================================
 # New-mode inverse: x(t) = base(t) + Σ amp*table(phase(t))
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class PhaseT:
     """θ(t) = c0 + c1*t  (turns), reduced mod 1. Strictly linear for L1-L3."""
     c0: Fraction
@@ -71,20 +184,20 @@ class PhaseT:
     def eval(self, t: Fraction) -> Fraction:
         return frac_turn(self.c0 + self.c1 * t)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class FundArg:
     """Base fundamental argument: c0 + c1*t"""
     c0: Fraction
     c1: Fraction
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class TermDef:
     """Pure data representation of a continuous series term (for specs.py)."""
     amp: Fraction
     phase: PhaseT
     amp1: Fraction = Fraction(0, 1)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class TabTermT:
     """
     amp * table( phase(t) )
@@ -97,6 +210,240 @@ class TabTermT:
     amp1: Fraction = Fraction(0, 1)
 
 
+@lru_cache(maxsize=None)
+def bind_table_terms(
+    terms: Tuple[TermDef, ...],
+    quarter: Tuple[int, ...],
+    negate: bool = False,
+) -> Tuple[TabTermT, ...]:
+    """
+    Binds spec TermDefs to the shared QuarterWaveTable for `quarter`
+    (amp negated for the solar part of an elongation series). Memoized, so
+    engines built from the same spec terms reuse one bound tuple.
+    """
+    eval_turn = get_quarter_wave_table(quarter).eval_normalized_turn
+    return tuple(
+        TabTermT(amp=-t.amp if negate else t.amp, phase=t.phase, table_eval_turn=eval_turn)
+        for t in terms
+    )
+
+
+def _compile_correction(
+    terms: Tuple[TabTermT, ...],
+    *,
+    with_amp1: bool,
+    C: Fraction = Fraction(0, 1),
+) -> Callable[[Fraction], Fraction]:
+    """
+    Partially evaluates the correction sum for a fixed term tuple:
+      C*t^2 + Σ (amp_i [+ amp1_i*t]) * table_i(frac(c0_i + c1_i*t))
+    as one straight-line function (no per-term loop or attribute loads).
+    Terms sharing both phase and table reuse a single table lookup.
+    The arithmetic is exact, so the result equals the looped sum.
+    Constants are pre-converted by to_rat (mpq under CALTIB_GMPY2).
+    """
+    if not USE_GMPY2:
+        return _compile_correction_int(terms, with_amp1=with_amp1, C=C)
+
+    args = ["_ft"]
+    vals: List[Any] = [frac_turn]
+    body = []
+    slots: Dict[Tuple[PhaseT, Callable[[Fraction], Fraction]], str] = {}
+    parts = []
+
+    if C != 0:
+        args.append("C")
+        vals.append(to_rat(C))
+        parts.append("C * t * t")
+
+    for i, term in enumerate(terms):
+        key = (term.phase, term.table_eval_turn)
+        v = slots.get(key)
+        if v is None:
+            v = slots[key] = f"v{i}"
+            args += [f"c0_{i}", f"c1_{i}", f"tab{i}"]
+            vals += [to_rat(term.phase.c0), to_rat(term.phase.c1), term.table_eval_turn]
+            body.append(f"        {v} = tab{i}(_ft(c0_{i} + c1_{i} * t))")
+
+        args.append(f"a{i}")
+        vals.append(to_rat(term.amp))
+        if with_amp1 and term.amp1 != 0:
+            args.append(f"b{i}")
+            vals.append(to_rat(term.amp1))
+            parts.append(f"(a{i} + b{i} * t) * {v}")
+        else:
+            parts.append(f"a{i} * {v}")
+
+    args.append("_zero")
+    vals.append(Fraction(0, 1))
+    src = (
+        f"def _build({', '.join(args)}):\n"
+        f"    def _corr(t):\n"
+        + "".join(line + "\n" for line in body)
+        + f"        return {' + '.join(parts) or '_zero'}\n"
+        f"    return _corr\n"
+    )
+    ns: Dict[str, Any] = {}
+    exec(src, ns)
+    return ns["_build"](*vals)
+
+
+def _table_kernel(fn: Callable[[Fraction], Fraction]) -> Any:
+    """(integer kernel, output scale) behind a QuarterWaveTable lookup, else None."""
+    tab = getattr(fn, "__self__", None)
+    if not isinstance(tab, QuarterWaveTable):
+        return None
+    func = getattr(fn, "__func__", None)
+    if func is QuarterWaveTable.eval_turn:
+        return tab._eval_turn_nd, 1
+    if func is QuarterWaveTable.eval_normalized_turn:
+        return tab._eval_turn_nd, tab.amplitude
+    return None
+
+
+def _compile_correction_int(
+    terms: Tuple[TabTermT, ...],
+    *,
+    with_amp1: bool,
+    C: Fraction,
+) -> Callable[[Fraction], Fraction]:
+    """
+    Integer form of _compile_correction. Every quantity is carried as a raw
+    (numerator, denominator) pair over the numerator/denominator of t:
+    phases c0 + c1*t become (P*td + Q*tn) / (R*td) with P, Q, R folded at
+    compile time and go straight into the table's integer kernel, and the
+    sum is accumulated without reduction. The single gcd is paid when the
+    result Fraction is built, instead of one per intermediate operation.
+    """
+    args = ["_F", "_ft"]
+    vals: List[Any] = [Fraction, frac_turn]
+    body = ["        tn = t.numerator", "        td = t.denominator"]
+    slots: Dict[Tuple[PhaseT, Callable[[Fraction], Fraction]], Tuple[str, int]] = {}
+
+    if C != 0:
+        args += ["Cn", "Cd"]
+        vals += [C.numerator, C.denominator]
+        body += ["        num = Cn * tn * tn", "        den = Cd * td * td"]
+    else:
+        body += ["        num = 0", "        den = 1"]
+
+    lookups = []
+    accum = []
+    for i, term in enumerate(terms):
+        key = (term.phase, term.table_eval_turn)
+        slot = slots.get(key)
+        if slot is None:
+            kernel = _table_kernel(term.table_eval_turn)
+            c0, c1 = Fraction(term.phase.c0), Fraction(term.phase.c1)
+            if kernel is not None:
+                fn, scale = kernel
+                args += [f"P{i}", f"Q{i}", f"R{i}", f"k{i}"]
+                vals += [
+                    c0.numerator * c1.denominator,
+                    c1.numerator * c0.denominator,
+                    c0.denominator * c1.denominator,
+                    fn,
+                ]
+                lookups.append(f"        vn{i}, vd{i} = k{i}(P{i} * td + Q{i} * tn, R{i} * td)")
+            else:
+                scale = 1
+                args += [f"c0_{i}", f"c1_{i}", f"tab{i}"]
+                vals += [c0, c1, term.table_eval_turn]
+                lookups.append(f"        v{i} = tab{i}(_ft(c0_{i} + c1_{i} * t))")
+                lookups.append(f"        vn{i}, vd{i} = v{i}.numerator, v{i}.denominator")
+            slot = slots[key] = (str(i), scale)
+
+        j, scale = slot
+        amp = Fraction(term.amp)
+        if with_amp1 and term.amp1 != 0:
+            # (a + b*t) * v  =  (an*bd*td + bn*ad*tn) * vn / (ad*bd*scale*td*vd)
+            amp1 = Fraction(term.amp1)
+            args += [f"E{i}", f"G{i}", f"H{i}"]
+            vals += [
+                amp.numerator * amp1.denominator,
+                amp1.numerator * amp.denominator,
+                amp.denominator * amp1.denominator * scale,
+            ]
+            accum += [
+                f"        dd = H{i} * td * vd{j}",
+                f"        num = num * dd + (E{i} * td + G{i} * tn) * vn{j} * den",
+                "        den = den * dd",
+            ]
+        else:
+            args += [f"an{i}", f"ad{i}"]
+            vals += [amp.numerator, amp.denominator * scale]
+            accum += [
+                f"        dd = ad{i} * vd{j}",
+                f"        num = num * dd + an{i} * vn{j} * den",
+                "        den = den * dd",
+            ]
+
+    src = (
+        f"def _build({', '.join(args)}):\n"
+        f"    def _corr(t):\n"
+        + "".join(line + "\n" for line in body + lookups + accum)
+        + "        return _F(num, den)\n"
+        f"    return _corr\n"
+    )
+    ns: Dict[str, Any] = {}
+    exec(src, ns)
+    return ns["_build"](*vals)
+
+
+def _float_terms(terms: Tuple[TabTermT, ...]) -> Tuple[Tuple[float, float, float, float, Callable[[float], float]], ...]:
+    """(c0, c1, amp, amp1, f64 table) per term for picard_solve_f64."""
+    out = []
+    for term in terms:
+        tab = getattr(term.table_eval_turn, "__self__", None)
+        func = getattr(term.table_eval_turn, "__func__", None)
+        if isinstance(tab, QuarterWaveTable) and func is QuarterWaveTable.eval_normalized_turn:
+            f = tab.eval_normalized_turn_f64
+        else:
+            f = lambda x, g=term.table_eval_turn: float(g(Fraction(x)))
+        out.append((float(term.phase.c0), float(term.phase.c1), float(term.amp), float(term.amp1), f))
+    return tuple(out)
+
+
+def _float_term_runs(terms: Tuple[TabTermT, ...]) -> Tuple[Tuple[Any, Tuple[float, ...], Tuple[float, ...], Tuple[float, ...], Tuple[float, ...], Tuple[Callable[[float], float], ...]], ...]:
+    """
+    Structure-of-arrays view for eval_f64_array: consecutive terms on the same
+    QuarterWaveTable form one run (table, c0s, c1s, amps, amp1s, f64 fns), so
+    a run is a single batched table call. Other tables get table=None.
+    """
+    runs = []
+    for term, (c0, c1, amp, amp1, f) in zip(terms, _float_terms(terms)):
+        tab = getattr(term.table_eval_turn, "__self__", None)
+        if not (isinstance(tab, QuarterWaveTable) and f == tab.eval_normalized_turn_f64):
+            tab = None
+        if runs and tab is not None and runs[-1][0] is tab:
+            for col, v in zip(runs[-1][1:], (c0, c1, amp, amp1, f)):
+                col.append(v)
+        else:
+            runs.append((tab, [c0], [c1], [amp], [amp1], [f]))
+    return tuple((tab, *(tuple(col) for col in cols)) for tab, *cols in runs)
+
+
+# Marks per-series JIT arrays that are not built yet
+_PENDING = object()
+
+
+def _jit_term_runs(runs) -> Optional[Tuple[Tuple[Any, ...], ...]]:
+    """
+    Runs of _float_term_runs with contiguous float64 arrays for the jitted
+    _quarter_series_f64 kernel: (quarter, c0s, c1s, amps, amp1s, fns), with
+    quarter=None for terms that stay on the Python loop. None without numba.
+    """
+    if not jit_enabled():
+        return None
+    import numpy as np
+
+    out = []
+    for tab, c0s, c1s, amps, amp1s, fs in runs:
+        quarter = None if tab is None else np.asarray(tab._quarter_f64, dtype=np.float64)
+        out.append((quarter, *(np.asarray(col, dtype=np.float64) for col in (c0s, c1s, amps, amp1s)), fs))
+    return tuple(out)
+
+
 @dataclass(frozen=True)
 class AffineTabSeriesT:
     """
@@ -107,14 +454,46 @@ class AffineTabSeriesT:
     terms: Tuple[TabTermT, ...]
     C: Fraction = Fraction(0,1)
 
+    def __post_init__(self) -> None:
+        # The term tuple is fixed per instance: compile the correction sums once.
+        object.__setattr__(self, "_eval_corr", _compile_correction(self.terms, with_amp1=False))
+        object.__setattr__(self, "_picard_corr", _compile_correction(self.terms, with_amp1=True, C=self.C))
+        object.__setattr__(self, "_f64_terms", _float_terms(self.terms))
+        object.__setattr__(self, "_f64_ABC", (float(self.A), float(self.B), float(self.C)))
+        object.__setattr__(self, "_f64_runs", _float_term_runs(self.terms))
+        # Built on the first float64 evaluation, so numba loads only when used
+        object.__setattr__(self, "_f64_jit_runs", _PENDING)
+
+    def _corr_f64(self, acc: float, t: float, with_amp1: bool) -> float:
+        """acc + float64 correction at t: one jitted call per table run when numba is present."""
+        runs = self._f64_jit_runs
+        if runs is _PENDING:
+            runs = _jit_term_runs(self._f64_runs)
+            object.__setattr__(self, "_f64_jit_runs", runs)
+        if runs is None:
+            for c0, c1, amp, amp1, f in self._f64_terms:
+                acc += ((amp + amp1 * t) if with_amp1 else amp) * f(c0 + c1 * t)
+            return acc
+        series = _tables._quarter_series_f64
+        for quarter, c0s, c1s, amps, amp1s, fs in runs:
+            if quarter is not None:
+                acc = series(quarter, acc, c0s, c1s, amps, amp1s, t, with_amp1)
+            else:
+                for k, f in enumerate(fs):
+                    amp = float(amps[k] + amp1s[k] * t) if with_amp1 else float(amps[k])
+                    acc += amp * f(float(c0s[k] + c1s[k] * t))
+        return acc
+
     def base(self, t: Fraction) -> Fraction:
         return self.A + t * (self.B + t * self.C)
 
     def eval(self, t: Fraction) -> Fraction:
-        s = self.base(t)
-        for term in self.terms:
-            s += term.amp * term.table_eval_turn(term.phase.eval(t))
-        return s
+        return to_fraction(self.base(t) + self._eval_corr(t))
+
+    def eval_with_base(self, t: Fraction) -> Tuple[Fraction, Fraction]:
+        """(base(t), eval(t)) sharing one base evaluation, e.g. mean and true sun."""
+        b = self.base(t)
+        return b, to_fraction(b + self._eval_corr(t))
 
     def picard_solve(
         self,
@@ -123,11 +502,16 @@ class AffineTabSeriesT:
         iterations: int,
         t_init: Fraction = None,
         invB_prec: Fraction = None,
+        tol_bits: Optional[int] = None,
     ) -> Fraction:
         """
         Fixed iteration solver for x(t)=x0 in the contractive regime:
           t_{k+1} = t0 - C(t_k)/B,   t0=(x0-A)/B
         This is the D.4.1 style iteration with fixed count for reproducibility.
+        By default it only exits early on an exact repeat, which returns the
+        same Fraction as running all `iterations` rounds. Passing tol_bits
+        (e.g. PICARD_TOL_BITS) opts into exiting once two successive iterates
+        agree to 2^-tol_bits days; the result then depends on the tolerance.
         """
         if iterations < 0:
             raise ValueError("iterations must be non-negative")
@@ -141,26 +525,119 @@ class AffineTabSeriesT:
         if iterations == 0:
             return t0
             
-        t = t0 if t_init is None else t_init
+        t0 = to_rat(t0)
+        t = t0 if t_init is None else to_rat(t_init)
 
         # Step 2: The Preconditioner
         # Use the harmonic preconditioner if provided, else fallback to exact 1/B
-        multiplier = invB_prec if invB_prec is not None else Fraction(1, 1) / self.B
+        multiplier = to_rat(invB_prec if invB_prec is not None else Fraction(1, 1) / self.B)
         
         # Step 3: The Contractive Loop
+        picard_corr = self._picard_corr
         for _ in range(iterations):
             # Calculate the correction sum C(t)
-            corr = self.C * t * t
-            for term in self.terms:
-                current_amp = term.amp + term.amp1 * t
-                corr += current_amp * term.table_eval_turn(term.phase.eval(t))
-                
+            corr = picard_corr(t)
+
             # Apply iteration step
             # By using the harmonic multiplier, the wild prime safely stays at Power 1
-            t = t0 - corr * multiplier
-            
+            t_next = t0 - corr * multiplier
+
+            # Early exit: the fixed point has been reached to working precision
+            if _iterates_agree(t_next, t, tol_bits):
+                return to_fraction(t_next)
+            t = t_next
+
+        return to_fraction(t)
+
+    def picard_solve_f64(self, x0: float, *, iterations: int) -> float:
+        """
+        float64 Picard iteration for x(t)=x0, using the tables' float kernels
+        where available. Only an approximation: it seeds converged solves
+        (picard_sweep) and never replaces the exact fixed-count picard_solve.
+        """
+        A, B, C = self._f64_ABC
+        t0 = (x0 - A) / B
+        t = t0
+        for _ in range(iterations):
+            t = t0 - self._corr_f64(C * t * t, t, True) / B
         return t
 
+    def eval_f64(self, t: float) -> float:
+        """
+        float64 counterpart of eval (same terms, amp1 excluded) for callers
+        that only need a guarded floor of x(t) and fall back to eval when the
+        float value is too close to an integer boundary.
+        """
+        A, B, C = self._f64_ABC
+        return self._corr_f64(A + t * (B + t * C), t, False)
+
+    def eval_f64_array(self, ts):
+        """
+        float64 x(t) over a NumPy array of times, one batched table call per
+        run of terms sharing a table (see _float_term_runs).
+        For tabulation and plots only; calendar output goes through eval.
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise RuntimeError("This function needs numpy. Install: pip install numpy") from e
+
+        t = np.asarray(ts, dtype=np.float64)
+        A, B, C = self._f64_ABC
+        x = A + t * (B + t * C)
+        tf = t.reshape(-1)
+        for tab, c0s, c1s, amps, _amp1s, fs in self._f64_runs:
+            phases = np.asarray(c0s)[:, None] + np.asarray(c1s)[:, None] * tf
+            if tab is not None:
+                ys = tab.eval_normalized_turn_f64_array(phases.reshape(-1)).reshape(phases.shape)
+            else:
+                ys = np.array([[f(v) for v in row] for f, row in zip(fs, phases)], dtype=np.float64)
+            for amp, y in zip(amps, ys):
+                x = x + amp * y.reshape(t.shape)
+        return x
+
+    def picard_sweep(
+        self,
+        x0s: Sequence[Fraction],
+        *,
+        max_iterations: int,
+        invB_prec: Fraction = None,
+    ) -> List[Fraction]:
+        """
+        Solves x(t)=x0 for a run of nearby targets (e.g. consecutive tithis),
+        warm-starting each solve from the previous root advanced by the mean
+        step (x0_i - x0_{i-1})/B; the first is seeded by picard_solve_f64.
+        Each solve runs until the iterates agree (capped at max_iterations),
+        so the results are converged roots, not the fixed-count iterates of
+        picard_solve; they only coincide with the latter once picard_solve
+        itself converges.
+        """
+        out: List[Fraction] = []
+        t_prev = x_prev = None
+        for x0 in x0s:
+            if t_prev is None:
+                seed = Fraction(self.picard_solve_f64(float(x0), iterations=max_iterations))
+            else:
+                seed = t_prev + (x0 - x_prev) / self.B
+            t_prev = self.picard_solve(
+                x0, iterations=max_iterations, t_init=seed, invB_prec=invB_prec, tol_bits=PICARD_TOL_BITS
+            )
+            x_prev = x0
+            out.append(t_prev)
+        return out
+
+def _epoch_phase(x0: Fraction, rate: Fraction, dt: Fraction) -> Fraction:
+    """
+    x0 - rate*dt on raw numerators/denominators: the cross products stay
+    plain ints and the result is reduced by a single gcd in Fraction().
+    """
+    x0, rate = Fraction(x0), Fraction(rate)
+    rd_dd = rate.denominator * dt.denominator
+    return Fraction(
+        x0.numerator * rd_dd - rate.numerator * dt.numerator * x0.denominator,
+        x0.denominator * rd_dd,
+    )
+
 def make_funds(
     m0: Fraction, 
     fund_rates: Dict[str, Fraction],  # <--- Injected dependency
@@ -176,28 +653,45 @@ def make_funds(
     """
     
     # Shift absolute JD to internal coordinate system (Days since jd_base)
-    m0_offset = m0 - jd_base
+    m0_offset = Fraction(m0) - Fraction(jd_base)
+    r_S, r_D, r_M = fund_rates["S"], fund_rates["D"], fund_rates["M"]
+    r_Mp, r_F = fund_rates["Mp"], fund_rates["F"]
     
     # Elongation is exactly 0 at the epoch: D(m0_offset) = c0 + c1*m0_offset = 0
-    c0_D = -fund_rates["D"] * m0_offset
+    c0_D = _epoch_phase(Fraction(0), r_D, m0_offset)
     
     # Sun longitude is s0 at the epoch: S(m0_offset) = c0 + c1*m0_offset = s0
-    c0_S = s0 - fund_rates["S"] * m0_offset
+    c0_S = _epoch_phase(s0, r_S, m0_offset)
     
-    c0_M = r0 - fund_rates["M"] * m0_offset
-    c0_Mp = a0 - fund_rates["Mp"] * m0_offset
-    c0_F = f0 - fund_rates["F"] * m0_offset
+    c0_M = _epoch_phase(r0, r_M, m0_offset)
+    c0_Mp = _epoch_phase(a0, r_Mp, m0_offset)
+    c0_F = _epoch_phase(f0, r_F, m0_offset)
     
     return {
         "m0": m0,
         "s0": s0,
-        "S":  FundArg(c0=c0_S, c1=fund_rates["S"]),
-        "D":  FundArg(c0=c0_D, c1=fund_rates["D"]),
-        "M":  FundArg(c0=c0_M, c1=fund_rates["M"]),
-        "Mp": FundArg(c0=c0_Mp, c1=fund_rates["Mp"]),
-        "F":  FundArg(c0=c0_F, c1=fund_rates["F"]),
+        "S":  FundArg(c0=c0_S, c1=r_S),
+        "D":  FundArg(c0=c0_D, c1=r_D),
+        "M":  FundArg(c0=c0_M, c1=r_M),
+        "Mp": FundArg(c0=c0_Mp, c1=r_Mp),
+        "F":  FundArg(c0=c0_F, c1=r_F),
     }
 
+@lru_cache(maxsize=None)
+def _collapse_phase(fund_args: Tuple[FundArg, ...], mults: Tuple[int, ...]) -> PhaseT:
+    """
+    Integer combination sum(m * arg) of fundamental arguments. Memoized, so the
+    rows that nested tables (e.g. L_LUNAR_TABLE_1 inside _3 and _6) and the
+    solar/lunar day and month specs share are collapsed only once.
+    """
+    c0 = Fraction(0, 1)
+    c1 = Fraction(0, 1)
+    for arg, m in zip(fund_args, mults):
+        if m != 0:
+            c0 += arg.c0 * m
+            c1 += arg.c1 * m
+    return PhaseT(c0=c0, c1=c1)
+
 def compile_affine_terms(
     funds: Dict[str, FundArg],
     keys: Tuple[str, ...],
@@ -208,12 +702,20 @@ def compile_affine_terms(
     Matrix-multiplies fundamental arguments against rational tables at startup.
     Analogous to build_collapsed_terms, but returns pure TermDefs since the 
     affine loop natively handles amp1 without a static/dynamic list split.
+    Specs compiling the same table against the same arguments get the same
+    TermDef tuple back.
     """
+    return _compile_affine_rows(tuple(funds[key] for key in keys), tuple(rows), include_drift)
+
+
+@lru_cache(maxsize=None)
+def _compile_affine_rows(
+    fund_args: Tuple[FundArg, ...],
+    rows: Tuple[Tuple[Any, ...], ...],
+    include_drift: bool,
+) -> Tuple[TermDef, ...]:
     compiled = []
-    num_keys = len(keys)
-    
-    # 36525 days in a Julian Century
-    century_days = Fraction(36525, 1)
+    num_keys = len(fund_args)
     
     for row in rows:
         mults = row[:num_keys]
@@ -225,18 +727,13 @@ def compile_affine_terms(
         else:
             raw_amp_drift = Fraction(0, 1)
             
-        # 2. Collapse fundamental arguments
-        c0 = Fraction(0, 1)
-        c1 = Fraction(0, 1)
-        for key, m in zip(keys, mults):
-            if m != 0:
-                c0 += funds[key].c0 * Fraction(m, 1)
-                c1 += funds[key].c1 * Fraction(m, 1)
+        # 2. Collapse fundamental arguments (shared across specs and tables)
+        phase = _collapse_phase(fund_args, tuple(mults))
             
         # 3. Return the pure data blueprint!
         compiled.append(TermDef(
             amp=raw_amp,
-            phase=PhaseT(c0=c0, c1=c1),
+            phase=phase,
             amp1=raw_amp_drift
         ))
         
@@ -9,10 +9,16 @@ routing to evaluate secular anomaly drifts with zero loop overhead.
 
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Tuple, Dict, Optional
 
+from caltib.core.jit import jit_enabled, maybe_njit
 from caltib.engines.astro.fp_math import QuarterWavePolynomial, FLOAT_TWO_PI
 
+# Marks per-series JIT arrays that are not built yet
+_PENDING = object()
+
+
 @dataclass(frozen=True)
 class FloatTermDef:
     """Pure data representation of a pre-collapsed harmonic term."""
@@ -21,6 +27,47 @@ class FloatTermDef:
     c1: float
     amp1: float = 0.0  # Secular amplitude drift (e.g., per century)
 
+@maybe_njit
+def _poly_turn_f64(lead, horner, x_turn):
+    """QuarterWavePolynomial.eval_normalized_turn with the same operation order."""
+    u = (x_turn + 0.5) % 1.0 - 0.5
+    if u > 0.25:
+        u = 0.5 - u
+    elif u < -0.25:
+        u = -0.5 - u
+
+    x2 = u * u
+    res = lead
+    for k in range(len(horner)):
+        term = x2 * res
+        res = horner[k] + term
+    return u * res
+
+
+@maybe_njit
+def _series_corr_f64(acc, lead, horner, amps, amp1s, c0s, c1s, n_static, t):
+    """
+    acc + the Fourier correction at t over struct-of-arrays term columns
+    (static terms first), accumulated term by term like the Python loops.
+    """
+    for k in range(n_static):
+        acc += amps[k] * _poly_turn_f64(lead, horner, c0s[k] + c1s[k] * t)
+    for k in range(n_static, len(amps)):
+        current_amp = amps[k] + amp1s[k] * t
+        acc += current_amp * _poly_turn_f64(lead, horner, c0s[k] + c1s[k] * t)
+    return acc
+
+
+@maybe_njit
+def _picard_f64(x0, A, C, invB, t, iterations, lead, horner, amps, amp1s, c0s, c1s, n_static):
+    """FloatFourierSeries.picard_solve loop in one jitted call."""
+    for _ in range(iterations):
+        corr = _series_corr_f64(0.0, lead, horner, amps, amp1s, c0s, c1s, n_static, t)
+        t2_term = C * (t * t)
+        t = ((x0 - A) - t2_term - corr) * invB
+    return t
+
+
 @dataclass(frozen=True)
 class FloatFourierSeries:
     """
@@ -35,6 +82,31 @@ class FloatFourierSeries:
     poly: QuarterWavePolynomial
     C: float = 0.0
 
+    def __post_init__(self) -> None:
+        # Flat coefficient tuples: the hot loops unpack plain floats per term
+        # instead of reading three or four dataclass attributes.
+        object.__setattr__(self, "_static", tuple((t.amp, t.c0, t.c1) for t in self.static_terms))
+        object.__setattr__(self, "_dynamic", tuple((t.amp, t.amp1, t.c0, t.c1) for t in self.dynamic_terms))
+        # Built on the first evaluation, so numba loads only when used
+        object.__setattr__(self, "_jit_args", _PENDING)
+
+    def _jit_term_args(self):
+        """
+        (lead, horner, amps, amp1s, c0s, c1s, n_static) for the jitted kernels:
+        struct-of-arrays float64 columns, static terms first. None without
+        numba (or for a non-QuarterWavePolynomial poly); the loops then stay in Python.
+        Built and stored on the first evaluation.
+        """
+        jit_args = None
+        if type(self.poly) is QuarterWavePolynomial and jit_enabled():
+            import numpy as np
+
+            amps, amp1s, c0s, c1s = self._term_arrays()
+            horner = np.asarray(self.poly._horner, dtype=np.float64)
+            jit_args = (float(self.poly._lead), horner, amps, amp1s, c0s, c1s, len(self.static_terms))
+        object.__setattr__(self, "_jit_args", jit_args)
+        return jit_args
+
     def base(self, t: float) -> float:
         """Evaluates the base quadratic drift."""
         return self.A + t * (self.B + t * self.C)
@@ -42,16 +114,61 @@ class FloatFourierSeries:
     def eval(self, t: float) -> float:
         """Evaluates the complete series at continuous time t."""
         s = self.base(t)
+        jit_args = self._jit_args
+        if jit_args is _PENDING:
+            jit_args = self._jit_term_args()
+        if jit_args is not None:
+            return _series_corr_f64(s, *jit_args, t)
+        f = self.poly.eval_normalized_turn
         
-        for term in self.static_terms:
-            s += term.amp * self.poly.eval_normalized_turn(term.c0 + term.c1 * t)
+        for amp, c0, c1 in self._static:
+            s += amp * f(c0 + c1 * t)
             
-        for term in self.dynamic_terms:
-            current_amp = term.amp + term.amp1 * t
-            s += current_amp * self.poly.eval_normalized_turn(term.c0 + term.c1 * t)
+        for amp, amp1, c0, c1 in self._dynamic:
+            current_amp = amp + amp1 * t
+            s += current_amp * f(c0 + c1 * t)
             
         return s
 
+    def _term_arrays(self):
+        """(amps, amp1s, c0s, c1s) column arrays, static then dynamic; built once."""
+        arrays = self.__dict__.get("_arrays")
+        if arrays is None:
+            import numpy as np
+
+            terms = self.static_terms + self.dynamic_terms
+            arrays = tuple(
+                np.array([getattr(t, name) for t in terms], dtype=np.float64)
+                for name in ("amp", "amp1", "c0", "c1")
+            )
+            object.__setattr__(self, "_arrays", arrays)
+        return arrays
+
+    def eval_array(self, ts):
+        """
+        Batch eval over a NumPy array of times: every term's phases in one
+        broadcast and one polynomial call, then accumulated term by term in
+        eval's order, so each element is bitwise identical to eval(t).
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise RuntimeError("This function needs numpy. Install: pip install numpy") from e
+
+        t = np.asarray(ts, dtype=np.float64)
+        s = self.A + t * (self.B + t * self.C)
+        if not (self.static_terms or self.dynamic_terms):
+            return s
+
+        amps, amp1s, c0s, c1s = self._term_arrays()
+        tf = t.reshape(-1)
+        ys = self.poly.eval_normalized_turn_array(c0s[:, None] + c1s[:, None] * tf)
+        n_static = len(self.static_terms)
+        for k, y in enumerate(ys):
+            amp = amps[k] if k < n_static else amps[k] + amp1s[k] * tf
+            s = s + (amp * y).reshape(t.shape)
+        return s
+
     def picard_solve(self, x0: float, iterations: int, t_init: float = None) -> float:
         """Solves x(t) = x0 via fixed-point iteration."""
         if iterations == 0:
@@ -60,18 +177,28 @@ class FloatFourierSeries:
         t0 = (x0 - self.A) / self.B
         t = t0 if t_init is None else t_init
         invB = 1.0 / self.B
+        jit_args = self._jit_args
+        if jit_args is _PENDING:
+            jit_args = self._jit_term_args()
+        if jit_args is not None:
+            lead, horner, amps, amp1s, c0s, c1s, n_static = jit_args
+            return _picard_f64(
+                x0, self.A, self.C, invB, t, iterations, lead, horner, amps, amp1s, c0s, c1s, n_static
+            )
+        f = self.poly.eval_normalized_turn
+        static, dynamic = self._static, self._dynamic
         
         for _ in range(iterations):
             corr = 0.0
             
             # 1. Ultra-fast loop for static terms
-            for term in self.static_terms:
-                corr += term.amp * self.poly.eval_normalized_turn(term.c0 + term.c1 * t)
+            for amp, c0, c1 in static:
+                corr += amp * f(c0 + c1 * t)
                 
             # 2. Dynamic loop for secular drift terms
-            for term in self.dynamic_terms:
-                current_amp = term.amp + term.amp1 * t
-                corr += current_amp * self.poly.eval_normalized_turn(term.c0 + term.c1 * t)
+            for amp, amp1, c0, c1 in dynamic:
+                current_amp = amp + amp1 * t
+                corr += current_amp * f(c0 + c1 * t)
                 
             t2_term = self.C * (t * t)
             t = ((x0 - self.A) - t2_term - corr) * invB
@@ -87,6 +214,8 @@ class FloatFourierSeries:
             return (x0 - self.A) / self.B
             
         t = ((x0 - self.A) / self.B) if t_init is None else t_init
+        f, g = self.poly.eval_normalized_turn, self.poly.cos_normalized_turn
+        static, dynamic = self._static, self._dynamic
         
         for _ in range(iterations):
             # Evaluate x(t) and its derivative x'(t)
@@ -94,25 +223,25 @@ class FloatFourierSeries:
             dx_dt = self.B + 2.0 * self.C * t
             
             # 1. Static terms (Standard derivative)
-            for term in self.static_terms:
-                phase = term.c0 + term.c1 * t
+            for amp, c0, c1 in static:
+                phase = c0 + c1 * t
                 
-                x_val += term.amp * self.poly.eval_normalized_turn(phase)
-                dx_dt += term.amp * term.c1 * FLOAT_TWO_PI * self.poly.cos_normalized_turn(phase)
+                x_val += amp * f(phase)
+                dx_dt += amp * c1 * FLOAT_TWO_PI * g(phase)
                 
             # 2. Dynamic terms (Product rule derivative)
-            for term in self.dynamic_terms:
-                phase = term.c0 + term.c1 * t
-                current_amp = term.amp + term.amp1 * t
+            for amp, amp1, c0, c1 in dynamic:
+                phase = c0 + c1 * t
+                current_amp = amp + amp1 * t
                 
-                sin_val = self.poly.eval_normalized_turn(phase)
+                sin_val = f(phase)
                 
                 # Position: A(t) * sin(phase)
                 x_val += current_amp * sin_val
                 
                 # Derivative: A'(t)*sin(phase) + A(t)*phase'*cos(phase)
-                dx_dt += term.amp1 * sin_val 
-                dx_dt += current_amp * term.c1 * FLOAT_TWO_PI * self.poly.cos_normalized_turn(phase)
+                dx_dt += amp1 * sin_val 
+                dx_dt += current_amp * c1 * FLOAT_TWO_PI * g(phase)
                 
             # Newton-Raphson Step: t_{k+1} = t_k - f(t_k) / f'(t_k)
             t = t - (x_val - x0) / dx_dt
@@ -143,14 +272,30 @@ def build_collapsed_terms(
     
     Returns:
         (static_terms, dynamic_terms)
+
+    Specs collapsing the same table against the same arguments get the same
+    tuples back.
     """
     #  Resolve the dynamic default: assuming amp1 is given by */cy, convert to */day
     if amp1_scale is None:
         amp1_scale = amp_scale / 36525.0
 
+    return _build_collapsed_rows(
+        tuple(funds[key] for key in keys), tuple(rows), amp_scale, amp1_scale, include_drift
+    )
+
+
+@lru_cache(maxsize=None)
+def _build_collapsed_rows(
+    fund_args: Tuple[FloatFundArg, ...],
+    rows: Tuple[Tuple[float, ...], ...],
+    amp_scale: float,
+    amp1_scale: float,
+    include_drift: bool,
+) -> Tuple[Tuple[FloatTermDef, ...], Tuple[FloatTermDef, ...]]:
     static_terms = []
     dynamic_terms = []
-    num_keys = len(keys)
+    num_keys = len(fund_args)
     
     for row in rows:
         mults = row[:num_keys]
@@ -164,10 +309,10 @@ def build_collapsed_terms(
             
         c0_sum = 0.0
         c1_sum = 0.0
-        for key, m in zip(keys, mults):
+        for arg, m in zip(fund_args, mults):
             if m != 0:
-                c0_sum += funds[key].c0 * m
-                c1_sum += funds[key].c1 * m
+                c0_sum += arg.c0 * m
+                c1_sum += arg.c1 * m
                 
         term = FloatTermDef(
             amp=raw_amp * amp_scale,
@@ -58,6 +58,22 @@ def reduce_to_quarter_turn(x: float) -> float:
     return u
 
 
+def reduce_to_quarter_turn_array(x):
+    """
+    Vectorized reduce_to_quarter_turn for NumPy arrays of turns.
+    The quadrant reflection is branchless: where |u| > 1/4 the result is
+    copysign(1/2, u) - u, i.e. exactly the scalar 0.5 - u / -0.5 - u, so the
+    output is bitwise identical to the scalar path element by element.
+    """
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise RuntimeError("This function needs numpy. Install: pip install numpy") from e
+
+    u = np.remainder(np.asarray(x, dtype=np.float64) + 0.5, 1.0) - 0.5
+    return np.where(np.abs(u) > 0.25, np.copysign(0.5, u) - u, u)
+
+
 def eval_odd_poly(x: float, coeffs: Tuple[float, ...]) -> float:
     """
     Evaluates an odd polynomial c1*x + c3*x^3 + c5*x^5 ... using Horner's method.
@@ -86,9 +102,30 @@ class QuarterWavePolynomial:
     """
     coeffs: Tuple[float, ...]
 
+    def __post_init__(self) -> None:
+        # Horner order laid out once: leading coefficient, then the rest descending
+        object.__setattr__(self, "_lead", self.coeffs[-1] if self.coeffs else 0.0)
+        object.__setattr__(self, "_horner", tuple(reversed(self.coeffs[:-1])))
+
     def eval_normalized_turn(self, x_turn: float) -> float:
         """Evaluate at phase x in turns. Returns value in [-1.0, 1.0]."""
-        x_quarter = reduce_to_quarter_turn(x_turn)
+        # Inlined reduce_to_quarter_turn + eval_odd_poly (same operation order, no FMA)
+        u = (x_turn + 0.5) % 1.0 - 0.5
+        if u > 0.25:
+            u = 0.5 - u
+        elif u < -0.25:
+            u = -0.5 - u
+
+        x2 = u * u
+        res = self._lead
+        for c in self._horner:
+            term = x2 * res
+            res = c + term
+        return u * res
+
+    def eval_normalized_turn_array(self, x_turns):
+        """Batch eval_normalized_turn over a NumPy array of phases (bitwise identical)."""
+        x_quarter = reduce_to_quarter_turn_array(x_turns)
         return eval_odd_poly(x_quarter, self.coeffs)
         
     def cos_normalized_turn(self, x_turn: float) -> float:
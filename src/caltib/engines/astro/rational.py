@@ -0,0 +1,78 @@
+"""
+caltib.engines.astro.rational
+-----------------------------
+Optional GMP-backed rationals for the Picard hot path.
+
+The engines are written against fractions.Fraction. When gmpy2 is installed
+and the environment variable CALTIB_GMPY2 is set (to anything but "0"), the
+affine series solver converts its constants and iterates to gmpy2.mpq, whose
+arithmetic and gcds run in C. Both are exact, so results are identical;
+values handed back to callers are always Fraction.
+"""
+from __future__ import annotations
+
+import os
+from fractions import Fraction
+from math import floor, gcd
+from typing import Any
+
+try:
+    import gmpy2  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    gmpy2 = None
+
+USE_GMPY2 = gmpy2 is not None and os.environ.get("CALTIB_GMPY2", "").strip() not in ("", "0")
+
+
+def to_rat(x: Any) -> Any:
+    """Converts an exact rational to the active hot-path type (mpq or Fraction)."""
+    if not USE_GMPY2 or not isinstance(x, Fraction):
+        return x
+    return gmpy2.mpq(x.numerator, x.denominator)
+
+
+def to_fraction(x: Any) -> Fraction:
+    """Converts a hot-path rational back to Fraction for the public API."""
+    if isinstance(x, Fraction):
+        return x
+    return Fraction(int(x.numerator), int(x.denominator))
+
+
+_ZERO = Fraction(0, 1)
+
+if hasattr(Fraction, "_from_coprime_ints"):  # Python >= 3.12
+    _from_coprime = Fraction._from_coprime_ints
+else:
+    def _from_coprime(n: int, d: int) -> Fraction:
+        return Fraction(n, d, _normalize=False)
+
+
+def frac_turn(x: Any) -> Any:
+    """
+    Wraps a fractional turn to [0, 1).
+    For a Fraction n/d (already coprime), n mod d stays coprime to d, so the
+    result is built directly without the gcd of a Fraction subtraction.
+    Other exact rationals (mpq under CALTIB_GMPY2) subtract their floor.
+    Floats (float64 diagnostics and seeding paths) wrap with one C-level
+    floor and stay floats.
+    """
+    if type(x) is Fraction:
+        d = x.denominator
+        r = x.numerator % d
+        return _from_coprime(r, d) if r else _ZERO
+    if type(x) is float:
+        return x - floor(x)
+    return x - x.numerator // x.denominator
+
+
+def frac_turn_nd(num: int, den: int) -> Fraction:
+    """
+    Wraps the turn num/den (den > 0, not necessarily reduced) to [0, 1).
+    Callers that accumulate an affine sum over a common integer denominator
+    pay a single gcd here instead of one per Fraction add and multiply.
+    """
+    r = num % den
+    if not r:
+        return _ZERO
+    g = gcd(r, den)
+    return _from_coprime(r // g, den // g)
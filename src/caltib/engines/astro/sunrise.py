@@ -10,13 +10,18 @@ time or dates. It relies on the calling engine to handle "backreaction".
 from __future__ import annotations
 from dataclasses import dataclass
 from fractions import Fraction
+from functools import lru_cache
 from typing import Union, Tuple
 from abc import ABC, abstractmethod
 
 from caltib.core.types import LocationSpec, SunriseState
-from .tables import QuarterWaveTable, ArctanTable
+from .tables import QuarterWaveTable, ArctanTable, get_quarter_wave_table
 from .fp_math import QuarterWavePolynomial, ArctanPolynomial, float_sqrt
 
+# Shared per-call offsets (cosine = sine a quarter turn on; noon = half a day)
+_QUARTER_TURN = Fraction(1, 4)
+_HALF_TURN = Fraction(1, 2)
+
 
 # ============================================================
 # Sunrise Definitions
@@ -61,7 +66,16 @@ class SunriseModel(ABC):
         utc_frac = lmt_frac - loc.lon_turn
         
         q = utc_frac.numerator // utc_frac.denominator
-        return utc_frac - Fraction(q, 1), state
+        return utc_frac - q, state
+
+@lru_cache(maxsize=256)
+def _site_terms(quarter: Tuple[int, ...], lat_turn: Fraction) -> Tuple[Fraction, Fraction]:
+    """(sin phi, cos phi) of a latitude on a sine table; bounded, shared by all models."""
+    table = get_quarter_wave_table(quarter)
+    return (
+        table.eval_normalized_turn(lat_turn),
+        table.eval_normalized_turn(lat_turn + _QUARTER_TURN),
+    )
 
 # ============================================================
 # Implementations
@@ -83,6 +97,11 @@ class SphericalSunrise(SunriseModel):
     eps_turn: Fraction
     table: QuarterWaveTable
     day_fraction: Fraction = Fraction(1, 4)
+
+    def __post_init__(self) -> None:
+        # Obliquity and horizon terms are model constants
+        object.__setattr__(self, "_sin_eps", self.table.eval_normalized_turn(self.eps_turn))
+        object.__setattr__(self, "_sin_h0", self.table.eval_normalized_turn(self.h0_turn))
     
     def init_lmt_fraction(self) -> Fraction:
         return self.day_fraction
@@ -91,17 +110,16 @@ class SphericalSunrise(SunriseModel):
         if loc.lat_turn is None:
             raise ValueError("Spherical sunrise requires a defined lat_turn.")
             
-        sin_eps = self.table.eval_normalized_turn(self.eps_turn)
+        sin_eps = self._sin_eps
         sin_lambda = self.table.eval_normalized_turn(true_sun_turn)
         sin_delta = sin_eps * sin_lambda
         
         delta_turn = self.table.asin_normalized_turn(sin_delta)
-        cos_delta = self.table.eval_normalized_turn(delta_turn + Fraction(1, 4))
+        cos_delta = self.table.eval_normalized_turn(delta_turn + _QUARTER_TURN)
         
-        sin_phi = self.table.eval_normalized_turn(loc.lat_turn)
-        cos_phi = self.table.eval_normalized_turn(loc.lat_turn + Fraction(1, 4))
+        sin_phi, cos_phi = _site_terms(self.table.quarter, loc.lat_turn)
         
-        sin_h0 = self.table.eval_normalized_turn(self.h0_turn)
+        sin_h0 = self._sin_h0
         
         numerator = sin_h0 - (sin_phi * sin_delta)
         denominator = cos_phi * cos_delta
@@ -117,7 +135,7 @@ class SphericalSunrise(SunriseModel):
         cos_H0 = numerator / denominator
         H0_turn = self.table.acos_normalized_turn(cos_H0)
         
-        return Fraction(1, 2) - H0_turn, SunriseState.NORMAL
+        return _HALF_TURN - H0_turn, SunriseState.NORMAL
 
 @dataclass(frozen=True)
 class TrueSunrise(SunriseModel):
@@ -131,6 +149,13 @@ class TrueSunrise(SunriseModel):
     sine_table: QuarterWaveTable
     atan_table: ArctanTable
     day_fraction: Fraction = Fraction(1, 4)
+
+    def __post_init__(self) -> None:
+        # Obliquity and horizon terms are model constants
+        table = self.sine_table
+        object.__setattr__(self, "_sin_eps", table.eval_normalized_turn(self.eps_turn))
+        object.__setattr__(self, "_cos_eps", table.eval_normalized_turn(self.eps_turn + Fraction(1, 4)))
+        object.__setattr__(self, "_sin_h0", table.eval_normalized_turn(self.h0_turn))
     
     def init_lmt_fraction(self) -> Fraction:
         return self.day_fraction
@@ -140,19 +165,18 @@ class TrueSunrise(SunriseModel):
             raise ValueError("True sunrise requires a LocationSpec with a defined lat_turn.")
             
         # 1. Evaluate standard spherical components
-        sin_eps = self.sine_table.eval_normalized_turn(self.eps_turn)
-        cos_eps = self.sine_table.eval_normalized_turn(self.eps_turn + Fraction(1, 4))
+        sin_eps = self._sin_eps
+        cos_eps = self._cos_eps
         
         sin_lambda = self.sine_table.eval_normalized_turn(true_sun_turn)
-        cos_lambda = self.sine_table.eval_normalized_turn(true_sun_turn + Fraction(1, 4))
+        cos_lambda = self.sine_table.eval_normalized_turn(true_sun_turn + _QUARTER_TURN)
         
         sin_delta = sin_eps * sin_lambda
         delta_turn = self.sine_table.asin_normalized_turn(sin_delta)
-        cos_delta = self.sine_table.eval_normalized_turn(delta_turn + Fraction(1, 4))
+        cos_delta = self.sine_table.eval_normalized_turn(delta_turn + _QUARTER_TURN)
         
-        sin_phi = self.sine_table.eval_normalized_turn(loc.lat_turn)
-        cos_phi = self.sine_table.eval_normalized_turn(loc.lat_turn + Fraction(1, 4))
-        sin_h0 = self.sine_table.eval_normalized_turn(self.h0_turn)
+        sin_phi, cos_phi = _site_terms(self.sine_table.quarter, loc.lat_turn)
+        sin_h0 = self._sin_h0
         
         # 2. Spherical Law of Cosines for Hour Angle (H0)
         numerator = sin_h0 - (sin_phi * sin_delta)
@@ -167,7 +191,7 @@ class TrueSunrise(SunriseModel):
         H0_turn = self.sine_table.acos_normalized_turn(cos_H0)
         
         # Local Apparent Time (LAT) of Sunrise
-        t_lat = Fraction(1, 2) - H0_turn
+        t_lat = _HALF_TURN - H0_turn
         
         # 3. Equation of Time Correction (C.13 & C.14)
         # alpha_sun = atan2(cos(eps) * sin(lambda), cos(lambda))
@@ -181,7 +205,7 @@ class TrueSunrise(SunriseModel):
         
         # Ensure strict wrapping to [0, 1)
         q = t_lmt.numerator // t_lmt.denominator
-        return t_lmt - Fraction(q, 1), SunriseState.NORMAL
+        return t_lmt - q, SunriseState.NORMAL
 
 # ============================================================
 # Float Sunrise Models (For FloatDayEngine)
@@ -1,13 +1,78 @@
 # engines/astro/tables.py
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from fractions import Fraction
+from functools import lru_cache
 from typing import Tuple
 
-def _frac_part(x: Fraction) -> Fraction:
-    q = x.numerator // x.denominator
-    return x - Fraction(q, 1)
+from caltib.core import jit as _jit
+from caltib.core.jit import maybe_njit
+from caltib.engines.astro.rational import frac_turn
+
+
+@maybe_njit
+def _quarter_eval_f64(quarter, x_turn):
+    """float64 mirror of QuarterWaveTable.eval_turn (table units)."""
+    n4 = len(quarter) - 1
+    N = 4 * n4
+    u = (x_turn - math.floor(x_turn)) * N
+
+    sign = 1.0
+    if u > 2 * n4:
+        sign = -1.0
+        u = N - u
+    if u > n4:
+        u = 2 * n4 - u
+
+    i = int(u)
+    if i >= n4:
+        return sign * quarter[n4]
+    q0 = quarter[i]
+    return sign * (q0 + (u - i) * (quarter[i + 1] - q0))
+
+
+@maybe_njit
+def _quarter_series_f64(quarter, acc, c0s, c1s, amps, amp1s, t, with_amp1):
+    """
+    acc + sum of amp_k * table(c0_k + c1_k*t) / peak over one run of terms on
+    the same table, accumulated term by term exactly like the Python loops
+    (amp_k + amp1_k*t when with_amp1). One jitted call per run.
+    """
+    peak = quarter[len(quarter) - 1]
+    for k in range(len(amps)):
+        amp = amps[k] + amp1s[k] * t if with_amp1 else amps[k]
+        acc += amp * (_quarter_eval_f64(quarter, c0s[k] + c1s[k] * t) / peak)
+    return acc
+
+
+def _quarter_eval_f64_into_np(quarter, x_turns, out):
+    """NumPy mirror of _quarter_eval_f64 (same float64 operations per element)."""
+    import numpy as np
+
+    n4 = len(quarter) - 1
+    N = 4 * n4
+    u = (x_turns - np.floor(x_turns)) * N
+
+    neg = u > 2 * n4
+    sign = np.where(neg, -1.0, 1.0)
+    u = np.where(neg, N - u, u)
+    u = np.where(u > n4, 2 * n4 - u, u)
+
+    i = u.astype(np.int64)
+    top = i >= n4
+    i = np.where(top, n4 - 1, i)
+    q0 = quarter[i]
+    out[:] = sign * np.where(top, quarter[n4], q0 + (u - i) * (quarter[i + 1] - q0))
+
+
+@maybe_njit(parallel=True, fallback=_quarter_eval_f64_into_np)
+def _quarter_eval_f64_into(quarter, x_turns, out):
+    """_quarter_eval_f64 over a float64 array into out, split across cores."""
+    for k in _jit.prange(x_turns.shape[0]):
+        out[k] = _quarter_eval_f64(quarter, x_turns[k])
+
 
 @dataclass(frozen=True)
 class QuarterWaveTable:
@@ -24,14 +89,21 @@ class QuarterWaveTable:
             
         object.__setattr__(self, "N", 4 * (len(self.quarter) - 1))
         object.__setattr__(self, "amplitude", self.quarter[-1])
+        object.__setattr__(self, "_quarter_f64", tuple(float(v) for v in self.quarter))
+
+        # Signed samples over one full period (u = 0..N) and their segment
+        # slopes, so the integer kernel is one index and one linear step.
+        full = tuple(int(self.eval_u(Fraction(u))) for u in range(self.N + 1))
+        object.__setattr__(self, "_full", full)
+        object.__setattr__(self, "_full_slope", tuple(b - a for a, b in zip(full, full[1:])))
 
     def eval_u(self, u: Fraction) -> Fraction:
         k = (u.numerator // u.denominator) // self.N
-        u0 = u - Fraction(self.N * k, 1)
+        u0 = u - self.N * k
 
         if u0 < 0:
             k2 = (-u0.numerator // u0.denominator) // self.N + 1
-            u0 = u0 + Fraction(self.N * k2, 1)
+            u0 = u0 + self.N * k2
 
         sign = 1
         if u0 > Fraction(self.N, 2):
@@ -51,13 +123,61 @@ class QuarterWaveTable:
         v = v0 + t * (v1 - v0)
         return Fraction(sign, 1) * v
 
+    def _eval_turn_nd(self, num: int, den: int) -> Tuple[int, int]:
+        """
+        Integer kernel of eval_turn for the phase num/den (den > 0, any sign).
+        Equals eval_u on u = N*frac(num/den), interpolating the full-period
+        samples with raw numerators over the common denominator den, and
+        returns the unnormalized pair (vn, vd); the caller builds a single
+        Fraction (one gcd) from it. Grid phases return the sample as (s, 1).
+        """
+        un = (num % den) * self.N  # u0 = un/den in [0, N)
+        i = un // den
+        r = un - i * den
+        if not r:
+            return self._full[i], 1
+        return self._full[i] * den + r * self._full_slope[i], den
+
     def eval_turn(self, x_turn: Fraction) -> Fraction:
-        x = _frac_part(x_turn)
-        return self.eval_u(x * Fraction(self.N, 1))
+        if type(x_turn) is float:
+            # Float phases take the jitted float64 kernel; exact inputs stay exact
+            return self.eval_turn_f64(x_turn)
+        vn, vd = self._eval_turn_nd(int(x_turn.numerator), int(x_turn.denominator))
+        return Fraction(vn, vd)
+
+    def eval_turn_f64(self, x_turn: float) -> float:
+        """float64 approximation of eval_turn in table units (numba-jitted when available)."""
+        return _quarter_eval_f64(self._quarter_f64, x_turn)
 
     def eval_normalized_turn(self, x_turn: Fraction) -> Fraction:
         """Evaluate at phase x in turns. Returns scaled fraction in [-1, 1]."""
-        return self.eval_turn(x_turn) / Fraction(self.amplitude, 1)
+        vn, vd = self._eval_turn_nd(int(x_turn.numerator), int(x_turn.denominator))
+        return Fraction(vn, vd * self.amplitude)
+
+    def eval_normalized_turn_f64(self, x_turn: float) -> float:
+        """
+        float64 approximation of eval_normalized_turn (numba-jitted when
+        available). For seeding and diagnostics only; never for calendar output.
+        """
+        return _quarter_eval_f64(self._quarter_f64, x_turn) / self._quarter_f64[-1]
+
+    def eval_normalized_turn_f64_array(self, x_turns):
+        """Batch eval_normalized_turn_f64 over a NumPy array of phases."""
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise RuntimeError("This function needs numpy. Install: pip install numpy") from e
+
+        quarter = self.__dict__.get("_quarter_np")
+        if quarter is None:
+            # One contiguous float64 buffer per (interned) table, built on first batch call
+            quarter = np.asarray(self._quarter_f64, dtype=np.float64)
+            quarter.setflags(write=False)
+            object.__setattr__(self, "_quarter_np", quarter)
+        x = np.ascontiguousarray(x_turns, dtype=np.float64)
+        out = np.empty_like(x)
+        _quarter_eval_f64_into(quarter, x, out)
+        return out / quarter[-1]
 
     def asin_turn(self, y: Fraction) -> Fraction:
         """
@@ -111,6 +231,20 @@ class QuarterWaveTable:
         """
         return Fraction(1, 4) - self.asin_normalized_turn(y_norm)
 
+def get_quarter_wave_table(quarter: Tuple[int, ...]) -> QuarterWaveTable:
+    """
+    Shared QuarterWaveTable for a quarter tuple. Tables are immutable, so every
+    engine using the same samples reuses one instance and its precomputed
+    full-period, slope and float64 views.
+    """
+    return _interned_quarter_wave_table(tuple(quarter))
+
+
+@lru_cache(maxsize=None)
+def _interned_quarter_wave_table(quarter: Tuple[int, ...]) -> QuarterWaveTable:
+    return QuarterWaveTable(quarter=quarter)
+
+
 @dataclass(frozen=True)
 class HalfWaveTable:
     """
@@ -138,11 +272,11 @@ class HalfWaveTable:
 
     def eval_u(self, u: Fraction) -> Fraction:
         k = (u.numerator // u.denominator) // self.N
-        u0 = u - Fraction(self.N * k, 1)
+        u0 = u - self.N * k
 
         if u0 < 0:
             k2 = (-u0.numerator // u0.denominator) // self.N + 1
-            u0 = u0 + Fraction(self.N * k2, 1)
+            u0 = u0 + self.N * k2
 
         sign = 1
         if u0 > Fraction(self.N, 2):
@@ -160,13 +294,23 @@ class HalfWaveTable:
         return Fraction(sign, 1) * v
 
     def eval_turn(self, x_turn: Fraction) -> Fraction:
-        x = _frac_part(x_turn)
+        x = frac_turn(x_turn)
         return self.eval_u(x * Fraction(self.N, 1))
 
     def eval_normalized_turn(self, x_turn: Fraction) -> Fraction:
         return self.eval_turn(x_turn) / Fraction(self.amplitude, 1)
 
 
+def get_half_wave_table(half: Tuple[int, ...]) -> HalfWaveTable:
+    """Shared HalfWaveTable for a half tuple, interned like get_quarter_wave_table."""
+    return _interned_half_wave_table(tuple(half))
+
+
+@lru_cache(maxsize=None)
+def _interned_half_wave_table(half: Tuple[int, ...]) -> HalfWaveTable:
+    return HalfWaveTable(half=half)
+
+
 @dataclass(frozen=True)
 class ArctanTable:
     """
@@ -9,8 +9,9 @@ from __future__ import annotations
 
 from datetime import date
 from fractions import Fraction
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 from dataclasses import replace
+from functools import lru_cache
 
 from caltib.core.types import EngineId, SunriseState, DayInfo, TibetanDate, MonthInfo, TibetanMonth, YearInfo, TibetanYear, LocationSpec, CalendarSpec
 from caltib.engines.interfaces import MonthEngineProtocol, DayEngineProtocol, AttributeEngineProtocol, PlanetsEngineProtocol, NumT
@@ -18,6 +19,9 @@ from caltib.engines.interfaces import MonthEngineProtocol, DayEngineProtocol, At
 # J2000.0 TT base for absolute Julian Day conversion
 JD_J2000 = Fraction(2451545, 1)
 
+# Capacity of the per-engine jdn -> civil day record index
+_DAY_INDEX_SIZE = 8192
+
 class CalendarEngine:
     """
     Translates full human dates to local Julian Day Numbers (JDN) and vice versa,
@@ -43,12 +47,26 @@ class CalendarEngine:
         
         if self.leap_labeling not in ("first_is_leap", "second_is_leap"):
             raise ValueError("leap_labeling must be 'first_is_leap' or 'second_is_leap'")
+
+        # Resolve the leap policy once instead of comparing strings per lookup:
+        # leap_state 1/2 marks the first/second of a doubled month.
+        self._first_is_leap = self.leap_labeling == "first_is_leap"
+        self._leap_by_state = {1: self._first_is_leap, 2: not self._first_is_leap}
             
         # The critical epoch synchronization shift.
         # Absolute Meeus k = n_M + epoch_M = n_D + epoch_D
         # Therefore: n_D = n_M + (epoch_M - epoch_D)
         self.delta_k = self.month.epoch_k - self.day.epoch_k
 
+        # Engines are immutable once built, so the discrete civil boundaries
+        # J(x) and whole civil months can be memoized per calendar instance.
+        # from_jdn, build_civil_month, day_info and month/year builders all
+        # revisit the same J(x), J(x-1), J(x-2) for neighbouring days.
+        self._civil_jdn = lru_cache(maxsize=4096)(self.day.civil_jdn)
+        self._civil_month = lru_cache(maxsize=256)(self._build_civil_month)
+        # jdn -> civil day record; months built above fill it for their days
+        self._day_index: Dict[int, dict] = {}
+
     @property
     def sgang_base(self) -> Fraction:
         """Returns the continuous zodiac offset [0, 1) turns for the first Sgang."""
@@ -95,17 +113,17 @@ class CalendarEngine:
                 raise ValueError(f"Month {month} in year {year} is not a leap month.")
             n_m = n_m_list[0]
         else:
-            if self.leap_labeling == "first_is_leap":
+            if self._first_is_leap:
                 n_m = n_m_list[0] if is_leap else n_m_list[1]
             else:
                 n_m = n_m_list[1] if is_leap else n_m_list[0]
 
         # 2. Shift to Day engine coordinates and calculate x
         n_d = n_m + self.delta_k
-        x = Fraction(30 * n_d + day, 1)
+        x = 30 * n_d + day
         
         # 3. Use the protected discrete boundary!
-        return self.day.civil_jdn(x)
+        return self._civil_jdn(x)
 
     # ---------------------------------------------------------
     # Inverse: Physical JDN to Civil Date
@@ -116,6 +134,21 @@ class CalendarEngine:
         Maps a Gregorian JDN to a Tibetan Date using pure monotonic search 
         over exact discrete boundaries.
         """
+        res = self._day_index.get(jdn)
+        if res is None:
+            res = self._remember_day(jdn, self._from_jdn(jdn))
+        return dict(res)
+
+    def _remember_day(self, jdn: int, res: dict) -> dict:
+        # Bounded jdn -> record index; the oldest entry goes once full, so a
+        # long sweep keeps the month it is walking warm
+        index = self._day_index
+        if len(index) >= _DAY_INDEX_SIZE:
+            index.pop(next(iter(index)))
+        index[jdn] = res
+        return res
+
+    def _from_jdn(self, jdn: int) -> dict:
         # 1. Get initial approximation for x (t2000 coordinate)
         t2000 = jdn - JD_J2000
         x = self.day.get_x_from_t2000(t2000)
@@ -124,8 +157,8 @@ class CalendarEngine:
         # The civil day `jdn` belongs to tithi `x` iff: J(x-1) < jdn <= J(x)
         while True:
             # We now rely on the DayEngine to provide the exact absolute JDN!
-            j_end = self.day.civil_jdn(x)
-            j_prev = self.day.civil_jdn(x - 1)
+            j_end = self._civil_jdn(x)
+            j_prev = self._civil_jdn(x - 1)
             
             if jdn <= j_prev:
                 x -= 1
@@ -133,19 +166,24 @@ class CalendarEngine:
                 x += 1
             else:
                 break
-                
+
+        return self._day_record(jdn, x, j_prev)
+
+    def _month_labels(self, n_m: int) -> Tuple[int, int, bool]:
+        """(year, month, is_leap) for month-engine lunation n_m under the leap policy."""
+        year, month, leap_state = self.month.label_from_lunation(n_m)
+        is_leap = self._leap_by_state.get(leap_state, False)
+        return year, month, is_leap
+
+    def _day_record(self, jdn: int, x: int, j_prev: int, labels: Optional[Tuple[int, int, bool]] = None) -> dict:
+        """Civil day record for `jdn`, known to lie in tithi x (J(x-1) = j_prev < jdn <= J(x))."""
         # 3. Decompose absolute x into relative month (n_m) and day (d)
         n_d = (x - 1) // 30
         d = (x - 1) % 30 + 1
         n_m = n_d - self.delta_k
         
         # 4. Resolve Month labels
-        year, month, leap_state = self.month.label_from_lunation(n_m)
-        is_leap = False
-        if leap_state == 1:
-            is_leap = (self.leap_labeling == "first_is_leap")
-        elif leap_state == 2:
-            is_leap = (self.leap_labeling == "second_is_leap")
+        year, month, is_leap = labels if labels is not None else self._month_labels(n_m)
             
         # 5. Strict Physical Metadata
         occ = jdn - j_prev
@@ -155,7 +193,7 @@ class CalendarEngine:
         is_duplicate_day = (occ > 1)
         
         # skipped: The previous tithi (x-1) was skipped if it covered 0 dawns
-        skipped = (self.day.civil_jdn(x - 1) == self.day.civil_jdn(x - 2))
+        skipped = (j_prev == self._civil_jdn(x - 2))
         
         return {
             "year": year,
@@ -170,17 +208,25 @@ class CalendarEngine:
 
     def build_civil_month(self, n_d: int) -> dict:
         """Diagnostic wrapper: Builds a month array using pure continuous bounds."""
-        # Bracket the month safely using the protected boundaries
-        j_start = self.day.civil_jdn(30 * n_d)
-        j_end = self.day.civil_jdn(30 * n_d + 30)
-        
-        month_map = {}
-        for jdn in range(j_start, j_end + 2):
-            res = self.from_jdn(jdn)
-            # Filter days to only those belonging to this exact lunation
-            if (res["true_month"] + self.delta_k) == n_d:
-                month_map[jdn] = res
-        return month_map
+        # Hand out copies so callers cannot corrupt the memoized month
+        return {jdn: dict(res) for jdn, res in self._civil_month(n_d)}
+
+    def _build_civil_month(self, n_d: int) -> Tuple[Tuple[int, dict], ...]:
+        # Sweep the 31 boundaries J(30*n_d) .. J(30*n_d + 30) once: the days of
+        # tithi x are exactly J(x-1) < jdn <= J(x), so no per-day search is needed.
+        # The memoized result is an immutable, jdn-ordered tuple of (jdn, record).
+        labels = self._month_labels(n_d - self.delta_k)
+
+        days = []
+        append = days.append
+        civil_jdn, remember, record = self._civil_jdn, self._remember_day, self._day_record
+        j_prev = civil_jdn(30 * n_d)
+        for x in range(30 * n_d + 1, 30 * n_d + 31):
+            j_end = civil_jdn(x)
+            for jdn in range(j_prev + 1, j_end + 1):
+                append((jdn, remember(jdn, record(jdn, x, j_prev, labels))))
+            j_prev = j_end
+        return tuple(days)
     
     # ---------------------------------------------------------
     # High-Level API Methods (Required by CLI / api.py)
@@ -195,7 +241,7 @@ class CalendarEngine:
         
         n_m = res["true_month"]
         n_d = n_m + self.delta_k
-        j_month_start_boundary = self.day.civil_jdn(30 * n_d)
+        j_month_start_boundary = self._civil_jdn(30 * n_d)
         linear_day = jdn - j_month_start_boundary
 
         if self.attr is not None:
@@ -245,7 +291,7 @@ class CalendarEngine:
         if len(lunations) == 1:
             n_m = lunations[0]
         else:
-            if self.leap_labeling == "first_is_leap":
+            if self._first_is_leap:
                 n_m = lunations[0] if t.is_leap_month else lunations[1]
             else:
                 n_m = lunations[1] if t.is_leap_month else lunations[0]
@@ -255,8 +301,8 @@ class CalendarEngine:
         x = 30 * n_d + t.tithi
         
         # 3. The Pure Mathematical Mapping using the DayEngine's exact integers
-        j_start = self.day.civil_jdn(x - 1) + 1
-        j_end   = self.day.civil_jdn(x) + 1 
+        j_start = self._civil_jdn(x - 1) + 1
+        j_end   = self._civil_jdn(x) + 1 
         
         valid_jdns = list(range(j_start, j_end))
         
@@ -287,25 +333,21 @@ class CalendarEngine:
         linear_month = m_data.get("linear_month", 0)
 
         # 2. Resolve leap labeling policy
-        is_leap = False
-        if leap_state == 1:
-            is_leap = (self.leap_labeling == "first_is_leap")
-        elif leap_state == 2:
-            is_leap = (self.leap_labeling == "second_is_leap")
+        is_leap = self._leap_by_state.get(leap_state, False)
 
         # 3. Shift to Day engine coordinates and generate the days
         n_d = n + self.delta_k
-        raw_days = self.build_civil_month(n_d)
+        # Read-only walk over the memoized month: already in jdn order, no copies
+        raw_days = self._civil_month(n_d)
         
         # Find the absolute boundary for O(1) linear mapping
-        j_month_start_boundary = self.day.civil_jdn(30 * n_d)
+        j_month_start_boundary = self._civil_jdn(30 * n_d)
 
         from caltib.core.time import from_jdn
         
         days_list = []
         
-        for jdn in sorted(raw_days.keys()):
-            res = raw_days[jdn]
+        for jdn, res in raw_days:
             civil_date = from_jdn(jdn)
             
             # Analytical O(1) calculation. First day is exactly 1.
@@ -371,7 +413,7 @@ class CalendarEngine:
                 raise ValueError(f"Month {month} in year {year} is not a leap month.")
             n = lunations[0]
         else:
-            if self.leap_labeling == "first_is_leap":
+            if self._first_is_leap:
                 n = lunations[0] if is_leap else lunations[1]
             else:
                 n = lunations[1] if is_leap else lunations[0]
@@ -10,7 +10,7 @@ import math
 from dataclasses import dataclass
 from typing import Tuple
 
-from caltib.core.types import LocationSpec
+from caltib.core.types import LocationSpec, _SLOTS
 from caltib.engines.interfaces import DayEngineProtocol, NumT
 from caltib.engines.astro.deltat import FloatDeltaT, FloatDeltaTDef
 from caltib.engines.astro.sunrise import SunriseState, FloatSunrise, FloatSunriseDef
@@ -19,7 +19,7 @@ from caltib.engines.astro.fp_math import float_sqrt
 
 JD_J2000_FLOAT = 2451545.0
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class FloatDayParams:
     epoch_k: int
     location: LocationSpec
@@ -83,6 +83,10 @@ class FloatDayEngine(DayEngineProtocol):
         from caltib.engines.astro.deltat import FloatDeltaT
         self.delta_t = FloatDeltaT(a=p.delta_t.a, b=p.delta_t.b, c=p.delta_t.c, y0=p.delta_t.y0)
 
+        # Safe, strict 1-way cast from LocationSpec Fractions to float, once per engine
+        self._lon_turn = float(p.location.lon_turn)
+        self._lat_turn = float(p.location.lat_turn)
+
     @property
     def epoch_k(self) -> int:
         return self.p.epoch_k
@@ -95,9 +99,15 @@ class FloatDayEngine(DayEngineProtocol):
     def location(self) -> LocationSpec: 
         return self.p.location
 
+    def _target_turns(self, x: NumT) -> float:
+        """Elongation target (x + offset) / 30 in turns."""
+        return (float(x) + self.epoch_offset_x) / 30.0
+
     def mean_date(self, x: NumT) -> float:
         """Solves E(t) = (x + offset) / 30 for the base quadratic."""
-        target_turns = (float(x) + self.epoch_offset_x) / 30.0
+        return self._mean_date_turns(self._target_turns(x))
+
+    def _mean_date_turns(self, target_turns: float) -> float:
         A, B, C = self.elong_series.A, self.elong_series.B, self.elong_series.C
         
         if abs(C) < 1e-12:
@@ -108,8 +118,8 @@ class FloatDayEngine(DayEngineProtocol):
 
     def true_date(self, x: NumT) -> float:
         """Solves E_true(t) = (x + offset) / 30 via Picard Iteration."""
-        target_turns = (float(x) + self.epoch_offset_x) / 30.0
-        t_guess = self.mean_date(x)
+        target_turns = self._target_turns(x)
+        t_guess = self._mean_date_turns(target_turns)
         return self.elong_series.picard_solve(target_turns, iterations=self.p.iterations, t_init=t_guess)
 
     def get_x_from_t2000(self, t2000: float) -> int:
@@ -140,8 +150,7 @@ class FloatDayEngine(DayEngineProtocol):
         abs_t_utc = t_utc + JD_J2000_FLOAT
         
         lmt_baseline = self.sunrise.init_lmt_fraction()
-        # Safe, strict 1-way cast from LocationSpec Fraction to float
-        lon_turn = float(self.p.location.lon_turn)
+        lon_turn = self._lon_turn
         
         t_dawn_based = abs_t_utc + lon_turn + lmt_baseline
         j_civil = math.floor(t_dawn_based)
@@ -187,6 +196,11 @@ class FloatDayEngine(DayEngineProtocol):
         
     def true_sun_tt(self, t2000: NumT) -> float:
         return self.solar_series.eval(float(t2000)) % 1.0
+
+    def true_sun_tt_many(self, t2000s):
+        """true_sun_tt over a NumPy array of t2000 (TT) days, element-wise identical."""
+        import numpy as np
+        return np.remainder(self.solar_series.eval_array(t2000s), 1.0)
         
     def mean_elong_tt(self, t2000: NumT) -> float:
         return self.elong_series.base(float(t2000)) % 1.0
@@ -194,6 +208,11 @@ class FloatDayEngine(DayEngineProtocol):
     def true_elong_tt(self, t2000: NumT) -> float:
         return self.elong_series.eval(float(t2000)) % 1.0
 
+    def true_elong_tt_many(self, t2000s):
+        """true_elong_tt over a NumPy array of t2000 (TT) days, element-wise identical."""
+        import numpy as np
+        return np.remainder(self.elong_series.eval_array(t2000s), 1.0)
+
     def mean_moon_tt(self, t2000: NumT) -> float:
         # Implicitly recovered via Sun + Elongation
         return self.elong_series.base(float(t2000)) + self.solar_series.base(float(t2000))
@@ -208,7 +227,7 @@ class FloatDayEngine(DayEngineProtocol):
         mean_sun = self.solar_series.base(t_tt)
         
         return self.sunrise.sunrise_lmt_fraction(
-            float(self.p.location.lat_turn), 
+            self._lat_turn, 
             lambda_sun, 
             mean_sun
         )
\ No newline at end of file
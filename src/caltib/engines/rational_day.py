@@ -10,14 +10,17 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from fractions import Fraction
-from typing import Tuple, Optional
+from functools import lru_cache
+from typing import Callable, Dict, List, Tuple, Optional
 
-from caltib.core.types import LocationSpec
+from caltib.core.types import LocationSpec, _SLOTS
 from caltib.engines.interfaces import DayEngineProtocol, NumT
-from caltib.engines.astro.tables import ArctanTable, QuarterWaveTable
-from caltib.engines.astro.affine_series import TermDef, TabTermT, AffineTabSeriesT
+from caltib.engines.astro.tables import ArctanTable, get_quarter_wave_table
+from caltib.engines.astro.rational import frac_turn
+from caltib.engines.astro.affine_series import PICARD_TOL_BITS, TermDef, AffineTabSeriesT, bind_table_terms
 from caltib.engines.astro.deltat import (
     DeltaTDef, 
+    DeltaTModel,
     ConstantDeltaTDef, 
     QuadraticDeltaTDef, 
     ConstantDeltaT, 
@@ -27,6 +30,7 @@ from caltib.engines.astro.deltat import (
 from caltib.engines.astro.sunrise import (
     SunriseState,
     SunriseDef, 
+    SunriseModel,
     ConstantSunriseDef, 
     SphericalSunriseDef, 
     TrueSunriseDef,
@@ -36,15 +40,58 @@ from caltib.engines.astro.sunrise import (
 )
 
 JD_J2000 = Fraction(2451545, 1)
-
-
-def frac_turn(x: Fraction) -> Fraction:
-    """Wraps a fractional turn to [0, 1)."""
-    q = x.numerator // x.denominator
-    return x - Fraction(q, 1)
-
-
-@dataclass(frozen=True)
+JDN_J2000 = 2451545
+
+# Per-call rational constants, built (and reduced) once at import
+_HALF_DAY = Fraction(1, 2)
+_JULIAN_YEAR = Fraction(1461, 4)
+_Y2000 = Fraction(2000, 1)
+
+
+# Pure-data model definitions -> builders of the active physics models.
+# New ΔT / sunrise models are registered here instead of editing the engine.
+_DELTAT_BIND: Dict[type, Callable[[DeltaTDef], DeltaTModel]] = {
+    ConstantDeltaTDef: lambda d: ConstantDeltaT(d.value),
+    QuadraticDeltaTDef: lambda d: QuadraticDeltaT(d.a, d.b, d.c, d.y0),
+}
+
+_SUNRISE_BIND: Dict[type, Callable[[SunriseDef], SunriseModel]] = {
+    ConstantSunriseDef: lambda d: ConstantSunrise(d.day_fraction),
+    SphericalSunriseDef: lambda d: SphericalSunrise(
+        h0_turn=d.h0_turn,
+        eps_turn=d.eps_turn,
+        table=get_quarter_wave_table(d.sine_tab_quarter),
+        day_fraction=d.day_fraction,
+    ),
+    TrueSunriseDef: lambda d: TrueSunrise(
+        h0_turn=d.h0_turn,
+        eps_turn=d.eps_turn,
+        sine_table=get_quarter_wave_table(d.sine_tab_quarter),
+        atan_table=ArctanTable(values=d.atan_tab_values),
+        day_fraction=d.day_fraction,
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def _bind_delta_t(d: DeltaTDef) -> DeltaTModel:
+    """Shared ΔT model per (frozen) def: every engine on the same def reuses one instance."""
+    bind = _DELTAT_BIND.get(type(d))
+    if bind is None:
+        raise TypeError("Unknown DeltaTDef")
+    return bind(d)
+
+
+@lru_cache(maxsize=None)
+def _bind_sunrise(d: SunriseDef) -> SunriseModel:
+    """Shared sunrise model per (frozen) def: every engine on the same def reuses one instance."""
+    bind = _SUNRISE_BIND.get(type(d))
+    if bind is None:
+        raise TypeError("Unknown SunriseDef")
+    return bind(d)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class RationalDayParams:
     epoch_k: int  # Required by Protocol
     location: LocationSpec
@@ -80,29 +127,17 @@ class RationalDayEngine(DayEngineProtocol):
     def __init__(self, p: RationalDayParams):
         self.p = p
         
-        # 1. Instantiate the tables
-        moon_tab = QuarterWaveTable(quarter=p.moon_tab_quarter)
-        sun_tab = QuarterWaveTable(quarter=p.sun_tab_quarter)
-        
-        # 2. Build Solar Series (Outputs True Sun)
-        active_solar = tuple(
-            TabTermT(amp=t.amp, phase=t.phase, table_eval_turn=sun_tab.eval_normalized_turn)
-            for t in p.solar_terms
-        )
+        # 1. Build Solar Series (Outputs True Sun); spec terms are bound to
+        #    the shared tables once per spec by bind_table_terms
+        active_solar = bind_table_terms(p.solar_terms, p.sun_tab_quarter)
         self.solar_series = AffineTabSeriesT(A=p.A_sun, B=p.B_sun, C=p.C_sun, terms=active_solar)
 
-        # 3. Build Lunar Anomaly Series
-        active_lunar = tuple(
-            TabTermT(amp=t.amp, phase=t.phase, table_eval_turn=moon_tab.eval_normalized_turn)
-            for t in p.lunar_terms
-        )
+        # 2. Build Lunar Anomaly Series
+        active_lunar = bind_table_terms(p.lunar_terms, p.moon_tab_quarter)
 
-        # 4. Build Elongation Series: E(t) = D_mean(t) + A_moon(t) - A_sun(t)
+        # 3. Build Elongation Series: E(t) = D_mean(t) + A_moon(t) - A_sun(t)
         # Solar perturbation amplitudes are negated because E = Moon - Sun
-        active_elong_solar = tuple(
-            TabTermT(amp=-t.amp, phase=t.phase, table_eval_turn=sun_tab.eval_normalized_turn)
-            for t in p.solar_terms
-        )
+        active_elong_solar = bind_table_terms(p.solar_terms, p.sun_tab_quarter, negate=True)
         self.elong_series = AffineTabSeriesT(
             A=p.A_elong, 
             B=p.B_elong, 
@@ -110,33 +145,30 @@ class RationalDayEngine(DayEngineProtocol):
             terms=active_lunar + active_elong_solar
         )
 
-        # 5. Bind Active Physics Models
-        if isinstance(p.delta_t, ConstantDeltaTDef):
-            self.delta_t = ConstantDeltaT(p.delta_t.value)
-        elif isinstance(p.delta_t, QuadraticDeltaTDef):
-            self.delta_t = QuadraticDeltaT(p.delta_t.a, p.delta_t.b, p.delta_t.c,p.delta_t.y0)
-        else:
-            raise TypeError("Unknown DeltaTDef")
-
-        if isinstance(p.sunrise, ConstantSunriseDef):
-            self.sunrise = ConstantSunrise(p.sunrise.day_fraction)
-        elif isinstance(p.sunrise, SphericalSunriseDef):
-            self.sunrise = SphericalSunrise(
-                h0_turn=p.sunrise.h0_turn, 
-                eps_turn=p.sunrise.eps_turn, 
-                table=QuarterWaveTable(quarter=p.sunrise.sine_tab_quarter),
-                day_fraction=p.sunrise.day_fraction,
-            )
-        elif isinstance(p.sunrise, TrueSunriseDef):
-            self.sunrise = TrueSunrise(
-                h0_turn=p.sunrise.h0_turn, 
-                eps_turn=p.sunrise.eps_turn, 
-                sine_table=QuarterWaveTable(quarter=p.sunrise.sine_tab_quarter),
-                atan_table=ArctanTable(values=p.sunrise.atan_tab_values),
-                day_fraction=p.sunrise.day_fraction,
-            )
-        else:
-            raise TypeError("Unknown SunriseDef")
+        # Moon = Elongation + Sun: the solar terms cancel exactly, so the true
+        # moon needs only the lunar terms on the summed affine base.
+        self.moon_series = AffineTabSeriesT(
+            A=p.A_elong + p.A_sun,
+            B=p.B_elong + p.B_sun,
+            C=p.C_elong + p.C_sun,
+            terms=active_lunar
+        )
+
+        # 4. Bind Active Physics Models
+        self.delta_t = _bind_delta_t(p.delta_t)
+        self.sunrise = _bind_sunrise(p.sunrise)
+
+        # Bound model methods for the per-boundary hot path (civil_jdn)
+        self._delta_t_seconds = self.delta_t.delta_t_seconds
+        self._lmt_baseline = self.sunrise.init_lmt_fraction
+        self._sunrise_utc_fraction = self.sunrise.sunrise_utc_fraction
+
+        # Constant ΔT: the TT-UTC offset in days is the same Fraction at every boundary
+        # (exact type only: a subclass may override delta_t_seconds)
+        self._delta_t_is_const = type(self.delta_t) is ConstantDeltaT
+        self._delta_t_days_const = (
+            Fraction(self.delta_t.value) / 86400 if self._delta_t_is_const else None
+        )
 
     # ---------------------------------------------------------
     # Protocol Properties
@@ -154,21 +186,41 @@ class RationalDayEngine(DayEngineProtocol):
     # Protocol Methods
     # ---------------------------------------------------------
 
+    def _target_turns(self, x: NumT) -> Fraction:
+        """Elongation target x/30 in turns. Integer tithis skip the Fraction coercion."""
+        if isinstance(x, int):
+            return Fraction(x, 30)
+        return Fraction(x) / 30
+
     def mean_date(self, x: NumT) -> Fraction:
         """
         Returns the mean physical time (Days since J2000.0 TT) for absolute tithi x.
         Inverts the linear mean elongation system: E_mean(t) = A + B*t = x/30
         """
-        target_turns = Fraction(x) / Fraction(30, 1)
-        return (target_turns - self.p.A_elong) / self.p.B_elong
+        return (self._target_turns(x) - self.p.A_elong) / self.p.B_elong
 
     def true_date(self, x: NumT) -> Fraction:
         """
         Returns the true physical time (Days since J2000.0 TT) for absolute tithi x.
         Uses Picard iteration to solve: E_true(t) = x/30.
         """
-        target_turns = Fraction(x) / Fraction(30, 1)
-        return self.elong_series.picard_solve(target_turns, iterations=self.p.iterations, invB_prec=self.p.invB_elong_prec)
+        target_turns = self._target_turns(x)
+        return self.elong_series.picard_solve(
+            target_turns,
+            iterations=self.p.iterations,
+            invB_prec=self.p.invB_elong_prec,
+            tol_bits=PICARD_TOL_BITS,
+        )
+
+    def converged_true_dates(self, x_start: int, count: int, *, max_iterations: int = 64) -> List[Fraction]:
+        """
+        Converged roots of E_true(t) = x/30 for the consecutive tithis
+        x_start .. x_start+count-1, each solve warm-started from its predecessor.
+        Intended for diagnostic sweeps; calendar output keeps using true_date,
+        whose fixed iteration count is part of the spec.
+        """
+        targets = [self._target_turns(x) for x in range(x_start, x_start + count)]
+        return self.elong_series.picard_sweep(targets, max_iterations=max_iterations, invB_prec=self.p.invB_elong_prec)
 
     def get_x_from_t2000(self, t2000: float) -> int:
         """
@@ -180,7 +232,7 @@ class RationalDayEngine(DayEngineProtocol):
         
         # 1. Provide an extremely close starting guess based on the elongation series.
         e_turns = self.elong_series.eval(target)
-        x_est_frac = e_turns * Fraction(30, 1)
+        x_est_frac = e_turns * 30
         x_est = x_est_frac.numerator // x_est_frac.denominator
         
         # 2. Walk the physical boundaries to find the exact tithi enclosure.
@@ -208,35 +260,37 @@ class RationalDayEngine(DayEngineProtocol):
         abs_t_utc = t_utc + JD_J2000
         
         # Dynamically ask the sunrise model for its LMT baseline (e.g., 6:00 AM)
-        lmt_baseline = self.sunrise.init_lmt_fraction()
+        lmt_baseline = self._lmt_baseline()
         
         t_dawn_based = abs_t_utc + self.p.location.lon_turn + lmt_baseline
         j_civil = t_dawn_based.numerator // t_dawn_based.denominator
         
         # Compute exact UTC approximation using the dynamic baseline
-        dawn_utc_approx = Fraction(j_civil, 1) - lmt_baseline - self.p.location.lon_turn
+        dawn_utc_approx = j_civil - lmt_baseline - self.p.location.lon_turn
         
-        y_dawn = Fraction(2000, 1) + (dawn_utc_approx - JD_J2000) / Fraction(1461, 4)
-        dt_sec = self.delta_t.delta_t_seconds(y_dawn)
-        dawn_tt_approx = dawn_utc_approx + (dt_sec / Fraction(86400, 1))
+        if self._delta_t_is_const:
+            dawn_tt_approx = dawn_utc_approx + self._delta_t_days_const
+        else:
+            y_dawn = _Y2000 + (dawn_utc_approx - JD_J2000) / _JULIAN_YEAR
+            dt_sec = self._delta_t_seconds(y_dawn)
+            dawn_tt_approx = dawn_utc_approx + (dt_sec / 86400)
         
         # Convert Dawn TT back to J2000 days for the solar series evaluation
         t_dawn_tt = dawn_tt_approx - JD_J2000
         
         # 1. Evaluate both True Sun and Mean Sun for the Sunrise Model
-        lambda_sun = self.solar_series.eval(t_dawn_tt)
-        mean_sun = self.solar_series.base(t_dawn_tt)
+        mean_sun, lambda_sun = self.solar_series.eval_with_base(t_dawn_tt)
         
         # 2. Call the purified Sunrise Model and unpack the flag
-        dawn_frac_exact, polar = self.sunrise.sunrise_utc_fraction(
+        dawn_frac_exact, polar = self._sunrise_utc_fraction(
             self.p.location, 
             lambda_sun, 
             mean_sun
         )
         
-        dawn_utc_exact = Fraction(j_civil, 1) - Fraction(1, 2) + dawn_frac_exact
+        dawn_utc_exact = j_civil - _HALF_DAY + dawn_frac_exact
         # Calculate the absolute JDN coordinate seamlessly using fallback if triggered
-        abs_jdn = Fraction(j_civil, 1) + (abs_t_utc - dawn_utc_exact)
+        abs_jdn = j_civil + (abs_t_utc - dawn_utc_exact)
         
         # Return t2000 to match the protocol!
         return abs_jdn - JD_J2000
@@ -246,13 +300,13 @@ class RationalDayEngine(DayEngineProtocol):
         Returns the absolute discrete JDN using pure rational integer arithmetic.
         Completely bypasses FPU and math.floor.
         """
-        from fractions import Fraction
-        
-        # 1. Get the continuous fraction (t2000) and add the exact J2000 offset
-        abs_date = self.local_civil_date(x) + Fraction(2451545, 1)
-        
-        # 2. Pure rational floor via unbounded integer division
-        return abs_date.numerator // abs_date.denominator
+        # 1. Get the continuous fraction (t2000)
+        t = self.local_civil_date(x)
+
+        # 2. Pure rational floor via unbounded integer division; J2000 is a
+        #    whole day, so it is added after the floor as a plain int.
+        n, d = t.numerator, t.denominator
+        return n // d + JDN_J2000
 
     # ---------------------------------------------------------
     # Civil Boundary & Time Extensions (Used by Orchestrator)
@@ -260,8 +314,10 @@ class RationalDayEngine(DayEngineProtocol):
     def boundary_utc(self, x: NumT) -> Fraction:
         """Returns Days since J2000.0 UTC for absolute tithi x."""
         t_tt = self.true_date(x)
-        dt_sec = self.delta_t.delta_t_seconds(t_tt)        
-        return t_tt - (dt_sec / Fraction(86400, 1))
+        if self._delta_t_is_const:
+            return t_tt - self._delta_t_days_const
+        dt_sec = self._delta_t_seconds(t_tt)
+        return t_tt - (dt_sec / 86400)
 
     # ---------------------------------------------------------
     # Astronomy / Debug
@@ -273,11 +329,15 @@ class RationalDayEngine(DayEngineProtocol):
     def true_sun_tt(self, t2000: NumT) -> Fraction:
         return self.solar_series.eval(t2000)
 
+    def true_sun_tt_many(self, t2000s):
+        """float64 true_sun_tt over a NumPy array of t2000 (TT) days; diagnostics only."""
+        return self.solar_series.eval_f64_array(t2000s)
+
     def mean_moon_tt(self, t2000: NumT) -> Fraction:
         return self.elong_series.base(t2000) + self.solar_series.base(t2000)
 
     def true_moon_tt(self, t2000: NumT) -> Fraction:
-        return self.elong_series.eval(t2000) + self.solar_series.eval(t2000)
+        return self.moon_series.eval(t2000)
 
     def mean_elong_tt(self, t2000: NumT) -> Fraction:
         return self.elong_series.base(t2000)
@@ -296,8 +356,7 @@ class RationalDayEngine(DayEngineProtocol):
         t_tt = Fraction(t2000_tt)
         
         # 1. Evaluate the sun's position at the requested physical time
-        lambda_sun = self.solar_series.eval(t_tt)
-        mean_sun = self.solar_series.base(t_tt)
+        mean_sun, lambda_sun = self.solar_series.eval_with_base(t_tt)
         
         # 2. Pass it through the sunrise geometry engine to get Local Time
         return self.sunrise.sunrise_lmt_fraction(
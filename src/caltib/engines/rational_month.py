@@ -13,19 +13,22 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
+from functools import lru_cache
 from fractions import Fraction
 from typing import Tuple, List, Dict, Any, Optional
 
+from caltib.core.types import _SLOTS
 from caltib.engines.interfaces import MonthEngineProtocol, NumT
-from caltib.engines.astro.tables import QuarterWaveTable
-from caltib.engines.astro.affine_series import TermDef, TabTermT, AffineTabSeriesT
+from caltib.engines.astro.rational import frac_turn
+from caltib.engines.astro.affine_series import PICARD_TOL_BITS, TermDef, AffineTabSeriesT, bind_table_terms
 
-def frac_turn(x: Fraction) -> Fraction:
-    """Wraps a fractional turn to [0, 1)."""
-    return x % 1
+# Relative guard band for the float64 sgang floor. The float solar series is
+# accurate to a few ulps of 12*sun (~1e-15 relative); anything nearer an
+# integer than this is re-evaluated exactly.
+_SGANG_F64_TOL = 2.0 ** -36
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class RationalMonthParams:
     epoch_k: int  # Required by Protocol
     
@@ -69,28 +72,16 @@ class RationalMonthEngine(MonthEngineProtocol):
     def __init__(self, p: RationalMonthParams):
         self.p = p
         
-        # 1. Instantiate the tables
-        moon_tab = QuarterWaveTable(quarter=p.moon_tab_quarter)
-        sun_tab = QuarterWaveTable(quarter=p.sun_tab_quarter)
-        
-        # 2. Build Solar Series (Outputs True Sun)
-        active_solar = tuple(
-            TabTermT(amp=t.amp, phase=t.phase, table_eval_turn=sun_tab.eval_normalized_turn)
-            for t in p.solar_terms
-        )
+        # 1. Build Solar Series (Outputs True Sun); spec terms are bound to
+        #    the shared tables once per spec by bind_table_terms
+        active_solar = bind_table_terms(p.solar_terms, p.sun_tab_quarter)
         self.solar_series = AffineTabSeriesT(A=p.A_sun, B=p.B_sun, C=p.C_sun, terms=active_solar)
 
-        # 3. Build Lunar Series (Outputs True Moon)
-        active_lunar = tuple(
-            TabTermT(amp=t.amp, phase=t.phase, table_eval_turn=moon_tab.eval_normalized_turn)
-            for t in p.lunar_terms
-        )
+        # 2. Build Lunar Series (Outputs True Moon)
+        active_lunar = bind_table_terms(p.lunar_terms, p.moon_tab_quarter)
 
-        # 4. Build Elongation Series: E(t) = D_mean(t) + C_moon(t) - C_sun(t)
-        active_elong_solar = tuple(
-            TabTermT(amp=-t.amp, phase=t.phase, table_eval_turn=sun_tab.eval_normalized_turn)
-            for t in p.solar_terms
-        )
+        # 3. Build Elongation Series: E(t) = D_mean(t) + C_moon(t) - C_sun(t)
+        active_elong_solar = bind_table_terms(p.solar_terms, p.sun_tab_quarter, negate=True)
         self.elong_series = AffineTabSeriesT(
             A=p.A_elong, 
             B=p.B_elong, 
@@ -98,6 +89,37 @@ class RationalMonthEngine(MonthEngineProtocol):
             terms=active_lunar + active_elong_solar
         )
 
+        # Moon = Elongation + Sun: the solar terms cancel exactly, so the true
+        # moon needs only the lunar terms on the summed affine base.
+        self.moon_series = AffineTabSeriesT(
+            A=p.A_elong + p.A_sun,
+            B=p.B_elong + p.B_sun,
+            C=p.C_elong + p.C_sun,
+            terms=active_lunar
+        )
+
+        # The engine is immutable, so each lunation's Picard solve and sgang
+        # count are memoized: labeling revisits n-1, n, n+1 and N_0 constantly.
+        self._true_date = lru_cache(maxsize=4096)(self._solve_true_date)
+        self._sgang_index = lru_cache(maxsize=4096)(self._solve_sgang_index)
+
+        # Fixed sgang anchor as a raw integer pair for the transit floor
+        base = self._sgang_base = p.sgang_base
+        self._sgang_base_nd = (base.numerator, base.denominator)
+        self._sgang_base_f64 = float(base)
+
+        # Naming shift indexed by the transit count delta_Z in {0, 1, 2}:
+        # leap months borrow a name, skipped months drop one.
+        self._name_shift = (
+            0 if p.leap_naming == "previous" else 1,
+            0,
+            -1 if p.skipped_naming == "first" else 0,
+        )
+
+        # Year anchor: the absolute name of lunation 0 is fixed for the engine
+        self._year_of_N0 = self._absolute_name(0) // 12
+        self._first_lunation = lru_cache(maxsize=512)(self._find_first_lunation)
+
     # ---------------------------------------------------------
     # Protocol Properties
     # ---------------------------------------------------------
@@ -108,7 +130,7 @@ class RationalMonthEngine(MonthEngineProtocol):
     @property
     def sgang_base(self) -> Fraction:
         """Converts degrees to a normalized continuous zodiac offset in turns [0, 1)."""
-        return self.p.sgang_base
+        return self._sgang_base
 
     # ---------------------------------------------------------
     # Continuous Physics (The Diagnostic Interface)
@@ -118,22 +140,31 @@ class RationalMonthEngine(MonthEngineProtocol):
         Returns the mean physical time (Days since J2000.0 TT) for absolute lunation l.
         Inverts the linear mean elongation system: E_mean(t) = A + B*t = l
         """
-        return (Fraction(l) - self.p.A_elong) / self.p.B_elong
+        if not isinstance(l, (int, Fraction)):
+            l = Fraction(l)
+        return (l - self.p.A_elong) / self.p.B_elong
 
     def true_date(self, l: NumT) -> Fraction:
         """
         Returns the true physical time (Days since J2000.0 TT) for absolute lunation l.
         Uses Picard iteration to solve: E_true(t) = l.
         """
-        return self.elong_series.picard_solve(Fraction(l), iterations=self.p.iterations,invB_prec=self.p.invB_elong_prec)
+        return self._true_date(l)
+
+    def _solve_true_date(self, l: NumT) -> Fraction:
+        # Integer lunations (the normal case) feed the solver as plain ints
+        if not isinstance(l, (int, Fraction)):
+            l = Fraction(l)
+        return self.elong_series.picard_solve(
+            l, iterations=self.p.iterations, invB_prec=self.p.invB_elong_prec, tol_bits=PICARD_TOL_BITS
+        )
 
     def get_l_from_t2000(self, t2000: NumT) -> int:
         """
         Inverse kinematic lookup. Returns the active absolute lunation index (l) 
         that covers the given physical time (Days since J2000.0 TT).
         """
-        from fractions import Fraction
-        target = Fraction(t2000)
+        target = t2000 if isinstance(t2000, (int, Fraction)) else Fraction(t2000)
         
         # 1. Provide an extremely close starting guess based on the elongation series.
         # In this engine, 1 turn of elongation = 1 absolute lunation.
@@ -161,6 +192,9 @@ class RationalMonthEngine(MonthEngineProtocol):
         return frac_turn(self.solar_series.eval(t_tt))
 
     def first_lunation(self, year: int) -> int:
+        return self._first_lunation(year)
+
+    def _find_first_lunation(self, year: int) -> int:
         for m in range(1, 13):
             lunations = self.get_lunations(year, m)
             if lunations:
@@ -175,68 +209,66 @@ class RationalMonthEngine(MonthEngineProtocol):
         Returns the absolute zodiac/sgang transit index for a given lunation n.
         (Unchanged: Represents the raw background transit count).
         """
-        from fractions import Fraction
+        return self._sgang_index(n)
+
+    def _solve_sgang_index(self, n: int) -> int:
         t_tt = self.true_date(n)
-        abs_sun = self.solar_series.eval(t_tt) - self.p.sgang_base
-        z_frac = abs_sun * Fraction(12, 1)
-        return z_frac.numerator // z_frac.denominator
+
+        # Only the floor is needed: take it from the float64 solar series
+        # unless 12*(sun - sgang_base) lies within the guard band of an
+        # integer, where the exact evaluation below decides.
+        z = 12.0 * (self.solar_series.eval_f64(float(t_tt)) - self._sgang_base_f64)
+        k = math.floor(z)
+        tol = _SGANG_F64_TOL * (1.0 + abs(z))
+        if tol < z - k < 1.0 - tol:
+            return k
+
+        sun = self.solar_series.eval(t_tt)
+        # floor(12 * (sun - sgang_base)) on cross-multiplied ints: no Fraction, no gcd
+        bn, bd = self._sgang_base_nd
+        sn, sd = sun.numerator, sun.denominator
+        return (12 * (sn * bd - bn * sd)) // (sd * bd)
 
     def _absolute_name(self, n: int) -> int:
         """
         Internal helper: Evaluates the containment rule interval for lunation n.
         Returns the absolute continuous civil name N_n based on chosen conventions.
         """
-        Z_n = self.sgang_index(n)
-        Z_prev = self.sgang_index(n - 1)
-        delta_Z = Z_n - Z_prev  # How many transits were contained in this lunation?
-        
-        if delta_Z == 1:
-            return Z_n  # Standard month: contains exactly 1 transit
-            
-        elif delta_Z == 0:
-            # Leap Month: Contains NO transits. Borrow a name from adjacent posts.
-            if self.p.leap_naming == "previous":
-                return Z_n
-            else:  # "following"
-                return Z_n + 1
-                
-        elif delta_Z == 2:
-            # Skipped Month: Contains TWO transits. We must drop one name.
-            if self.p.skipped_naming == "first":
-                return Z_n - 1  # Keeps the first transit name, skips the second
-            else:  # "second"
-                return Z_n      # Keeps the second transit name, skips the first
-                
-        else:
-            # Fallback for impossible astronomical deltas
-            return Z_n
+        return self._name_from_transits(self.sgang_index(n - 1), self.sgang_index(n))
+
+    def _name_from_transits(self, Z_prev: int, Z_n: int) -> int:
+        """
+        Containment rule on the transit counts bounding lunation n.
+        delta_Z = 1 is a standard month, 0 a leap month (borrows a name from
+        the adjacent posts), 2 a skipped month (drops one of its two names);
+        any other delta cannot occur astronomically and keeps Z_n.
+        """
+        delta_Z = Z_n - Z_prev
+        if 0 <= delta_Z <= 2:
+            return Z_n + self._name_shift[delta_Z]
+        return Z_n
 
     def label_from_lunation(self, n: int) -> Tuple[int, int, int]:
         """
         Assigns civil labels strictly based on the sgang1_deg absolute anchor.
         """
-        N_n = self._absolute_name(n)
+        # The names of n-1, n, n+1 need the four transit counts around them;
+        # fetch them once and derive every label from the same window.
+        sgang = self.sgang_index
+        Z_m2, Z_m1, Z_n, Z_p1 = sgang(n - 2), sgang(n - 1), sgang(n), sgang(n + 1)
+        name = self._name_from_transits
+        N_prev, N_n, N_next = name(Z_m2, Z_m1), name(Z_m1, Z_n), name(Z_n, Z_p1)
         
         # 1. Absolute Month: N_n = 0 is strictly the interval starting at sgang1_deg
-        M = (N_n % 12) + 1
-        
         # 2. Year Anchoring: We tie Y0 to the year-cycle of lunation n=0.
         # N_n // 12 automatically increments exactly when M rolls over from 12 to 1.
-        N_0 = self._absolute_name(0)
-        year_of_N0 = N_0 // 12
-        
-        Y = self.p.Y0 + (N_n // 12) - year_of_N0
+        q, r = divmod(N_n, 12)
+        M = r + 1
+        Y = self.p.Y0 + q - self._year_of_N0
         
-        # 3. Leap State (Unchanged, purely physical)
-        N_prev = self._absolute_name(n - 1)
-        N_next = self._absolute_name(n + 1)
-        
-        if N_n == N_prev:
-            leap_state = 2
-        elif N_n == N_next:
-            leap_state = 1
-        else:
-            leap_state = 0
+        # 3. Leap State (purely physical): second of a repeated name is 2,
+        # first is 1, otherwise 0.
+        leap_state = 2 if N_n == N_prev else (1 if N_n == N_next else 0)
             
         return Y, M, leap_state
 
@@ -255,32 +287,44 @@ class RationalMonthEngine(MonthEngineProtocol):
     def get_lunations(self, year: int, month: int) -> List[int]:
         from fractions import Fraction
         
-        N_0 = self._absolute_name(0)
-        year_of_N0 = N_0 // 12
-        
         # Target absolute N based purely on the requested year and month
-        N_target = 12 * (year - self.p.Y0 + year_of_N0) + (month - 1)
+        N_target = 12 * (year - self.p.Y0 + self._year_of_N0) + (month - 1)
         
         # 1. Guessing step
-        S_target = Fraction(N_target, 12) + self.p.sgang_base
+        S_target = Fraction(N_target, 12) + self._sgang_base
         t_guess = (S_target - self.p.A_sun) / self.p.B_sun
         n_guess_frac = self.p.A_elong + self.p.B_elong * t_guess
         n = n_guess_frac.numerator // n_guess_frac.denominator
         
-        # 2. Seek backward
-        while self._absolute_name(n) >= N_target:
-            n -= 1
-            
-        # 3. Seek forward
-        while self._absolute_name(n) < N_target:
-            n += 1
-            
+        name = self._absolute_name
+        N = name(n)
+
+        # 2. Predict: names advance about one per lunation, so jump by the gap
+        for _ in range(2):
+            if N == N_target:
+                break
+            n += N_target - N
+            N = name(n)
+
+        # 3. Settle on the first lunation whose name reaches N_target
+        if N >= N_target:
+            while True:
+                N_prev = name(n - 1)
+                if N_prev < N_target:
+                    break
+                n, N = n - 1, N_prev
+        else:
+            while N < N_target:
+                n += 1
+                N = name(n)
+
         # 4. Collect
         results = []
-        while self._absolute_name(n) == N_target:
+        while N == N_target:
             results.append(n)
             n += 1
-            
+            N = name(n)
+
         return results
 
     # ---------------------------------------------------------
@@ -303,4 +347,4 @@ class RationalMonthEngine(MonthEngineProtocol):
         return self.elong_series.base(t2000) + self.solar_series.base(t2000)
 
     def true_moon_tt(self, t2000: NumT) -> Fraction:
-        return self.elong_series.eval(t2000) + self.solar_series.eval(t2000)
\ No newline at end of file
+        return self.moon_series.eval(t2000)
\ No newline at end of file
@@ -10,15 +10,15 @@ from dataclasses import dataclass
 from fractions import Fraction
 from typing import Callable, Dict
 
+from caltib.core.types import _SLOTS
 from caltib.engines.interfaces import PlanetsEngineProtocol, NumT
 from caltib.engines.astro.affine_series import AffineTabSeriesT
+from caltib.engines.astro.rational import frac_turn
 
-def frac_turn(val: Fraction) -> Fraction:
-    """Wraps a fractional turn to [0, 1)."""
-    q = val.numerator // val.denominator
-    return val - Fraction(q, 1)
+_HALF_TURN = Fraction(1, 2)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **_SLOTS)
 class RationalPlanetsParams:
     epoch_k: int
     
@@ -61,7 +61,7 @@ class RationalPlanetsEngine(PlanetsEngineProtocol):
             
         # Geocentric Sun is exactly opposite the Heliocentric Earth
         if planet == "sun":
-            return frac_turn(self.p.helio_series["earth"].base(t) + Fraction(1, 2))
+            return frac_turn(self.p.helio_series["earth"].base(t) + _HALF_TURN)
             
         return frac_turn(self.p.helio_series[planet].base(t))
 
@@ -78,7 +78,7 @@ class RationalPlanetsEngine(PlanetsEngineProtocol):
         
         # 2. The Sun: Exactly 180 degrees from True Earth
         if planet == "sun":
-            return frac_turn(L_E + Fraction(1, 2))
+            return frac_turn(L_E + _HALF_TURN)
             
         # 3. Planets: Heliocentric Longitude -> Geocentric Conjunction
         L_P = frac_turn(self.p.helio_series[planet].eval(t))
@@ -93,7 +93,7 @@ class RationalPlanetsEngine(PlanetsEngineProtocol):
         
         # The Conjunction Vector (Assuming Earth r_au = 1.0)
         y = r * sin_alpha
-        x = r * cos_alpha - Fraction(1, 1)
+        x = r * cos_alpha - 1
         
         # Geocentric offset from the Earth's heliocentric longitude
         delta = self.p.arctan2_eval(y, x)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Tuple, Any, Optional
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Tuple, Any, Callable, Dict, Iterator, Optional, Sequence
 from fractions import Fraction
 import warnings
 import math
@@ -40,6 +42,15 @@ S1_TIB = Fraction(65, 804)      # 2; 10, 58, 1, 17 (60, 60, 6, 67)
 A1_STD = Fraction(253, 3528)    # 2; 1 (126)
 A2_STD = Fraction(1, 28)
 
+# Shared Fraction literals (sgang1 anchors in degrees, zero phases),
+# built once and reused by reference across the spec bodies below
+_F0 = Fraction(0, 1)
+_F300 = Fraction(300, 1)
+_F307 = Fraction(307, 1)
+_F308 = Fraction(308, 1)
+_F309 = Fraction(309, 1)
+_F308_2_3 = Fraction(926, 3)  # 308 2/3 degrees
+
 # Shared traditional tables (Appendix A style)
 MOON_TAB_QUARTER = (0, 5, 10, 15, 19, 22, 24, 25)   # length 8 = 28/4+1
 SUN_TAB_QUARTER  = (0, 6, 10, 11)                   # length 4 = 12/4+1
@@ -74,12 +85,16 @@ OPTIMIZED_PER_LUNATION_RATES = {
 
 _OPT = OPTIMIZED_PER_LUNATION_RATES
 
+# Lunations per day, taken once: every per-day rate below is (turns per lunation) * _LUN_PER_DAY,
+# and each product is stored already reduced by Fraction
+_LUN_PER_DAY = Fraction(_OPT["M1"].denominator, _OPT["M1"].numerator)
+
 FUND_RATES_OPTIMIZED = {
-    "S":  _OPT["S1"] / _OPT["M1"],
-    "D":  Fraction(1, 1) / _OPT["M1"],
-    "M":  _OPT["R1"] / _OPT["M1"],
-    "Mp": (Fraction(1, 1) + _OPT["A1"]) / _OPT["M1"],
-    "F":  (Fraction(1, 1) + _OPT["F1"]) / _OPT["M1"],
+    "S":  _OPT["S1"] * _LUN_PER_DAY,
+    "D":  _LUN_PER_DAY,
+    "M":  _OPT["R1"] * _LUN_PER_DAY,
+    "Mp": (1 + _OPT["A1"]) * _LUN_PER_DAY,
+    "F":  (1 + _OPT["F1"]) * _LUN_PER_DAY,
     "M1": _OPT["M1"],
     "S1": _OPT["S1"]
 }
@@ -125,7 +140,7 @@ DT_CONSTANT_DEF = ConstantDeltaTDef(Fraction(69, 1))
 # Quadratic Delta T: -20 + 32 * ((year - 1820) / 100)^2
 DT_QUADRATIC_DEF = QuadraticDeltaTDef(
     a=Fraction(-20, 1), 
-    b=Fraction(0, 1), 
+    b=_F0, 
     c=Fraction(32, 1), 
     y0=Fraction(1820, 1)
 )
@@ -381,8 +396,9 @@ def arith_month(
     Q: int = Q_TIB, 
     m0: Fraction,
     m1: Fraction = M1_TIB,
-    s0: Fraction = Fraction(0, 1), 
-    sgang1_deg: Fraction = Fraction(307, 1)
+    s0: Fraction = _F0, 
+    sgang1_deg: Fraction = _F307,
+    epoch_k: Optional[int] = None
 ) -> ArithmeticMonthParams:
     
     # 1. Y0 Resolution
@@ -438,7 +454,7 @@ def arith_month(
         )
             
     return ArithmeticMonthParams(
-        epoch_k=k_from_epoch_jd(m0),  
+        epoch_k=k_from_epoch_jd(m0) if epoch_k is None else epoch_k,
         sgang1_deg=sgang1_deg,
         Y0=resolved_Y0, 
         M0=resolved_M0, 
@@ -457,15 +473,16 @@ def rational_month(
     solar_table: Tuple[Tuple[Any, ...], ...] = (),
     lunar_table: Tuple[Tuple[Any, ...], ...] = (),
     iterations: int = 1,
-    moon_tab_quarter: Tuple[int, ...] = MOON_TAB_QUARTER,
-    sun_tab_quarter: Tuple[int, ...] = SUN_TAB_QUARTER,
-    sgang1_deg: Fraction = Fraction(307, 1),
+    moon_tab_quarter: Sequence[int] = MOON_TAB_QUARTER,
+    sun_tab_quarter: Sequence[int] = SUN_TAB_QUARTER,
+    sgang1_deg: Fraction = _F307,
     leap_labeling: str = "first_is_leap",  # The "Outside" View
     skipped_naming: str = "second",
     invB_prec: Optional[Fraction] = None,
-    C_sun: Fraction = Fraction(0,1), 
-    C_elong: Fraction = Fraction(0,1),
-    include_drift: bool = False
+    C_sun: Fraction = _F0, 
+    C_elong: Fraction = _F0,
+    include_drift: bool = False,
+    epoch_k: Optional[int] = None
 ) -> RationalMonthParams:
 
     # Translate the civil labeling into the physical naming convention
@@ -485,11 +502,11 @@ def rational_month(
     )
 
     return RationalMonthParams(
-        epoch_k=k_from_epoch_jd(funds["m0"]),
+        epoch_k=k_from_epoch_jd(funds["m0"]) if epoch_k is None else epoch_k,
         A_sun=funds["S"].c0, B_sun=funds["S"].c1, C_sun=C_sun, solar_terms=solar_terms,
         A_elong=funds["D"].c0, B_elong=funds["D"].c1, C_elong=C_elong, lunar_terms=lunar_terms,
         iterations=iterations, 
-        moon_tab_quarter=moon_tab_quarter, sun_tab_quarter=sun_tab_quarter,
+        moon_tab_quarter=tuple(moon_tab_quarter), sun_tab_quarter=tuple(sun_tab_quarter),
         Y0=y0_from_epoch_jd(funds["m0"]), sgang1_deg=sgang1_deg,
         leap_naming=leap_naming, skipped_naming=skipped_naming,
         invB_elong_prec=invB_prec
@@ -499,10 +516,12 @@ def trad_day(
     *, 
     m0: Fraction, s0: Fraction, a0: Fraction, 
     m1: Fraction = M1_TIB, s1: Fraction = S1_TIB, a1: Fraction = A1_STD, a2: Fraction = A2_STD, 
-    location: LocationSpec = LOC_TIBET_APPROX
+    location: LocationSpec = LOC_TIBET_APPROX,
+    epoch_k: Optional[int] = None
 ) -> TraditionalDayParams:
     return TraditionalDayParams(
-        epoch_k=k_from_epoch_jd(m0),  # Deduce Day epoch_k directly from m0
+        # Deduce Day epoch_k directly from m0 unless the caller already has it
+        epoch_k=k_from_epoch_jd(m0) if epoch_k is None else epoch_k,
         m0=m0, m1=m1, m2=m1 / 30,
         s0=s0, s1=s1, s2=s1 / 30,
         a0=a0, a1=a1, a2=a2,
@@ -520,12 +539,13 @@ def rational_day(
     iterations: int = 1,
     delta_t: DeltaTDef = DT_CONSTANT_DEF,
     sunrise: SunriseDef = DAWN_600AM_DEF,
-    moon_tab_quarter: Tuple[int, ...] = MOON_TAB_QUARTER,
-    sun_tab_quarter: Tuple[int, ...] = SUN_TAB_QUARTER,
+    moon_tab_quarter: Sequence[int] = MOON_TAB_QUARTER,
+    sun_tab_quarter: Sequence[int] = SUN_TAB_QUARTER,
     invB_prec: Optional[Fraction] = None,
-    C_sun: Fraction = Fraction(0,1), 
-    C_elong: Fraction = Fraction(0,1),
-    include_drift: bool = False
+    C_sun: Fraction = _F0, 
+    C_elong: Fraction = _F0,
+    include_drift: bool = False,
+    epoch_k: Optional[int] = None
 ) -> RationalDayParams:
     
     # Compile the pure data TermDefs
@@ -537,11 +557,11 @@ def rational_day(
     )
     
     return RationalDayParams(
-        epoch_k=k_from_epoch_jd(funds["m0"]),
+        epoch_k=k_from_epoch_jd(funds["m0"]) if epoch_k is None else epoch_k,
         A_sun=funds["S"].c0, B_sun=funds["S"].c1, solar_terms=solar_terms,
         A_elong=funds["D"].c0, B_elong=funds["D"].c1, lunar_terms=lunar_terms,
         iterations=iterations, delta_t=delta_t, sunrise=sunrise, location=location,
-        moon_tab_quarter=moon_tab_quarter, sun_tab_quarter=sun_tab_quarter,
+        moon_tab_quarter=tuple(moon_tab_quarter), sun_tab_quarter=tuple(sun_tab_quarter),
         invB_elong_prec=invB_prec,
         C_sun=C_sun, C_elong=C_elong
     )
@@ -610,6 +630,7 @@ def arith_day(
     U: int = 11312,
     V: int = 11135,
     dawn_time: Fraction = Fraction(1, 4),  # 6:00 AM (1/4 of a day past midnight)
+    epoch_k: Optional[int] = None,
 ) -> ArithmeticDayParams:
     """Auto-computes delta_star phase shifts natively for either absolute or local m0."""
     
@@ -636,7 +657,7 @@ def arith_day(
     delta_star = -((-shift_frac.numerator) // shift_frac.denominator) - 1
 
     return ArithmeticDayParams(
-        epoch_k=k_from_epoch_jd(m0_abs),
+        epoch_k=k_from_epoch_jd(m0_abs) if epoch_k is None else epoch_k,
         location=location,
         U=U, V=V, delta_star=delta_star,
         m0_abs=m0_abs, m0_loc=m0_loc, s0=s0, s1=s1
@@ -686,6 +707,65 @@ def trad_planets(
         sighra_tables=sighra_tables
     )
 
+# ============================================================
+# LAZY SPEC REGISTRY
+# ============================================================
+# Each *_SPEC constant is built on first access (PEP 562 module __getattr__)
+# and then stored as a plain module global, so importing this module only
+# evaluates the shared constants, and a caller needing one engine builds one.
+
+_SPEC_BUILDERS: Dict[str, Callable[[], CalendarSpec]] = {}
+
+
+def _lazy_spec(name: str) -> Callable[[Callable[[], CalendarSpec]], Callable[[], CalendarSpec]]:
+    """Registers the decorated function as the builder of the module constant `name`."""
+    def register(builder: Callable[[], CalendarSpec]) -> Callable[[], CalendarSpec]:
+        _SPEC_BUILDERS[name] = builder
+        return builder
+    return register
+
+
+def _spec(name: str) -> CalendarSpec:
+    """The spec constant `name`, built and cached on first use."""
+    spec = globals().get(name)
+    if spec is None:
+        # Specs are now built inside user calls, not at import: their known
+        # alignment notes (explicit published constants) must not leak out.
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message=r"(Year|Phase) Alignment Warning", category=UserWarning)
+            spec = globals()[name] = _SPEC_BUILDERS[name]()
+    return spec
+
+
+def __getattr__(name: str) -> CalendarSpec:
+    if name not in _SPEC_BUILDERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _spec(name)
+
+
+class _LazySpecs(Mapping):
+    """Read-only registry view: key -> spec constant name, built on lookup."""
+
+    def __init__(self, names: Dict[str, str]):
+        self.names = MappingProxyType(dict(names))
+
+    def __getitem__(self, key: str) -> CalendarSpec:
+        return _spec(self.names[key])
+
+    def __contains__(self, key: object) -> bool:
+        # Membership is a name check: it must not build the spec
+        return key in self.names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.names!r})"
+
+
 # ============================================================
 # TRADITIONAL ENGINE SPECIFICATIONS
 # ============================================================
@@ -697,26 +777,28 @@ PHUGPA_E1927_M0 = Fraction(13715647089, 5656) # 2424972 + 0; 57, 53, 2, 20 (60,
 PHUGPA_E1927_S0 = Fraction(749,804)           # 25; 9, 10, 4, 32 (60, 60, 6, 67)
 PHUGPA_E1927_A0 = Fraction(1741,3528)         # 13; 103 (126)
 
-PHUGPA_SPEC = CalendarSpec(
-    id=EngineId("trad", "phugpa", "0.1"),
-    month_params=arith_month(
-        Y0=1927, M0=3, beta_star=55, tau=48, 
-        m0=PHUGPA_E1927_M0, s0=PHUGPA_E1927_S0,
-        sgang1_deg=Fraction(308, 1)
-    ),
-    day_params=trad_day(
-        m0=PHUGPA_E1927_M0,
-        s0=PHUGPA_E1927_S0,
-        a0=PHUGPA_E1927_A0,
-    ),
-    planets_params=trad_planets(
-        m0=PHUGPA_E1927_M0,
-        s0=PHUGPA_E1927_S0,
-        pd0={"mars": 157, "jupiter": 3964, "saturn": 6286, "mercury": 4639, "venus": 301, "rahu": 187}
-    ),
-    leap_labeling="first_is_leap",
-    meta={"epoch": "E1927", "tradition": "phugpa"},
-)
+@_lazy_spec("PHUGPA_SPEC")
+def _build_phugpa_spec() -> CalendarSpec:
+    return CalendarSpec(
+        id=EngineId("trad", "phugpa", "0.1"),
+        month_params=arith_month(
+            Y0=1927, M0=3, beta_star=55, tau=48, 
+            m0=PHUGPA_E1927_M0, s0=PHUGPA_E1927_S0,
+            sgang1_deg=_F308
+        ),
+        day_params=trad_day(
+            m0=PHUGPA_E1927_M0,
+            s0=PHUGPA_E1927_S0,
+            a0=PHUGPA_E1927_A0,
+        ),
+        planets_params=trad_planets(
+            m0=PHUGPA_E1927_M0,
+            s0=PHUGPA_E1927_S0,
+            pd0={"mars": 157, "jupiter": 3964, "saturn": 6286, "mercury": 4639, "venus": 301, "rahu": 187}
+        ),
+        leap_labeling="first_is_leap",
+        meta={"epoch": "E1927", "tradition": "phugpa"},
+    )
 
 # ------------------------------------------------------------
 # TSURPHU (E1852) - Jamgon Kongtrul
@@ -725,26 +807,28 @@ TSURPHU_E1852_M0 = Fraction(18307100485903, 7635600) # 2397598 + 0; 9, 24, 2, 5,
 TSURPHU_E1852_S0 = Fraction(23, 27135)               # 0; 1, 22, 2, 4, 18 (60, 60, 6, 13, 67)
 TSURPHU_E1852_A0 = Fraction(1, 49)                   # 0; 72 (126)
 
-TSURPHU_SPEC = CalendarSpec(
-    id=EngineId("trad", "tsurphu", "0.1"),
-    month_params=arith_month(
-        Y0=1852, M0=3, beta_star=14, tau=0, 
-        m0=TSURPHU_E1852_M0, s0=TSURPHU_E1852_S0,
-        sgang1_deg=Fraction(307, 1)
-    ),
-    day_params=trad_day(
-        m0=TSURPHU_E1852_M0,
-        s0=TSURPHU_E1852_S0,
-        a0=TSURPHU_E1852_A0,
-    ),
-    planets_params=trad_planets(
-        m0=TSURPHU_E1852_M0,
-        s0=TSURPHU_E1852_S0,
-        pd0={"mars": 262, "jupiter": 2583, "saturn": 437, "mercury": 3003, "venus": 686, "rahu": 180}
-    ),
-    leap_labeling="first_is_leap",
-    meta={"epoch": "E1852", "tradition": "tsurphu"},
-)
+@_lazy_spec("TSURPHU_SPEC")
+def _build_tsurphu_spec() -> CalendarSpec:
+    return CalendarSpec(
+        id=EngineId("trad", "tsurphu", "0.1"),
+        month_params=arith_month(
+            Y0=1852, M0=3, beta_star=14, tau=0, 
+            m0=TSURPHU_E1852_M0, s0=TSURPHU_E1852_S0,
+            sgang1_deg=_F307
+        ),
+        day_params=trad_day(
+            m0=TSURPHU_E1852_M0,
+            s0=TSURPHU_E1852_S0,
+            a0=TSURPHU_E1852_A0,
+        ),
+        planets_params=trad_planets(
+            m0=TSURPHU_E1852_M0,
+            s0=TSURPHU_E1852_S0,
+            pd0={"mars": 262, "jupiter": 2583, "saturn": 437, "mercury": 3003, "venus": 686, "rahu": 180}
+        ),
+        leap_labeling="first_is_leap",
+        meta={"epoch": "E1852", "tradition": "tsurphu"},
+    )
 
 # ------------------------------------------------------------
 # BHUTAN (E1754) - Lhawang Lodro
@@ -753,28 +837,30 @@ BHUTAN_E1754_M0 = Fraction(1669797601, 707) # 2361807 + 0; 4, 24, 552 (60, 60, 7
 BHUTAN_E1754_S0 = Fraction(1, 67)           # 0; 24, 10, 50 (60, 60, 67)  
 BHUTAN_E1754_A0 = Fraction(17, 147)         # 3; 30 (126) 
 
-BHUTAN_SPEC = CalendarSpec(
-    id=EngineId("trad", "bhutan", "0.1"),
-    month_params=arith_month(
-        Y0=1754, M0=3, beta_star=2, tau=57, # Convenient reparameterization; see [Gantumur, Remark 2.4]
-        m0=BHUTAN_E1754_M0, s0=BHUTAN_E1754_S0,
-        sgang1_deg=Fraction(309, 1)
-    ),
-    day_params=trad_day(
-        m0=BHUTAN_E1754_M0,
-        s0=BHUTAN_E1754_S0,
-        a0=BHUTAN_E1754_A0,
-        location=LOC_BHUTAN_APPROX
-    ),
-    planets_params=trad_planets(
-        m0=BHUTAN_E1754_M0,
-        s0=BHUTAN_E1754_S0,
-        pd0={"mars": 197, "jupiter": 1448, "saturn": 7710, "mercury": 447, "venus": 65, "rahu": 118} 
-        #There is a note by Hennning on Mercury figure
-    ),
-    leap_labeling="second_is_leap",
-    meta={"epoch": "E1754", "tradition": "bhutan", "leap_labeling": "second_is_leap (simplified)"},
-)
+@_lazy_spec("BHUTAN_SPEC")
+def _build_bhutan_spec() -> CalendarSpec:
+    return CalendarSpec(
+        id=EngineId("trad", "bhutan", "0.1"),
+        month_params=arith_month(
+            Y0=1754, M0=3, beta_star=2, tau=57, # Convenient reparameterization; see [Gantumur, Remark 2.4]
+            m0=BHUTAN_E1754_M0, s0=BHUTAN_E1754_S0,
+            sgang1_deg=_F309
+        ),
+        day_params=trad_day(
+            m0=BHUTAN_E1754_M0,
+            s0=BHUTAN_E1754_S0,
+            a0=BHUTAN_E1754_A0,
+            location=LOC_BHUTAN_APPROX
+        ),
+        planets_params=trad_planets(
+            m0=BHUTAN_E1754_M0,
+            s0=BHUTAN_E1754_S0,
+            pd0={"mars": 197, "jupiter": 1448, "saturn": 7710, "mercury": 447, "venus": 65, "rahu": 118} 
+            #There is a note by Hennning on Mercury figure
+        ),
+        leap_labeling="second_is_leap",
+        meta={"epoch": "E1754", "tradition": "bhutan", "leap_labeling": "second_is_leap (simplified)"},
+    )
 
 # ------------------------------------------------------------
 # MONGOL (E1747) - Sumpa Khenpo Yeshe Paljor: New Genden / Tögsbuyant
@@ -783,27 +869,29 @@ MONGOL_E1747_M0 = Fraction(6671924839, 2828) # 2359237 + 0; 55, 13, 3, 31, 394 (
 MONGOL_E1747_S0 = Fraction(397, 402)         # 26; 39, 51, 0, 18 (60, 60, 6, 67)
 MONGOL_E1747_A0 = Fraction(1523, 1764)       # 24; 22 (126)
 
-MONGOL_SPEC = CalendarSpec(
-    id=EngineId("trad", "mongol", "0.1"),
-    month_params=arith_month(
-        Y0=1747, M0=3, beta_star=10, tau=46, 
-        m0=MONGOL_E1747_M0, s0=MONGOL_E1747_S0,
-        sgang1_deg=Fraction(308, 1)+Fraction(2, 3)
-    ),
-    day_params=trad_day(
-        m0=MONGOL_E1747_M0,
-        s0=MONGOL_E1747_S0,
-        a0=MONGOL_E1747_A0,
-        location=LOC_MONGOLIA_APPROX
-    ),
-    planets_params=trad_planets(
-        m0=MONGOL_E1747_M0,
-        s0=MONGOL_E1747_S0,
-        pd0={"mars": 375, "jupiter": 3213, "saturn": 5147, "mercury": 2518, "venus": 1329, "rahu": 32}
-    ),
-    leap_labeling="first_is_leap",
-    meta={"epoch": "E1747", "tradition": "mongol"},
-)
+@_lazy_spec("MONGOL_SPEC")
+def _build_mongol_spec() -> CalendarSpec:
+    return CalendarSpec(
+        id=EngineId("trad", "mongol", "0.1"),
+        month_params=arith_month(
+            Y0=1747, M0=3, beta_star=10, tau=46, 
+            m0=MONGOL_E1747_M0, s0=MONGOL_E1747_S0,
+            sgang1_deg=_F308_2_3
+        ),
+        day_params=trad_day(
+            m0=MONGOL_E1747_M0,
+            s0=MONGOL_E1747_S0,
+            a0=MONGOL_E1747_A0,
+            location=LOC_MONGOLIA_APPROX
+        ),
+        planets_params=trad_planets(
+            m0=MONGOL_E1747_M0,
+            s0=MONGOL_E1747_S0,
+            pd0={"mars": 375, "jupiter": 3213, "saturn": 5147, "mercury": 2518, "venus": 1329, "rahu": 32}
+        ),
+        leap_labeling="first_is_leap",
+        meta={"epoch": "E1747", "tradition": "mongol"},
+    )
 
 # ============================================================
 # NON-STANDARD & EARLY CALENDRICAL MODELS
@@ -824,28 +912,30 @@ KARANA_P_RATES = dict(P_RATES)
 KARANA_P_RATES["sun"] = S1_KAR / M1_KAR
 KARANA_P_RATES["rahu"] = RAHU_LUN / M1_KAR
 
-KARANA_SPEC = CalendarSpec(
-    id=EngineId("trad", "karana", "0.1"),
-    month_params=arith_month(
-        Y0=806, M0=3, beta_star=0, tau=63, # [Janson, (A.38)]
-        m0=KARANA_E806_M0, s0=KARANA_E806_S0, m1=M1_KAR,
-        sgang1_deg=Fraction(300, 1)
-    ),
-    day_params=trad_day(
-        m0=KARANA_E806_M0,
-        s0=KARANA_E806_S0,
-        a0=KARANA_E806_A0,
-        m1=M1_KAR, s1=S1_KAR,
-    ),
-    planets_params=trad_planets(
-        m0=KARANA_E806_M0,
-        s0=KARANA_E806_S0,
-        pd0={"mars": 167, "jupiter": 1732, "saturn": 5946, "mercury": 1674, "venus": 2163, "rahu": 122},
-        p_rates=KARANA_P_RATES
-    ),
-    leap_labeling="second_is_leap",
-    meta={"epoch": "E806", "tradition": "karana"},
-)
+@_lazy_spec("KARANA_SPEC")
+def _build_karana_spec() -> CalendarSpec:
+    return CalendarSpec(
+        id=EngineId("trad", "karana", "0.1"),
+        month_params=arith_month(
+            Y0=806, M0=3, beta_star=0, tau=63, # [Janson, (A.38)]
+            m0=KARANA_E806_M0, s0=KARANA_E806_S0, m1=M1_KAR,
+            sgang1_deg=_F300
+        ),
+        day_params=trad_day(
+            m0=KARANA_E806_M0,
+            s0=KARANA_E806_S0,
+            a0=KARANA_E806_A0,
+            m1=M1_KAR, s1=S1_KAR,
+        ),
+        planets_params=trad_planets(
+            m0=KARANA_E806_M0,
+            s0=KARANA_E806_S0,
+            pd0={"mars": 167, "jupiter": 1732, "saturn": 5946, "mercury": 1674, "venus": 2163, "rahu": 122},
+            p_rates=KARANA_P_RATES
+        ),
+        leap_labeling="second_is_leap",
+        meta={"epoch": "E806", "tradition": "karana"},
+    )
 
 # ------------------------------------------------------------
 # SAKYA SRIBHADRA (E1206): Slightly diffeent from Kalacakra (Karana)
@@ -854,28 +944,30 @@ SRIBHADRA_E1206_M0 = m0_from_trad(2161884, (2, 0), radices=(60, 60))           #
 SRIBHADRA_E1206_S0 = s0_from_trad(18, (27, 47, 4, 2), radices=(60, 60, 6, 13)) # Kalacakra + small
 SRIBHADRA_E1206_A0 = a0_from_trad(17, (28,))                                   # Kalacakra
 
-SRIBHADRA_SPEC = CalendarSpec(
-    id=EngineId("trad", "sribhadra", "0.1"),
-    month_params=arith_month(
-        Y0=1206, M0=3, beta_star=0, tau=63, # the value of tau is a guess
-        m0=SRIBHADRA_E1206_M0, s0=SRIBHADRA_E1206_S0, m1=M1_KAR,
-        sgang1_deg=Fraction(300, 1)
-    ),
-    day_params=trad_day(
-        m0=SRIBHADRA_E1206_M0,
-        s0=SRIBHADRA_E1206_S0,
-        a0=SRIBHADRA_E1206_A0,
-        m1=M1_KAR, s1=S1_KAR
-    ),
-    planets_params=trad_planets(
-        m0=SRIBHADRA_E1206_M0,
-        s0=SRIBHADRA_E1206_S0,
-        pd0={"mars": 189, "jupiter": 797, "saturn": 1575, "mercury": 7563, "venus": 1174, "rahu": 18},
-        p_rates=KARANA_P_RATES
-    ),
-    leap_labeling="first_is_leap",
-    meta={"epoch": "E1206", "tradition": "Sakya Sribhadra"},
-)
+@_lazy_spec("SRIBHADRA_SPEC")
+def _build_sribhadra_spec() -> CalendarSpec:
+    return CalendarSpec(
+        id=EngineId("trad", "sribhadra", "0.1"),
+        month_params=arith_month(
+            Y0=1206, M0=3, beta_star=0, tau=63, # the value of tau is a guess
+            m0=SRIBHADRA_E1206_M0, s0=SRIBHADRA_E1206_S0, m1=M1_KAR,
+            sgang1_deg=_F300
+        ),
+        day_params=trad_day(
+            m0=SRIBHADRA_E1206_M0,
+            s0=SRIBHADRA_E1206_S0,
+            a0=SRIBHADRA_E1206_A0,
+            m1=M1_KAR, s1=S1_KAR
+        ),
+        planets_params=trad_planets(
+            m0=SRIBHADRA_E1206_M0,
+            s0=SRIBHADRA_E1206_S0,
+            pd0={"mars": 189, "jupiter": 797, "saturn": 1575, "mercury": 7563, "venus": 1174, "rahu": 18},
+            p_rates=KARANA_P_RATES
+        ),
+        leap_labeling="first_is_leap",
+        meta={"epoch": "E1206", "tradition": "Sakya Sribhadra"},
+    )
 
 # ------------------------------------------------------------
 # THU'U BKWAN BLO BZANG CHOS KYI NYI MA (E1796) Similar to Tögsbuyant but not identical
@@ -884,26 +976,28 @@ TUKWAN_E1796_M0 = m0_from_trad(2377133, (24, 44, 1, 565))  # Unique
 TUKWAN_E1796_S0 = s0_from_trad(26, (27, 45, 4, 2))         # Tögsbuyant value
 TUKWAN_E1796_A0 = a0_from_trad(8, (52,))                   # Unique
 
-TUKWAN_SPEC = CalendarSpec(
-    id=EngineId("trad", "thukwan", "0.1"),
-    month_params=arith_month(
-        Y0=1796, M0=3, beta_star=16, tau=0,
-        m0=TUKWAN_E1796_M0, s0=TUKWAN_E1796_S0,
-        sgang1_deg=Fraction(308, 1)
-    ),
-    day_params=trad_day(
-        m0=TUKWAN_E1796_M0,
-        s0=TUKWAN_E1796_S0,
-        a0=TUKWAN_E1796_A0,
-    ),
-    planets_params=trad_planets(
-        m0=TUKWAN_E1796_M0,
-        s0=TUKWAN_E1796_S0,
-        pd0={"mars": 408, "jupiter": 3780, "saturn": 1518, "mercury": 6303, "venus": 522, "rahu": 178}
-    ),
-    leap_labeling="first_is_leap",
-    meta={"epoch": "E1796", "tradition": "Tukwan Lobzang Chokyi Nyima (Phugpa variant)"},
-)
+@_lazy_spec("TUKWAN_SPEC")
+def _build_tukwan_spec() -> CalendarSpec:
+    return CalendarSpec(
+        id=EngineId("trad", "thukwan", "0.1"),
+        month_params=arith_month(
+            Y0=1796, M0=3, beta_star=16, tau=0,
+            m0=TUKWAN_E1796_M0, s0=TUKWAN_E1796_S0,
+            sgang1_deg=_F308
+        ),
+        day_params=trad_day(
+            m0=TUKWAN_E1796_M0,
+            s0=TUKWAN_E1796_S0,
+            a0=TUKWAN_E1796_A0,
+        ),
+        planets_params=trad_planets(
+            m0=TUKWAN_E1796_M0,
+            s0=TUKWAN_E1796_S0,
+            pd0={"mars": 408, "jupiter": 3780, "saturn": 1518, "mercury": 6303, "venus": 522, "rahu": 178}
+        ),
+        leap_labeling="first_is_leap",
+        meta={"epoch": "E1796", "tradition": "Tukwan Lobzang Chokyi Nyima (Phugpa variant)"},
+    )
 
 # ------------------------------------------------------------
 # COMBINED SIDDHANTA AND KARANA (E1852) - Jamgon Kongtrul
@@ -919,29 +1013,31 @@ KONGTRUL_P_RATES = dict(P_RATES)
 KONGTRUL_P_RATES["sun"] = S1_KON / M1_KON
 KONGTRUL_P_RATES["rahu"] = RAHU_LUN / M1_KON
 
-KONGTRUL_SPEC = CalendarSpec(
-    id=EngineId("trad", "tsurphu_combined", "0.1"),
-    month_params=arith_month(
-        Y0=1852, M0=3, beta_star=-51, tau=0, # Handles the negative offset
-        m0=KONGTRUL_E1852_M0, s0=KONGTRUL_E1852_S0, m1=M1_KON,
-        sgang1_deg=Fraction(307, 1)
-    ),
-    day_params=trad_day(
-        m0=KONGTRUL_E1852_M0,
-        s0=KONGTRUL_E1852_S0,
-        a0=KONGTRUL_E1852_A0,
-        m1=M1_KON, s1=S1_KON
-    ),
-    planets_params=trad_planets(
-        # The planetary data remains identical to the standard Tsurphu 1852 epoch
-        m0=KONGTRUL_E1852_M0,
-        s0=KONGTRUL_E1852_S0,
-        pd0={"mars": 262, "jupiter": 2583, "saturn": 437, "mercury": 3003, "venus": 686, "rahu": 180},
-        p_rates=KONGTRUL_P_RATES
-    ),
-    leap_labeling="first_is_leap",
-    meta={"epoch": "E1852", "tradition": "Combined Siddhanta and Karana (Tsurphu)"},
-)
+@_lazy_spec("KONGTRUL_SPEC")
+def _build_kongtrul_spec() -> CalendarSpec:
+    return CalendarSpec(
+        id=EngineId("trad", "tsurphu_combined", "0.1"),
+        month_params=arith_month(
+            Y0=1852, M0=3, beta_star=-51, tau=0, # Handles the negative offset
+            m0=KONGTRUL_E1852_M0, s0=KONGTRUL_E1852_S0, m1=M1_KON,
+            sgang1_deg=_F307
+        ),
+        day_params=trad_day(
+            m0=KONGTRUL_E1852_M0,
+            s0=KONGTRUL_E1852_S0,
+            a0=KONGTRUL_E1852_A0,
+            m1=M1_KON, s1=S1_KON
+        ),
+        planets_params=trad_planets(
+            # The planetary data remains identical to the standard Tsurphu 1852 epoch
+            m0=KONGTRUL_E1852_M0,
+            s0=KONGTRUL_E1852_S0,
+            pd0={"mars": 262, "jupiter": 2583, "saturn": 437, "mercury": 3003, "venus": 686, "rahu": 180},
+            p_rates=KONGTRUL_P_RATES
+        ),
+        leap_labeling="first_is_leap",
+        meta={"epoch": "E1852", "tradition": "Combined Siddhanta and Karana (Tsurphu)"},
+    )
 
 # ------------------------------------------------------------
 # KOJO TSEWANG NAMGYAL (E1987) - Sherab Ling Semi-Reformed
@@ -956,28 +1052,30 @@ SHERAB_E1987_A0 = a0_from_trad(19, (111,))
 SHERAB_P_RATES = dict(P_RATES)
 SHERAB_P_RATES["sun"] = S1_NAM / M1_NAM
 
-SHERAB_SPEC = CalendarSpec(
-    id=EngineId("trad", "sherab_ling", "0.1"),
-    month_params=arith_month(
-        Y0=1987, M0=2, beta_star=38, tau=0,
-        m0=SHERAB_E1987_M0, s0=SHERAB_E1987_S0,
-        sgang1_deg=Fraction(307, 1)
-    ),
-    day_params=trad_day(
-        m0=SHERAB_E1987_M0,        
-        s0=SHERAB_E1987_S0,
-        a0=SHERAB_E1987_A0,
-        s1=S1_NAM
-    ),
-    planets_params=trad_planets(
-        m0=SHERAB_E1987_M0,        
-        s0=SHERAB_E1987_S0,
-        pd0={"mars": 94, "jupiter": 4105, "saturn": 6867, "mercury": 6104, "venus": 1561, "rahu": 8},
-        p_rates=SHERAB_P_RATES
-    ),
-    leap_labeling="first_is_leap",
-    meta={"epoch": "E1987", "tradition": "Sherab Ling Semi-Reformed"},
-)
+@_lazy_spec("SHERAB_SPEC")
+def _build_sherab_spec() -> CalendarSpec:
+    return CalendarSpec(
+        id=EngineId("trad", "sherab_ling", "0.1"),
+        month_params=arith_month(
+            Y0=1987, M0=2, beta_star=38, tau=0,
+            m0=SHERAB_E1987_M0, s0=SHERAB_E1987_S0,
+            sgang1_deg=_F307
+        ),
+        day_params=trad_day(
+            m0=SHERAB_E1987_M0,        
+            s0=SHERAB_E1987_S0,
+            a0=SHERAB_E1987_A0,
+            s1=S1_NAM
+        ),
+        planets_params=trad_planets(
+            m0=SHERAB_E1987_M0,        
+            s0=SHERAB_E1987_S0,
+            pd0={"mars": 94, "jupiter": 4105, "saturn": 6867, "mercury": 6104, "venus": 1561, "rahu": 8},
+            p_rates=SHERAB_P_RATES
+        ),
+        leap_labeling="first_is_leap",
+        meta={"epoch": "E1987", "tradition": "Sherab Ling Semi-Reformed"},
+    )
 
 # ============================================================
 # EQUIVALENCE CLASSES: STANDARD TRADITIONS
@@ -992,26 +1090,28 @@ PHUGPA_E1681_M0 = m0_from_trad(2335140, (55, 9, 0, 522))
 PHUGPA_E1681_S0 = s0_from_trad(26, (57, 59, 0, 42))
 PHUGPA_E1681_A0 = a0_from_trad(9, (85,))
 
-PHUGPA_E1681_SPEC = CalendarSpec(
-    id=EngineId("trad", "dharma_sri", "0.1"),
-    month_params=arith_month(
-        Y0=1681, M0=3, beta_star=1, tau=48,
-        m0=PHUGPA_E1681_M0, s0=PHUGPA_E1681_S0,
-        sgang1_deg=Fraction(308, 1)
-    ),
-    day_params=trad_day(
-        m0=PHUGPA_E1681_M0,
-        s0=PHUGPA_E1681_S0,
-        a0=PHUGPA_E1681_A0,
-    ),
-    planets_params=trad_planets(
-        m0=PHUGPA_E1681_M0,
-        s0=PHUGPA_E1681_S0,
-        pd0={"mars": 322, "jupiter": 772, "saturn": 2582, "mercury": 3176, "venus": 781, "rahu": 135}
-    ),
-    leap_labeling="first_is_leap",
-    meta={"epoch": "E1681", "tradition": "Minling Lochen Dharma Sri (Phugpa)"},
-)
+@_lazy_spec("PHUGPA_E1681_SPEC")
+def _build_phugpa_e1681_spec() -> CalendarSpec:
+    return CalendarSpec(
+        id=EngineId("trad", "dharma_sri", "0.1"),
+        month_params=arith_month(
+            Y0=1681, M0=3, beta_star=1, tau=48,
+            m0=PHUGPA_E1681_M0, s0=PHUGPA_E1681_S0,
+            sgang1_deg=_F308
+        ),
+        day_params=trad_day(
+            m0=PHUGPA_E1681_M0,
+            s0=PHUGPA_E1681_S0,
+            a0=PHUGPA_E1681_A0,
+        ),
+        planets_params=trad_planets(
+            m0=PHUGPA_E1681_M0,
+            s0=PHUGPA_E1681_S0,
+            pd0={"mars": 322, "jupiter": 772, "saturn": 2582, "mercury": 3176, "venus": 781, "rahu": 135}
+        ),
+        leap_labeling="first_is_leap",
+        meta={"epoch": "E1681", "tradition": "Minling Lochen Dharma Sri (Phugpa)"},
+    )
 
 # ------------------------------------------------------------
 # GARLAND OF WHITE BERYL (E1687) - Standard Phugpa
@@ -1020,54 +1120,54 @@ PHUGPA_E1687_M0 = m0_from_trad(2337326, (10, 57, 2, 692))
 PHUGPA_E1687_S0 = s0_from_trad(26, (29, 46, 3, 27))
 PHUGPA_E1687_A0 = a0_from_trad(18, (33,))
 
-PHUGPA_E1687_SPEC = CalendarSpec(
-    id=EngineId("trad", "white_beryl", "0.1"),
-    month_params=arith_month(
-        Y0=1687, M0=3, beta_star=15, tau=48,
-        m0=PHUGPA_E1687_M0, s0=PHUGPA_E1687_S0,
-        sgang1_deg=Fraction(308, 1)
-    ),
-    day_params=trad_day(
-        m0=PHUGPA_E1687_M0,
-        s0=PHUGPA_E1687_S0,
-        a0=PHUGPA_E1687_A0,
-    ),
-    planets_params=trad_planets(
-        m0=PHUGPA_E1687_M0,
-        s0=PHUGPA_E1687_S0,
-        pd0={"mars": 447, "jupiter": 2958, "saturn": 4768, "mercury": 1851, "venus": 171, "rahu": 209}
-    ),
-    leap_labeling="first_is_leap",
-    meta={"epoch": "E1687", "tradition": "White Beryl (Phugpa)"},
-)
+@_lazy_spec("PHUGPA_E1687_SPEC")
+def _build_phugpa_e1687_spec() -> CalendarSpec:
+    return CalendarSpec(
+        id=EngineId("trad", "white_beryl", "0.1"),
+        month_params=arith_month(
+            Y0=1687, M0=3, beta_star=15, tau=48,
+            m0=PHUGPA_E1687_M0, s0=PHUGPA_E1687_S0,
+            sgang1_deg=_F308
+        ),
+        day_params=trad_day(
+            m0=PHUGPA_E1687_M0,
+            s0=PHUGPA_E1687_S0,
+            a0=PHUGPA_E1687_A0,
+        ),
+        planets_params=trad_planets(
+            m0=PHUGPA_E1687_M0,
+            s0=PHUGPA_E1687_S0,
+            pd0={"mars": 447, "jupiter": 2958, "saturn": 4768, "mercury": 1851, "venus": 171, "rahu": 209}
+        ),
+        leap_labeling="first_is_leap",
+        meta={"epoch": "E1687", "tradition": "White Beryl (Phugpa)"},
+    )
 
 # ------------------------------------------------------------
 # PHUGPA (E1987)
 # ------------------------------------------------------------
 PHUGPA_E1987_M0 = Fraction(1729968333, 707) # 2446914 + 0;11,27,2,332 (60,60,6,707)
-PHUGPA_E1987_S0 = Fraction(0, 1)            # 0
+PHUGPA_E1987_S0 = _F0                       # 0
 PHUGPA_E1987_A0 = Fraction(38, 49)          # 21,90 (28,126)
 
-PHUGPA_E1987_SPEC = CalendarSpec(
-    id=EngineId("trad", "phugpa", "0.1"),
-    month_params=arith_month(
-        Y0=1987, M0=3, beta_star=0, tau=48, 
-        m0=PHUGPA_E1987_M0, s0=PHUGPA_E1987_S0,
-        sgang1_deg=Fraction(308, 1)
-    ),
-    day_params=trad_day(
-        m0=PHUGPA_E1987_M0,
-        s0=PHUGPA_E1987_S0,
-        a0=PHUGPA_E1927_A0,
-    ),
-    planets_params=trad_planets(
-        m0=PHUGPA_E1927_M0,
-        s0=PHUGPA_E1927_S0,
-        pd0={"mars": 157, "jupiter": 3964, "saturn": 6286, "mercury": 4639, "venus": 301, "rahu": 187}
-    ),
-    leap_labeling="first_is_leap",
-    meta={"epoch": "E1987", "tradition": "phugpa"},
-)
+@_lazy_spec("PHUGPA_E1987_SPEC")
+def _build_phugpa_e1987_spec() -> CalendarSpec:
+    return CalendarSpec(
+        id=EngineId("trad", "phugpa", "0.1"),
+        month_params=arith_month(
+            Y0=1987, M0=3, beta_star=0, tau=48, 
+            m0=PHUGPA_E1987_M0, s0=PHUGPA_E1987_S0,
+            sgang1_deg=_F308
+        ),
+        day_params=trad_day(
+            m0=PHUGPA_E1987_M0,
+            s0=PHUGPA_E1987_S0,
+            a0=PHUGPA_E1927_A0,
+        ),
+        planets_params=_spec("PHUGPA_SPEC").planets_params,  # Same E1927 planetary epoch as PHUGPA_SPEC
+        leap_labeling="first_is_leap",
+        meta={"epoch": "E1987", "tradition": "phugpa"},
+    )
 
 # ------------------------------------------------------------
 # EXCELLENT FLASK OF ESSENTIALS (E1732) - Early Tsurphu
@@ -1076,26 +1176,28 @@ TSURPHU_E1732_M0 = m0_from_trad(2353745, (14, 6, 2, 160)) # Using the equivalent
 TSURPHU_E1732_S0 = s0_from_trad(25, (30, 42, 0, 36))      # Using the equivalent /67 format
 TSURPHU_E1732_A0 = a0_from_trad(14, (99,))
 
-TSURPHU_E1732_SPEC = CalendarSpec(
-    id=EngineId("trad", "tsurphu_flask", "0.1"),
-    month_params=arith_month(
-        Y0=1732, M0=3, beta_star=59, tau=0,
-        m0=TSURPHU_E1732_M0, s0=TSURPHU_E1732_S0,      
-        sgang1_deg=Fraction(307, 1)
-    ),
-    day_params=trad_day(
-        m0=TSURPHU_E1732_M0,
-        s0=TSURPHU_E1732_S0,
-        a0=TSURPHU_E1732_A0,
-    ),
-    planets_params=trad_planets(
-        m0=TSURPHU_E1732_M0,
-        s0=TSURPHU_E1732_S0,
-        pd0={"mars": 377, "jupiter": 2050, "saturn": 10414, "mercury": 7406, "venus": 321, "rahu": 75}
-    ),
-    leap_labeling="first_is_leap",
-    meta={"epoch": "E1732", "tradition": "Excellent Flask of Essentials (Tsurphu)"},
-)
+@_lazy_spec("TSURPHU_E1732_SPEC")
+def _build_tsurphu_e1732_spec() -> CalendarSpec:
+    return CalendarSpec(
+        id=EngineId("trad", "tsurphu_flask", "0.1"),
+        month_params=arith_month(
+            Y0=1732, M0=3, beta_star=59, tau=0,
+            m0=TSURPHU_E1732_M0, s0=TSURPHU_E1732_S0,      
+            sgang1_deg=_F307
+        ),
+        day_params=trad_day(
+            m0=TSURPHU_E1732_M0,
+            s0=TSURPHU_E1732_S0,
+            a0=TSURPHU_E1732_A0,
+        ),
+        planets_params=trad_planets(
+            m0=TSURPHU_E1732_M0,
+            s0=TSURPHU_E1732_S0,
+            pd0={"mars": 377, "jupiter": 2050, "saturn": 10414, "mercury": 7406, "venus": 321, "rahu": 75}
+        ),
+        leap_labeling="first_is_leap",
+        meta={"epoch": "E1732", "tradition": "Excellent Flask of Essentials (Tsurphu)"},
+    )
 
 # ------------------------------------------------------------
 # 14th KARMAPA THEGCHOG DORJE (E1824) - Tsurphu
@@ -1104,53 +1206,55 @@ TSURPHU_E1824_M0 = m0_from_trad(2387351, (2, 35, 0, 596))
 TSURPHU_E1824_S0 = s0_from_trad(25, (34, 43, 5, 19))
 TSURPHU_E1824_A0 = a0_from_trad(3, (103,))
 
-TSURPHU_E1824_SPEC = CalendarSpec(
-    id=EngineId("trad", "karmapa_14", "0.1"),
-    month_params=arith_month(
-        Y0=1824, M0=3, beta_star=57, tau=0,
-        m0=TSURPHU_E1824_M0, s0=TSURPHU_E1824_S0,
-        sgang1_deg=Fraction(307, 1)
-    ),
-    day_params=trad_day(
-        m0=TSURPHU_E1824_M0,
-        s0=TSURPHU_E1824_S0,
-        a0=TSURPHU_E1824_A0,
-    ),
-    planets_params=trad_planets(
-        m0=TSURPHU_E1824_M0,
-        s0=TSURPHU_E1824_S0,
-        pd0={"mars": 320, "jupiter": 1000, "saturn": 956, "mercury": 7552, "venus": 1578, "rahu": 63}
-    ),
-    leap_labeling="first_is_leap",
-    meta={"epoch": "E1824", "tradition": "14th Karmapa (Tsurphu)"},
-)
+@_lazy_spec("TSURPHU_E1824_SPEC")
+def _build_tsurphu_e1824_spec() -> CalendarSpec:
+    return CalendarSpec(
+        id=EngineId("trad", "karmapa_14", "0.1"),
+        month_params=arith_month(
+            Y0=1824, M0=3, beta_star=57, tau=0,
+            m0=TSURPHU_E1824_M0, s0=TSURPHU_E1824_S0,
+            sgang1_deg=_F307
+        ),
+        day_params=trad_day(
+            m0=TSURPHU_E1824_M0,
+            s0=TSURPHU_E1824_S0,
+            a0=TSURPHU_E1824_A0,
+        ),
+        planets_params=trad_planets(
+            m0=TSURPHU_E1824_M0,
+            s0=TSURPHU_E1824_S0,
+            pd0={"mars": 320, "jupiter": 1000, "saturn": 956, "mercury": 7552, "venus": 1578, "rahu": 63}
+        ),
+        leap_labeling="first_is_leap",
+        meta={"epoch": "E1824", "tradition": "14th Karmapa (Tsurphu)"},
+    )
 
 # ------------------------------------------------------------
 
-TRAD_SPECS = {
-    "phugpa": PHUGPA_SPEC,
-    "tsurphu": TSURPHU_SPEC,
-    "mongol": MONGOL_SPEC,
-    "bhutan": BHUTAN_SPEC,
-    "karana": KARANA_SPEC,
-}
-
-TRAD_VAR_SPECS = {
-    "sribhadra": SRIBHADRA_SPEC, 
-    "tukwan": TUKWAN_SPEC, 
-    "kongtrul": KONGTRUL_SPEC, 
-    "sherab": SHERAB_SPEC,
-}
-
-TRAD_EPOCHS_SPECS = {
-    "phugpa-1681": PHUGPA_E1681_SPEC,
-    "phugpa-1687": PHUGPA_E1687_SPEC ,
-    "phugpa-1927": PHUGPA_SPEC, 
-    "phugpa-1987": PHUGPA_E1987_SPEC,
-    "tsurphu-1732": TSURPHU_E1732_SPEC, 
-    "tsurphu-1824": TSURPHU_E1824_SPEC,
-    "tsurphu-1852": TSURPHU_SPEC,
-}
+TRAD_SPECS = _LazySpecs({
+    "phugpa": "PHUGPA_SPEC",
+    "tsurphu": "TSURPHU_SPEC",
+    "mongol": "MONGOL_SPEC",
+    "bhutan": "BHUTAN_SPEC",
+    "karana": "KARANA_SPEC",
+})
+
+TRAD_VAR_SPECS = _LazySpecs({
+    "sribhadra": "SRIBHADRA_SPEC", 
+    "tukwan": "TUKWAN_SPEC", 
+    "kongtrul": "KONGTRUL_SPEC", 
+    "sherab": "SHERAB_SPEC",
+})
+
+TRAD_EPOCHS_SPECS = _LazySpecs({
+    "phugpa-1681": "PHUGPA_E1681_SPEC",
+    "phugpa-1687": "PHUGPA_E1687_SPEC",
+    "phugpa-1927": "PHUGPA_SPEC", 
+    "phugpa-1987": "PHUGPA_E1987_SPEC",
+    "tsurphu-1732": "TSURPHU_E1732_SPEC", 
+    "tsurphu-1824": "TSURPHU_E1824_SPEC",
+    "tsurphu-1852": "TSURPHU_SPEC",
+})
 
 
 
@@ -1177,6 +1281,9 @@ L_FUNDS = make_funds(
     f0=Fraction(91591, 1296000)
 )
 
+# Meeus lunation index of the E1987 anchor, shared by every reform spec
+L_EPOCH_K = k_from_epoch_jd(L_FUNDS["m0"])
+
 # Non-harmonized version:
 L_FUNDS_V1 = make_funds(
     m0=Fraction(160957989449, 65780),
@@ -1247,89 +1354,93 @@ FUND_ACC_SUN_V1   = Fraction(1,  487 * 2**8 * 3**3 * 5**8) # 1 / 131,490,000,000
 FUND_ACC_ELONG_V1 = Fraction(-1, 487 * 2**9 * 3**7 * 5**4) # ~ -13.3 s/cy^2
 
 
+# The L0-L3 reforms share one arithmetic month on the E1987 anchor
+L_ARITH_MONTH = arith_month(
+    P=P_NEW, Q=Q_NEW,
+    sgang1_deg=SGANG1,
+    m0=L_FUNDS["m0"], s0=L_FUNDS["s0"], m1=FUND_RATES["M1"],
+    epoch_k=L_EPOCH_K,
+)
+
 # ============================================================
 # L0 REFORM: Pure Arithmetic Baseline
 # ============================================================
-L0_SPEC = CalendarSpec(
-    id=EngineId("reform", "l0", "0.1"),
-    month_params=arith_month(
-        P=P_NEW, Q=Q_NEW,
-        sgang1_deg=SGANG1,
-        m0=L_FUNDS["m0"], s0=L_FUNDS["s0"], m1=FUND_RATES["M1"],
-    ),
-    day_params=arith_day(
-        location=LOC_LHASA,
-        U=143925, V=141673,
-        m0_abs=L_FUNDS["m0"], s0=L_FUNDS["s0"], s1=FUND_RATES["S1"],
-    ),
-    leap_labeling="first_is_leap",
-    meta={"epoch": "E1987", "description": "L0 Reform: Pure Arithmetic with Meeus constants"}
-)
+@_lazy_spec("L0_SPEC")
+def _build_l0_spec() -> CalendarSpec:
+    return CalendarSpec(
+        id=EngineId("reform", "l0", "0.1"),
+        month_params=L_ARITH_MONTH,
+        day_params=arith_day(
+            location=LOC_LHASA,
+            U=143925, V=141673,
+            m0_abs=L_FUNDS["m0"], s0=L_FUNDS["s0"], s1=FUND_RATES["S1"],
+            epoch_k=L_EPOCH_K,
+        ),
+        leap_labeling="first_is_leap",
+        meta={"epoch": "E1987", "description": "L0 Reform: Pure Arithmetic with Meeus constants"}
+    )
 
 # ============================================================
 # L1 REFORM: Single Anomaly Model ("Modernized traditional")
 # ============================================================
-L1_SPEC = CalendarSpec(
-    id=EngineId("reform", "l1", "0.1"),
-    month_params=arith_month(
-        P=P_NEW, Q=Q_NEW,
-        sgang1_deg=SGANG1, 
-        m0=L_FUNDS["m0"], s0=L_FUNDS["s0"], m1=FUND_RATES["M1"],
-    ),
-    day_params=rational_day(
-        funds=L_FUNDS,
-        solar_table=L_SOLAR_TABLE_1,
-        lunar_table=L_LUNAR_TABLE_1, 
-    ),
-    leap_labeling="first_is_leap",
-    meta={"epoch": "E1987", "description": "L1 Reform: Single anomaly terms, constant sunrise"}
-)
+@_lazy_spec("L1_SPEC")
+def _build_l1_spec() -> CalendarSpec:
+    return CalendarSpec(
+        id=EngineId("reform", "l1", "0.1"),
+        month_params=L_ARITH_MONTH,
+        day_params=rational_day(
+            funds=L_FUNDS,
+            epoch_k=L_EPOCH_K,
+            solar_table=L_SOLAR_TABLE_1,
+            lunar_table=L_LUNAR_TABLE_1, 
+        ),
+        leap_labeling="first_is_leap",
+        meta={"epoch": "E1987", "description": "L1 Reform: Single anomaly terms, constant sunrise"}
+    )
 
 # ============================================================
 # L2 REFORM: Evection and Variation Added
 # ============================================================
-L2_SPEC = CalendarSpec(
-    id=EngineId("reform", "l2", "0.1"),
-    month_params=arith_month(
-        P=P_NEW, Q=Q_NEW,
-        sgang1_deg=SGANG1, 
-        m0=L_FUNDS["m0"], s0=L_FUNDS["s0"], m1=FUND_RATES["M1"],
-    ),
-    day_params=rational_day(
-        funds=L_FUNDS,
-        solar_table=L_SOLAR_TABLE_1,
-        lunar_table=L_LUNAR_TABLE_3, 
-        iterations=1,
-    ),
-    leap_labeling="first_is_leap",
-    meta={"epoch": "E1987", "description": "L2 Reform: 3 lunar terms, constant sunrise"}
-)
+@_lazy_spec("L2_SPEC")
+def _build_l2_spec() -> CalendarSpec:
+    return CalendarSpec(
+        id=EngineId("reform", "l2", "0.1"),
+        month_params=L_ARITH_MONTH,
+        day_params=rational_day(
+            funds=L_FUNDS,
+            epoch_k=L_EPOCH_K,
+            solar_table=L_SOLAR_TABLE_1,
+            lunar_table=L_LUNAR_TABLE_3, 
+            iterations=1,
+        ),
+        leap_labeling="first_is_leap",
+        meta={"epoch": "E1987", "description": "L2 Reform: 3 lunar terms, constant sunrise"}
+    )
 
 # ============================================================
 # L3 REFORM: Full 6-Term Orbit, Spherical Dawn, Quadratic Delta T
 # ============================================================
-L3_SPEC = CalendarSpec(
-    id=EngineId("reform", "l3", "0.1"),
-    month_params=arith_month(
-        P=P_NEW, Q=Q_NEW,
-        sgang1_deg=SGANG1, 
-        m0=L_FUNDS["m0"], s0=L_FUNDS["s0"], m1=FUND_RATES["M1"],
-    ),
-    day_params=rational_day(
-        funds=L_FUNDS,
-        solar_table=L_SOLAR_TABLE_1,
-        lunar_table=L_LUNAR_TABLE_6, 
-        iterations=3,
-        invB_prec=M1_PREC,
-        delta_t=DT_QUADRATIC_DEF,
-        sunrise=DAWN_SPHERICAL_DEF,
-        moon_tab_quarter=SINE_TAB_QUARTER,
-        sun_tab_quarter=SINE_TAB_QUARTER,
-        include_drift=True
-    ),
-    leap_labeling="first_is_leap",
-    meta={"epoch": "E1987", "description": "L3 Reform: 6 lunar terms, spherical dawn, quadratic delta T"}
-)
+@_lazy_spec("L3_SPEC")
+def _build_l3_spec() -> CalendarSpec:
+    return CalendarSpec(
+        id=EngineId("reform", "l3", "0.1"),
+        month_params=L_ARITH_MONTH,
+        day_params=rational_day(
+            funds=L_FUNDS,
+            epoch_k=L_EPOCH_K,
+            solar_table=L_SOLAR_TABLE_1,
+            lunar_table=L_LUNAR_TABLE_6, 
+            iterations=3,
+            invB_prec=M1_PREC,
+            delta_t=DT_QUADRATIC_DEF,
+            sunrise=DAWN_SPHERICAL_DEF,
+            moon_tab_quarter=SINE_TAB_QUARTER,
+            sun_tab_quarter=SINE_TAB_QUARTER,
+            include_drift=True
+        ),
+        leap_labeling="first_is_leap",
+        meta={"epoch": "E1987", "description": "L3 Reform: 6 lunar terms, spherical dawn, quadratic delta T"}
+    )
 
 # ============================================================================
 # FLOAT ENGINE FOURIER TABLES (JPL / Meeus)
@@ -1457,87 +1568,93 @@ FLOAT_ACC_ELONG_V1 = float.fromhex("-0x1.1a5a8662ee151p-48")
 # ============================================================
 L4_LEAP_LABELING = "first_is_leap"
 
-L4_SPEC = CalendarSpec(
-    id=EngineId("reform", "l4", "0.1"),
-    month_params=rational_month(
-        funds=L_FUNDS,
-        solar_table=L_SOLAR_TABLE_1,
-        lunar_table=L_LUNAR_TABLE_1, 
-        iterations=1,
-        sgang1_deg=SGANG1,
+@_lazy_spec("L4_SPEC")
+def _build_l4_spec() -> CalendarSpec:
+    return CalendarSpec(
+        id=EngineId("reform", "l4", "0.1"),
+        month_params=rational_month(
+            funds=L_FUNDS,
+            epoch_k=L_EPOCH_K,
+            solar_table=L_SOLAR_TABLE_1,
+            lunar_table=L_LUNAR_TABLE_1, 
+            iterations=1,
+            sgang1_deg=SGANG1,
+            leap_labeling=L4_LEAP_LABELING,
+            skipped_naming="second",
+            include_drift=True
+        ),
+        day_params=fp_day(
+            epoch_k=L_EPOCH_K, # Uses the exact same rational anchor!
+            location=LOC_LHASA,
+            solar_table=FLOAT_SOLAR_TABLE_2,
+            lunar_table=FLOAT_LUNAR_TABLE_24[:14],
+            iterations=3,
+            include_drift=True
+        ),
         leap_labeling=L4_LEAP_LABELING,
-        skipped_naming="second",
-        include_drift=True
-    ),
-    day_params=fp_day(
-        epoch_k=k_from_epoch_jd(L_FUNDS["m0"]), # Uses the exact same rational anchor!
-        location=LOC_LHASA,
-        solar_table=FLOAT_SOLAR_TABLE_2,
-        lunar_table=FLOAT_LUNAR_TABLE_24[:14],
-        iterations=3,
-        include_drift=True
-    ),
-    leap_labeling=L4_LEAP_LABELING,
-    meta={"epoch": "E1987", "description": "L4 Reform: Primary Astronomical Engine (24-Term Float Day)"}
-)
+        meta={"epoch": "E1987", "description": "L4 Reform: Primary Astronomical Engine (24-Term Float Day)"}
+    )
 
 # ============================================================
 # L5 REFORM: Pure Float Engine (64-Bit FPU)
 # ============================================================
 L5_LEAP_LABELING = "first_is_leap"
 
-L5_SPEC = CalendarSpec(
-    id=EngineId("reform", "l5", "0.1"),
-    month_params=rational_month(
-        funds=L_FUNDS,
-        solar_table=L_SOLAR_TABLE_2,
-        lunar_table=L_LUNAR_TABLE_6, 
-        iterations=2,
-        invB_prec=M1_PREC,
-        moon_tab_quarter=SINE_TAB_QUARTER,
-        sun_tab_quarter=SINE_TAB_QUARTER,
-        sgang1_deg=SGANG1,
+@_lazy_spec("L5_SPEC")
+def _build_l5_spec() -> CalendarSpec:
+    return CalendarSpec(
+        id=EngineId("reform", "l5", "0.1"),
+        month_params=rational_month(
+            funds=L_FUNDS,
+            epoch_k=L_EPOCH_K,
+            solar_table=L_SOLAR_TABLE_2,
+            lunar_table=L_LUNAR_TABLE_6, 
+            iterations=2,
+            invB_prec=M1_PREC,
+            moon_tab_quarter=SINE_TAB_QUARTER,
+            sun_tab_quarter=SINE_TAB_QUARTER,
+            sgang1_deg=SGANG1,
+            leap_labeling=L5_LEAP_LABELING,
+            skipped_naming="second",
+            C_elong=FUND_ACC_ELONG,
+            include_drift=True
+        ),
+        day_params=fp_day(
+            epoch_k=L_EPOCH_K, # Uses the exact same rational anchor!
+            location=LOC_LHASA,
+            solar_table=FLOAT_SOLAR_TABLE_2,
+            lunar_table=FLOAT_LUNAR_TABLE_64,
+            iterations=3,
+            C_elong=FLOAT_ACC_ELONG,
+            include_drift=True
+        ),
         leap_labeling=L5_LEAP_LABELING,
-        skipped_naming="second",
-        C_elong=FUND_ACC_ELONG,
-        include_drift=True
-    ),
-    day_params=fp_day(
-        epoch_k=k_from_epoch_jd(L_FUNDS["m0"]), # Uses the exact same rational anchor!
-        location=LOC_LHASA,
-        solar_table=FLOAT_SOLAR_TABLE_2,
-        lunar_table=FLOAT_LUNAR_TABLE_64,
-        iterations=3,
-        C_elong=FLOAT_ACC_ELONG,
-        include_drift=True
-    ),
-    leap_labeling=L5_LEAP_LABELING,
-    meta={"epoch": "E1987", "description": "L5 Reform: High-Precision Astronomical Engine (64-Term Float Day)"}
-)
+        meta={"epoch": "E1987", "description": "L5 Reform: High-Precision Astronomical Engine (64-Term Float Day)"}
+    )
 
 # ------------------------------------------------------------
 
-REFORM_SPECS = {
-    "reform-l0": L0_SPEC, 
-    "reform-l1": L1_SPEC, 
-    "reform-l2": L2_SPEC, 
-    "reform-l3": L3_SPEC,
-    "reform-l4": L4_SPEC,
-    "reform-l5": L5_SPEC,
-}
-
-ALIASES = {
-    "l0": L0_SPEC,
-    "l1": L1_SPEC,
-    "l2": L2_SPEC,
-    "l3": L3_SPEC,
-    "l4": L4_SPEC,
-    "l5": L5_SPEC,
-}
+REFORM_SPECS = _LazySpecs({
+    "reform-l0": "L0_SPEC", 
+    "reform-l1": "L1_SPEC", 
+    "reform-l2": "L2_SPEC", 
+    "reform-l3": "L3_SPEC",
+    "reform-l4": "L4_SPEC",
+    "reform-l5": "L5_SPEC",
+})
+
+ALIASES = _LazySpecs({
+    "l0": "L0_SPEC",
+    "l1": "L1_SPEC",
+    "l2": "L2_SPEC",
+    "l3": "L3_SPEC",
+    "l4": "L4_SPEC",
+    "l5": "L5_SPEC",
+})
 
 # ------------------------------------------------------------
  
-ALL_SPECS = {**TRAD_SPECS, **REFORM_SPECS, **ALIASES}
+ALL_SPECS = _LazySpecs({**TRAD_SPECS.names, **REFORM_SPECS.names, **ALIASES.names})
 
 # ------------------------------------------------------------
 
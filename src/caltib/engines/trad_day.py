@@ -10,23 +10,21 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from fractions import Fraction
-from typing import Optional, Tuple
+from functools import lru_cache
+from math import lcm
+from typing import List, Optional, Tuple
 
-from caltib.core.types import LocationSpec, SunriseState
+from caltib.core.types import LocationSpec, SunriseState, _SLOTS
 from caltib.engines.interfaces import DayEngineProtocol, NumT
-from caltib.engines.astro.tables import QuarterWaveTable
+from caltib.engines.astro.tables import get_quarter_wave_table
+from caltib.engines.astro.rational import frac_turn_nd
 from caltib.engines.astro.affine_series import PhaseDN, TabTermDN, AffineTabSeriesDN
 
 JD_J2000 = Fraction(2451545, 1)
+JDN_J2000 = 2451545
 
 
-def frac_turn(val: Fraction) -> Fraction:
-    """Wraps a fractional turn to [0, 1)."""
-    q = val.numerator // val.denominator
-    return val - Fraction(q, 1)
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class TraditionalDayParams:
     epoch_k: int
     location: LocationSpec
@@ -87,8 +85,8 @@ class TraditionalDayEngine(DayEngineProtocol):
     def __init__(self, p: TraditionalDayParams):
         self.p = p
 
-        self.moon_table = QuarterWaveTable(quarter=p.moon_tab_quarter)
-        self.sun_table = QuarterWaveTable(quarter=p.sun_tab_quarter)
+        self.moon_table = get_quarter_wave_table(p.moon_tab_quarter)
+        self.sun_table = get_quarter_wave_table(p.sun_tab_quarter)
 
         # Build phases (turns) using the decoupled anomalies
         self.phase_moon = PhaseDN(p.a0, p.a1, p.a2)
@@ -127,18 +125,53 @@ class TraditionalDayEngine(DayEngineProtocol):
             ),
         )
 
+        # Mean date over one common denominator: mean_date is a single
+        # integer affine sum and one Fraction at the return.
+        m_den = lcm(p.m0.denominator, p.m1.denominator, p.m2.denominator)
+        self._m_den = m_den
+        self._m0_num = (p.m0 - JD_J2000).numerator * (m_den // p.m0.denominator)
+        self._m1_num = p.m1.numerator * (m_den // p.m1.denominator)
+        self._m2_num = p.m2.numerator * (m_den // p.m2.denominator)
+
+        # Integer pieces of the mean-rate starting guess in get_x_from_t2000
+        self._x_guess = (p.m0.numerator, p.m0.denominator, p.m2.numerator, p.m2.denominator)
+
+        # Mean sun coefficients over one common denominator, so mean_sun is
+        # a single integer affine sum wrapped with one gcd.
+        s_den = lcm(p.s0.denominator, p.s1.denominator, p.s2.denominator)
+        self._s_den = s_den
+        self._s0_num = p.s0.numerator * (s_den // p.s0.denominator)
+        self._s1_num = p.s1.numerator * (s_den // p.s1.denominator)
+        self._s2_num = p.s2.numerator * (s_den // p.s2.denominator)
+
+        # The engine is immutable, so the absolute true date and true sun of a
+        # tithi are memoized: the inverse walk, civil_jdn and month builders
+        # revisit x-1, x, x+1 of neighbouring tithis constantly.
+        self._true_jd_nd = lru_cache(maxsize=4096)(self._solve_true_jd_nd)
+        self._true_sun_cached = lru_cache(maxsize=4096)(self._solve_true_sun)
+
+        # civil_jdn may skip local_civil_date only while it is this class's own
+        self._civil_is_true = type(self).local_civil_date is TraditionalDayEngine.local_civil_date
+
     # ---------------------------------------------------------
     # Internal Coordinate Mapper
     # ---------------------------------------------------------
-    def _to_nd(self, x: NumT) -> tuple[Fraction, Fraction]:
+    def _to_nd(self, x: NumT) -> Tuple[int, int, int]:
         """
-        Splits the continuous 1D kinematic coordinate x into (n, d)
-        so it can be ingested by the legacy 2D AffineTabSeriesDN solver.
+        Splits the continuous 1D kinematic coordinate x into (n, d), with
+        d = d_num/d_den, as plain ints for the 2D AffineTabSeriesDN solver.
         """
-        x_frac = Fraction(x)
-        n = int(x_frac // 30)
-        d = x_frac - 30 * n
-        return Fraction(n), d
+        if isinstance(x, int):
+            n, d = divmod(x, 30)
+            return n, d, 1
+        if isinstance(x, float):
+            # Exact dyadic ratio straight from the float, no Fraction built
+            xn, xd = x.as_integer_ratio()
+        else:
+            x_frac = x if isinstance(x, Fraction) else Fraction(x)
+            xn, xd = x_frac.numerator, x_frac.denominator
+        n, dn = divmod(xn, 30 * xd)
+        return n, dn, xd
 
     # ---------------------------------------------------------
     # Protocol Properties
@@ -156,14 +189,28 @@ class TraditionalDayEngine(DayEngineProtocol):
     # Protocol Methods (Strictly t2000 output)
     # ---------------------------------------------------------
     def mean_date(self, x: NumT) -> Fraction:
-        n, d = self._to_nd(x)
-        jd_abs = self.p.m0 + self.p.m1 * n + self.p.m2 * d
-        return jd_abs - JD_J2000
+        n, dn, dd = self._to_nd(x)
+        num = (self._m0_num + self._m1_num * n) * dd + self._m2_num * dn
+        return Fraction(num, self._m_den * dd)
+
+    def _solve_true_jd_nd(self, x: NumT) -> Tuple[int, int]:
+        """Absolute true date (JD) of tithi x as an unreduced (num, den) pair."""
+        return self.series.eval_nd(*self._to_nd(x))
 
     def true_date(self, x: NumT) -> Fraction:
-        n, d = self._to_nd(x)
-        jd_abs = self.series.eval(d, n)
-        return jd_abs - JD_J2000
+        num, den = self._true_jd_nd(x)
+        return Fraction(num - JDN_J2000 * den, den)
+
+    def true_dates(self, x0: int, count: int) -> List[Fraction]:
+        """
+        true_date(x0), ..., true_date(x0 + count - 1) for a contiguous tithi
+        sweep, stepping the series incrementally instead of per call.
+        """
+        n, d = divmod(x0, 30)
+        return [
+            Fraction(num - JDN_J2000 * den, den)
+            for num, den in self.series.eval_nd_run(n, d, count)
+        ]
 
     def local_civil_date(self, x: NumT) -> Fraction:
         """For traditional engines, the affine true_date is already civil-aligned."""
@@ -174,39 +221,55 @@ class TraditionalDayEngine(DayEngineProtocol):
         Returns the absolute discrete JDN using pure rational integer arithmetic.
         Completely bypasses FPU and math.floor.
         """
-        from fractions import Fraction
-        
-        # 1. Get the continuous fraction (t2000) and add the exact J2000 offset
-        abs_date = self.local_civil_date(x) + Fraction(2451545, 1)
-        
-        # 2. Pure rational floor via unbounded integer division
-        return abs_date.numerator // abs_date.denominator
+        if not self._civil_is_true:
+            # A subclass redefines the civil date: floor that instead
+            abs_date = self.local_civil_date(x) + JD_J2000
+            return abs_date.numerator // abs_date.denominator
+
+        # The civil date is the absolute true date; floor its raw
+        # (num, den) pair directly, so no Fraction (and no gcd) is built.
+        num, den = self._true_jd_nd(x)
+        return num // den
 
     def mean_sun(self, x: NumT) -> Fraction:
-        n, d = self._to_nd(x)
-        s = self.p.s0 + self.p.s1 * n + self.p.s2 * d
-        return frac_turn(s)
+        n, dn, dd = self._to_nd(x)
+        num = (self._s0_num + self._s1_num * n) * dd + self._s2_num * dn
+        return frac_turn_nd(num, self._s_den * dd)
+
+    def _solve_true_sun(self, x: NumT) -> Fraction:
+        """True sun (turns) of tithi x, evaluated on the series."""
+        return frac_turn_nd(*self.sun_series.eval_nd(*self._to_nd(x)))
 
     def true_sun(self, x: NumT) -> Fraction:
-        n, d = self._to_nd(x)
-        return frac_turn(self.sun_series.eval(d, n))
+        return self._true_sun_cached(x)
 
     def get_x_from_t2000(self, t2000: float) -> int:
         """
         Inverse kinematic lookup. Returns the active absolute tithi index (x) 
         that covers the given physical time (Days since J2000.0).
         """
-        target = Fraction(t2000)
-        
-        # 1. Provide an extremely close starting guess based on the mean linear rate
-        # m2 is days per tithi.
-        m0_t2000 = self.p.m0 - JD_J2000
-        x_est = int((target - m0_t2000) / self.p.m2)
-        
-        # 2. Walk the physical boundaries to find the exact tithi enclosure
-        while self.true_date(x_est - 1) > target:
+        if not isinstance(t2000, (int, Fraction)):
+            t2000 = Fraction(t2000)
+        tn = t2000.numerator + JDN_J2000 * t2000.denominator
+        td = t2000.denominator
+
+        # 1. Start at the tithi the mean model puts the target in:
+        #    floor((jd - m0) / m2) + 1, in integers (m2 is days per tithi).
+        m0n, m0d, m2n, m2d = self._x_guess
+        x_est = ((tn * m0d - m0n * td) * m2d) // (td * m0d * m2n) + 1
+
+        # 2. Walk the physical boundaries to find the exact tithi enclosure,
+        #    comparing raw absolute-date pairs by cross-multiplication
+        true_nd = self._true_jd_nd
+        while True:
+            num, den = true_nd(x_est - 1)
+            if num * td <= tn * den:
+                break
             x_est -= 1
-        while self.true_date(x_est) <= target:
+        while True:
+            num, den = true_nd(x_est)
+            if num * td > tn * den:
+                break
             x_est += 1
             
         return x_est
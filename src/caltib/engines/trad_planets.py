@@ -9,17 +9,18 @@ from dataclasses import dataclass
 from fractions import Fraction
 from typing import Dict, Tuple
 
+from caltib.core.types import _SLOTS
 from caltib.engines.interfaces import PlanetsEngineProtocol, NumT
-from caltib.engines.astro.tables import QuarterWaveTable, HalfWaveTable
+from caltib.engines.astro.tables import get_half_wave_table, get_quarter_wave_table
+from caltib.engines.astro.rational import frac_turn
 
 PLANETS = ("mercury", "venus", "mars", "jupiter", "saturn")
 
-def frac_turn(val: Fraction) -> Fraction:
-    """Wraps a fractional turn to [0, 1)."""
-    q = val.numerator // val.denominator
-    return val - Fraction(q, 1)
+# Kālacakra units per turn (60 * 27), as one shared Fraction
+_UNITS_PER_TURN = Fraction(1620)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **_SLOTS)
 class TraditionalPlanetsParams:
     epoch_k: int
     m0: Fraction  # Epoch absolute Julian Day
@@ -39,11 +40,11 @@ class TraditionalPlanetsEngine(PlanetsEngineProtocol):
         
         # Initialize the generalized tables with their specific ancient periods
         self.manda = {
-            k: QuarterWaveTable(v) for k, v in self.p.manda_tables.items()
+            k: get_quarter_wave_table(v) for k, v in self.p.manda_tables.items()
         }
         self.sighra = {
             # Table 13 spans 27 Nakshatras for a full orbit
-            k: HalfWaveTable(v) for k, v in self.p.sighra_tables.items()
+            k: get_half_wave_table(v) for k, v in self.p.sighra_tables.items()
         }
 
     @property
@@ -95,13 +96,13 @@ class TraditionalPlanetsEngine(PlanetsEngineProtocol):
         equ = self.manda[planet].eval_turn(anomaly)
         
         # Convert Kālacakra units (60 * 27 = 1620) to turns
-        true_slow_long = frac_turn(slow_long + equ / Fraction(1620))
+        true_slow_long = frac_turn(slow_long + equ / _UNITS_PER_TURN)
         
         # 3. Equation of Conjunction (Sighra)
         diff = frac_turn(step_index - true_slow_long)
         corr = self.sighra[planet].eval_turn(diff)
         
-        fast_long = frac_turn(true_slow_long + corr / Fraction(1620))
+        fast_long = frac_turn(true_slow_long + corr / _UNITS_PER_TURN)
         return fast_long
 
     def longitudes(self, jd: NumT) -> Dict[str, Dict[str, Fraction]]:
@@ -130,11 +131,11 @@ class TraditionalPlanetsEngine(PlanetsEngineProtocol):
                     
                 anomaly = frac_turn(slow - self.p.birth_signs[p])
                 equ = self.manda[p].eval_turn(anomaly)
-                true_slow = frac_turn(slow + equ / Fraction(1620))
+                true_slow = frac_turn(slow + equ / _UNITS_PER_TURN)
                 
                 diff = frac_turn(step - true_slow)
                 corr = self.sighra[p].eval_turn(diff)
-                true_val = frac_turn(true_slow + corr / Fraction(1620))
+                true_val = frac_turn(true_slow + corr / _UNITS_PER_TURN)
                 
             res[p] = {"mean": mean_val, "true": true_val}
             
@@ -3,7 +3,14 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Sequence
+
+from caltib.core.jit import jit_enabled, maybe_njit
+
+try:  # jplephem needs numpy; the pure-float path below does not
+    import numpy as _np
+except ImportError:  # pragma: no cover - optional dependency
+    _np = None
 
 
 # --------------------------
@@ -15,22 +22,81 @@ def wrap180(deg: float) -> float:
 
 
 SYNODIC_MEAN = 29.530588853
+_EPS64 = 2.0 ** -52
 EPS_J2000_DEG = 23.439291111
 
 
+# Fixed J2000 obliquity: the x-axis rotation coefficients are constants
+_COS_EPS = math.cos(math.radians(EPS_J2000_DEG))
+_SIN_EPS = math.sin(math.radians(EPS_J2000_DEG))
+
+
 def _rot_x_minus_eps(v):
-    eps = math.radians(EPS_J2000_DEG)
-    x, y, z = float(v[0]), float(v[1]), float(v[2])
-    y2 =  math.cos(eps) * y + math.sin(eps) * z
-    z2 = -math.sin(eps) * y + math.cos(eps) * z
+    """Equatorial -> ecliptic rotation of v (a 3-vector, or 3 rows of N samples)."""
+    if getattr(v[0], "ndim", 0):
+        x, y, z = v[0], v[1], v[2]
+    else:
+        x, y, z = float(v[0]), float(v[1]), float(v[2])
+    y2 =  _COS_EPS * y + _SIN_EPS * z
+    z2 = -_SIN_EPS * y + _COS_EPS * z
     return (x, y2, z2)
 
 
-def _lon_ecl_deg(v_eq) -> float:
+def _as_rows(v):
+    """Positions as a contiguous float64 (3, N) array for the jitted kernel."""
+    return _np.ascontiguousarray(_np.asarray(v, dtype=_np.float64).reshape(3, -1))
+
+
+def _xyz(v):
+    """A scalar day's position ((3,) or (3, 1)) as three Python floats."""
+    if _np is not None:
+        return _np.ravel(v).tolist()
+    return [float(c) for c in v]
+
+
+def _elong_scalar(r_emb, r_em, r_sun, emrat: float) -> float:
+    """_elong_f64 for one day on plain floats: no array reshapes, no JIT dispatch."""
+    bx, by, bz = _xyz(r_emb)
+    mx, my, mz = _xyz(r_em)
+    sx, sy, sz = _xyz(r_sun)
+    k = emrat + 1.0
+    sx = sx - (bx - mx / k)
+    sy = sy - (by - my / k)
+    sz = sz - (bz - mz / k)
+    lon_s = math.degrees(math.atan2(_COS_EPS * sy + _SIN_EPS * sz, sx)) % 360.0
+    lon_m = math.degrees(math.atan2(_COS_EPS * my + _SIN_EPS * mz, mx)) % 360.0
+    return (lon_m - lon_s) % 360.0
+
+
+def _lon_ecl_deg(v_eq):
+    """Ecliptic longitude in [0, 360) degrees; element-wise for (3, N) input."""
     x, y, z = _rot_x_minus_eps(v_eq)
+    if getattr(x, "ndim", 0):
+        return _np.degrees(_np.arctan2(y, x)) % 360.0
     return (math.degrees(math.atan2(y, x)) % 360.0)
 
 
+@maybe_njit
+def _elong_f64(r_emb, r_em, r_sun, emrat):
+    """
+    Fused elong_deg kernel over (3, N) equatorial positions: Earth from the
+    EMB, both ecliptic longitudes and their difference in one pass, the same
+    float64 operations as the NumPy path (numba-jitted when available).
+    """
+    n = r_em.shape[1]
+    out = _np.empty(n)
+    k = emrat + 1.0
+    for j in range(n):
+        mx, my, mz = r_em[0, j], r_em[1, j], r_em[2, j]
+        sx = r_sun[0, j] - (r_emb[0, j] - mx / k)
+        sy = r_sun[1, j] - (r_emb[1, j] - my / k)
+        sz = r_sun[2, j] - (r_emb[2, j] - mz / k)
+        lon_s = math.degrees(math.atan2(_COS_EPS * sy + _SIN_EPS * sz, sx)) % 360.0
+        lon_m = math.degrees(math.atan2(_COS_EPS * my + _SIN_EPS * mz, mx)) % 360.0
+        out[j] = (lon_m - lon_s) % 360.0
+    return out
+
+
 def _load_constants_dict(de422_mod) -> dict:
     # de422 package typically has constants.npy next to __file__
     import pathlib
@@ -85,14 +151,34 @@ class DE422Elongation:
         emrat = _get_emrat(const)
         return cls(eph=eph, emrat=emrat)
 
-    def elong_deg(self, jd_tt: float) -> float:
+    def _position(self, name: str, jd_tt):
+        """
+        Equatorial position (km) of `name`. jplephem's position() evaluates the
+        Chebyshev records for a whole array of days at once and skips the
+        velocity recurrence that compute() also runs.
+        """
+        position = getattr(self.eph, "position", None)
+        if position is not None:
+            return position(name, jd_tt)
+        return self.eph.compute(name, jd_tt)[:3]
+
+    def elong_deg(self, jd_tt):
         """
         Elongation in degrees at TT Julian day 'jd_tt'.
+        A NumPy array of days is evaluated in one batched ephemeris call per
+        body and returns an array of elongations.
         """
         # Vectors in equatorial frame (J2000)
-        r_emb = self.eph.compute("earthmoon", jd_tt)[:3]
-        r_em  = self.eph.compute("moon", jd_tt)[:3]      # geocentric moon
-        r_sun = self.eph.compute("sun", jd_tt)[:3]       # barycentric sun
+        r_emb = self._position("earthmoon", jd_tt)
+        r_em  = self._position("moon", jd_tt)      # geocentric moon
+        r_sun = self._position("sun", jd_tt)       # barycentric sun
+
+        if not getattr(jd_tt, "ndim", 0):
+            # Newton and Brent step one day at a time: stay on plain floats
+            return _elong_scalar(r_emb, r_em, r_sun, float(self.emrat))
+        if jit_enabled():
+            el = _elong_f64(_as_rows(r_emb), _as_rows(r_em), _as_rows(r_sun), float(self.emrat))
+            return el.reshape(_np.shape(jd_tt))
 
         # Earth position from EMB and Moon vector
         # r_earth = r_emb - r_em/(EMRAT+1)
@@ -100,9 +186,9 @@ class DE422Elongation:
 
         # Earth->Sun and Earth->Moon
         r_es = r_sun - r_earth
-        lon_s = _lon_ecl_deg(r_es)
-        lon_m = _lon_ecl_deg(r_em)
 
+        # Rotate both vectors in one pass over a stacked (3, 2, ...) array
+        lon_m, lon_s = _lon_ecl_deg(_np.stack([r_em, r_es], axis=1))
         return (lon_m - lon_s) % 360.0
 
 
@@ -110,6 +196,55 @@ class DE422Elongation:
 # root finding for elongation targets
 # --------------------------
 
+def _brent_root(f, a: float, b: float, fa: float, fb: float, xtol: float = 1e-10, maxiter: int = 100) -> float:
+    """
+    Brent's method for a root of f bracketed by [a, b] (fa * fb <= 0):
+    inverse-quadratic / secant steps with a bisection fallback, so it keeps
+    bisection's guarantee but converges superlinearly on smooth f.
+    """
+    if fa == 0.0:
+        return a
+    if fb == 0.0:
+        return b
+    c, fc = a, fa
+    d = e = b - a
+    for _ in range(maxiter):
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol = 2.0 * _EPS64 * abs(b) + 0.5 * xtol
+        m = 0.5 * (c - b)
+        if abs(m) <= tol or fb == 0.0:
+            return b
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                p = 2.0 * m * s
+                q = 1.0 - s
+            else:
+                q = fa / fc
+                r = fb / fc
+                p = s * (2.0 * m * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+            if p > 0:
+                q = -q
+            else:
+                p = -p
+            if 2.0 * p < min(3.0 * m * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+        a, fa = b, fb
+        b += d if abs(d) > tol else math.copysign(tol, m)
+        fb = f(b)
+    return b
+
+
 def solve_target_near(el: DE422Elongation, t_guess: float, target_deg: float, halfwidth_days: float = 3.0) -> float:
     """
     Solve elong(t)=target (deg) near t_guess, in TT JD, with Newton+bracket.
@@ -129,7 +264,7 @@ def solve_target_near(el: DE422Elongation, t_guess: float, target_deg: float, ha
             break
         t -= y / dy
 
-    # bracket+bisect
+    # bracket + Brent
     w = halfwidth_days
     a, b = t_guess - w, t_guess + w
     fa, fb = f(a), f(b)
@@ -140,32 +275,18 @@ def solve_target_near(el: DE422Elongation, t_guess: float, target_deg: float, ha
     if fa * fb > 0:
         return t
 
-    for _ in range(140):
-        m = 0.5 * (a + b)
-        fm = f(m)
-        if fa * fm <= 0:
-            b, fb = m, fm
-        else:
-            a, fa = m, fm
-        if (b - a) < 1e-10:
-            break
-    return 0.5 * (a + b)
+    return _brent_root(f, a, b, fa, fb)
 
 
 def find_new_moon_near(el: DE422Elongation, jd0: float) -> float:
     """
     Find a new moon near jd0: solve elong(t)=0.
     """
-    # coarse scan then refine
-    try:
-        import numpy as np
-    except ImportError as e:
-        raise RuntimeError("This function needs numpy. Install: pip install numpy") from e
-
-    grid = np.linspace(jd0 - 25.0, jd0 + 25.0, 1201)
-    vals = np.array([abs(wrap180(el.elong_deg(t))) for t in grid])
-    t_guess = float(grid[int(vals.argmin())])
-    return solve_target_near(el, t_guess, 0.0, halfwidth_days=4.0)
+    # Bootstrap from the phase at jd0: elongation advances one turn per mean
+    # synodic month, so the nearest new moon is within about half a day of
+    # this guess and Newton finishes it off.
+    t_guess = jd0 - wrap180(el.elong_deg(jd0)) / 360.0 * SYNODIC_MEAN
+    return solve_target_near(el, t_guess, 0.0, halfwidth_days=2.0)
 
 
 def build_new_moons(el: DE422Elongation, t_min: float, t_max: float) -> List[float]:
@@ -217,13 +338,37 @@ def tithi_boundary_in_lunation(el: DE422Elongation, t0: float, t1: float, d: int
     if fa * fb > 0:
         return solve_target_near(el, guess, target, halfwidth_days=3.0)
 
-    for _ in range(140):
-        m = 0.5 * (a + b)
-        fm = f(m)
-        if fa * fm <= 0:
-            b, fb = m, fm
-        else:
-            a, fa = m, fm
-        if (b - a) < 1e-10:
-            break
-    return 0.5 * (a + b)
\ No newline at end of file
+    return _brent_root(f, a, b, fa, fb)
+
+def tithi_boundaries_in_lunation(el: DE422Elongation, t0: float, t1: float, days: Sequence[int]) -> List[float]:
+    """
+    tithi_boundary_in_lunation for several d of one lunation [t0,t1]: one
+    batched elongation grid brackets every 12*d degree target, and Brent
+    refines each bracket with a few scalar evaluations.
+    """
+    import numpy as np
+
+    grid = np.linspace(t0, t1, 61)
+    vals = el.elong_deg(grid)
+    # Half-day steps move elongation ~6 deg, so the unwrap is unambiguous
+    unwrapped = np.degrees(np.unwrap(np.radians(vals)))
+    unwrapped += wrap180(float(vals[0])) - unwrapped[0]
+
+    out: List[float] = []
+    for d in days:
+        if d == 30:
+            out.append(t1)
+            continue
+        target = 12.0 * d
+        i = min(max(int(np.searchsorted(unwrapped, target)), 1), len(grid) - 1)
+        fa = float(unwrapped[i - 1]) - target
+        fb = float(unwrapped[i]) - target
+        if fa * fb > 0:
+            out.append(tithi_boundary_in_lunation(el, t0, t1, d))
+            continue
+
+        def f(t: float, target: float = target) -> float:
+            return wrap180(el.elong_deg(t) - target)
+
+        out.append(_brent_root(f, float(grid[i - 1]), float(grid[i]), fa, fb))
+    return out
@@ -3,12 +3,19 @@ from __future__ import annotations
 
 import argparse
 import csv
+import gzip
+import hashlib
+import json
 import os
 import re
 import sys
+import urllib.error
 import urllib.request
+from bisect import bisect_left, bisect_right
+from calendar import monthrange
 from dataclasses import dataclass
-from datetime import date, datetime
+from operator import itemgetter
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
@@ -26,6 +33,15 @@ class LeapEntry:
     utc_date: date
     tai_minus_utc: int
 
+_MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+_LEAP_LINE_RE = re.compile(
+    r"\s*[^\s#]+\s+([+-]?\d+)(?=[\s#])[^#]*#\s*(\d+)\s+([A-Za-z]{3})\S*\s+(\d+)(?:\s|$)"
+)
+
+
 def _parse_leap_seconds_list(text: str) -> List[LeapEntry]:
     """
     Parse IANA leap-seconds.list, using the explicit UTC date in the comment:
@@ -35,37 +51,24 @@ def _parse_leap_seconds_list(text: str) -> List[LeapEntry]:
     We IGNORE the NTP timestamp, because converting it to UTC via timedelta
     is not reliable in the presence of leap seconds.
     """
-    month = {
-        "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
-        "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
-    }
-
     entries: List[LeapEntry] = []
     for line in text.splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-
         # Expect: "<ntp> <tai_utc> # <day> <Mon> <year>"
         # Example: "2272060800 10 # 1 Jan 1972"
-        if "#" not in line:
+        # Comment and blank lines never match: they have no leading NTP field.
+        m = _LEAP_LINE_RE.match(line)
+        if m is None:
             continue
-        left, right = line.split("#", 1)
-        left = left.strip().split()
-        right = right.strip().split()
-        if len(left) < 2 or len(right) < 3:
+        tai_utc, dd, mon, yy = m.groups()
+        mm = _MONTHS.get(mon.lower())
+        if mm is None:
             continue
-
         try:
-            tai_utc = int(left[1])
-            dd = int(right[0])
-            mm = month[right[1].lower()[:3]]
-            yy = int(right[2])
-            d = date(yy, mm, dd)
-        except Exception:
+            d = date(int(yy), mm, int(dd))
+        except ValueError:
             continue
 
-        entries.append(LeapEntry(d, tai_utc))
+        entries.append(LeapEntry(d, int(tai_utc)))
 
     entries.sort(key=lambda e: e.utc_date)
     if not entries:
@@ -84,24 +87,22 @@ def _seconds_to_timedelta(s: int):
     return timedelta(seconds=s)
 
 
+def _leap_arrays(leaps: List[LeapEntry]) -> Tuple[List[int], List[int]]:
+    """Leap-table step ordinals and TAI-UTC values, for bisect lookups."""
+    return [e.utc_date.toordinal() for e in leaps], [e.tai_minus_utc for e in leaps]
+
+
+def _tai_minus_utc_at(ords: List[int], vals: List[int], ordinal: int) -> int:
+    # last entry with utc_date <= day; before the 1972 regime we just clamp
+    return vals[max(bisect_right(ords, ordinal) - 1, 0)]
+
+
 def tai_minus_utc_for_day(leaps: List[LeapEntry], d: date) -> int:
     """
     Return TAI-UTC (seconds) valid at UTC date d.
     """
-    # last entry with utc_date <= d
-    lo, hi = 0, len(leaps) - 1
-    if d < leaps[0].utc_date:
-        # before 1972 leap-second regime: we just clamp
-        return leaps[0].tai_minus_utc
-    while hi - lo > 1:
-        mid = (lo + hi) // 2
-        if leaps[mid].utc_date <= d:
-            lo = mid
-        else:
-            hi = mid
-    if leaps[hi].utc_date <= d:
-        return leaps[hi].tai_minus_utc
-    return leaps[lo].tai_minus_utc
+    ords, vals = _leap_arrays(leaps)
+    return _tai_minus_utc_at(ords, vals, d.toordinal())
 
 
 # -----------------------------
@@ -113,9 +114,56 @@ class EOPRow:
     ut1_utc: float  # seconds
 
 
-def _fetch(url: str) -> str:
-    with urllib.request.urlopen(url) as r:
-        return r.read().decode("utf-8", errors="replace")
+def _read_body(r) -> bytes:
+    """Response body, gunzipped from the stream when the server compressed it."""
+    if (r.headers.get("Content-Encoding") or "").lower() == "gzip":
+        with gzip.GzipFile(fileobj=r) as gz:
+            return gz.read()
+    return r.read()
+
+
+def _fetch(url: str, cache_dir: Optional[Path] = None) -> str:
+    """
+    GET url as text, asking for a gzip transfer. With cache_dir, the body is
+    kept on disk with its ETag / Last-Modified, and reruns send a
+    conditional request: a 304 reuses the cached body instead of
+    downloading it again.
+    """
+    headers = {"Accept-Encoding": "gzip"}
+    if cache_dir is None:
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers)) as r:
+            return _read_body(r).decode("utf-8", errors="replace")
+
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+    body_path = cache_dir / f"{key}.body"
+    meta_path = cache_dir / f"{key}.meta"
+
+    cached = False
+    if body_path.exists() and meta_path.exists():
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except ValueError:
+            meta = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+            cached = True
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+            cached = True
+
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers)) as r:
+            body = _read_body(r)
+            meta = {"url": url, "etag": r.headers.get("ETag"), "last_modified": r.headers.get("Last-Modified")}
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached:
+            return body_path.read_bytes().decode("utf-8", errors="replace")
+        raise
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    body_path.write_bytes(body)
+    meta_path.write_text(json.dumps(meta), encoding="utf-8")
+    return body.decode("utf-8", errors="replace")
 
 def _parse_iers_c04_csv(text: str) -> List[EOPRow]:
     """
@@ -144,7 +192,12 @@ def _parse_iers_c04_csv(text: str) -> List[EOPRow]:
         except Exception:
             delim = ";"
 
-    reader = csv.reader(lines, delimiter=delim)
+    if '"' in text:
+        reader = csv.reader(lines, delimiter=delim)
+    else:
+        # IERS files carry no quoted fields: a plain split is the same rows
+        # at a fraction of the csv module's per-row cost
+        reader = (ln.split(delim) for ln in lines)
     header = next(reader)
     h = [c.strip().lower() for c in header]
 
@@ -173,38 +226,27 @@ def _parse_iers_c04_csv(text: str) -> List[EOPRow]:
     if iut1 is None:
         raise RuntimeError(f"Could not locate UT1-UTC column. Header: {header}")
 
+    # Specialized row loops: one float() and one date() per row, fields
+    # fetched together by itemgetter, no per-row branching on the layout.
     rows: List[EOPRow] = []
-    for row in reader:
-        if not row or len(row) <= iut1:
-            continue
-
-        # parse UT1-UTC
-        s_ut1 = row[iut1].strip()
-        if not s_ut1:
-            continue
-        try:
-            ut1 = float(s_ut1)
-        except ValueError:
-            continue
-
-        d: Optional[date] = None
-        if iy is not None and im is not None and iday is not None:
+    append = rows.append
+    if iy is not None and im is not None and iday is not None:
+        get = itemgetter(iut1, iy, im, iday)
+        for row in reader:
             try:
-                y = int(row[iy]); m = int(row[im]); dd = int(row[iday])
-                d = date(y, m, dd)
-            except Exception:
-                d = None
-        elif imjd is not None:
+                s_ut1, y, m, dd = get(row)
+                # float() tolerates surrounding blanks; an empty cell raises
+                append(EOPRow(date(int(y), int(m), int(dd)), float(s_ut1)))
+            except (ValueError, IndexError, OverflowError):
+                continue
+    elif imjd is not None:
+        get = itemgetter(iut1, imjd)
+        for row in reader:
             try:
-                mjd = float(row[imjd])
-                d = _mjd_to_date(mjd)
-            except Exception:
-                d = None
-
-        if d is None:
-            continue
-
-        rows.append(EOPRow(d=d, ut1_utc=ut1))
+                s_ut1, s_mjd = get(row)
+                append(EOPRow(_mjd_to_date(float(s_mjd)), float(s_ut1)))
+            except (ValueError, IndexError, OverflowError):
+                continue
 
     if not rows:
         raise RuntimeError("Parsed 0 EOP rows from IERS CSV (delimiter/header mismatch?)")
@@ -213,11 +255,12 @@ def _parse_iers_c04_csv(text: str) -> List[EOPRow]:
     return rows
 
 
+_MJD_EPOCH_ORDINAL = date(1858, 11, 17).toordinal()  # MJD 0
+
+
 def _mjd_to_date(mjd: float) -> date:
-    # MJD 0 = 1858-11-17
-    from datetime import timedelta
-    base = date(1858, 11, 17)
-    return base + timedelta(days=int(mjd))
+    # one ordinal add and one fromordinal, no timedelta per row
+    return date.fromordinal(_MJD_EPOCH_ORDINAL + int(mjd))
 
 
 # -----------------------------
@@ -239,9 +282,7 @@ def _month_center_decimal_year(y: int, m: int) -> float:
     return y + (m - 0.5) / 12.0
 
 def _end_of_month(y: int, m: int) -> date:
-    if m == 12:
-        return date(y, 12, 31)
-    return date(y, m + 1, 1).fromordinal(date(y, m + 1, 1).toordinal() - 1)
+    return date(y, m, monthrange(y, m)[1])
 
 def build_monthly_table(eops: List[EOPRow], leaps: List[LeapEntry]) -> List[Tuple[float, int, int, date, int, float, float]]:
     """
@@ -249,12 +290,15 @@ def build_monthly_table(eops: List[EOPRow], leaps: List[LeapEntry]) -> List[Tupl
       (decimal_year, year, month, sample_date, tai_utc, ut1_utc, delta_t_seconds)
     using sample_date = 15th of each month.
     """
-    # index UT1-UTC by date
-    ut1_by_date: Dict[date, float] = {r.d: r.ut1_utc for r in eops}
+    # EOP rows are sorted by date: bisect the date column for each month
+    # instead of indexing every daily row into a dict first.
+    days = [r.d for r in eops]
 
     # available range in EOP
-    d0, d1 = eops[0].d, eops[-1].d
+    d0, d1 = days[0], days[-1]
     first_leap_date = leaps[0].utc_date  # should be 1972-01-01    
+    leap_ords, leap_vals = _leap_arrays(leaps)
+    three_days = timedelta(days=3)
 
     out = []
     y0, y1 = d0.year, d1.year
@@ -265,35 +309,32 @@ def build_monthly_table(eops: List[EOPRow], leaps: List[LeapEntry]) -> List[Tupl
             if d < d0 or d > d1:
                 continue
 
-            # if missing exactly on 15th, search nearest within +/-3 days
-            ut1 = None
-            for k in [0, -1, 1, -2, 2, -3, 3]:
-                dd = d.fromordinal(d.toordinal() + k)
-                if dd in ut1_by_date:
-                    ut1 = ut1_by_date[dd]
-                    d_use = dd
-                    break
+            # if missing exactly on 15th, take the nearest day within +/-3
+            # (earlier day on ties; last row for a repeated date)
+            j = bisect_right(days, d) - 1
+            if j < 0 or days[j] != d:
+                j = None
+                best = None
+                o = d.toordinal()
+                i = bisect_left(days, d - three_days)
+                hi = d + three_days
+                while i < len(days) and days[i] <= hi:
+                    k = days[i].toordinal() - o
+                    key = (abs(k), k > 0)
+                    if best is None or key <= best:
+                        best, j = key, i
+                    i += 1
+            if j is None:
+                # tail months: last available EOP date within the same month
+                j = bisect_right(days, min(d1, _end_of_month(y, m))) - 1
+                if j < 0 or (days[j].year, days[j].month) != (y, m):
+                    continue
+            d_use = days[j]
             if d_use < first_leap_date:
                 continue
-            if ut1 is None:
-                # try: last available EOP date within the same month (for tail months)
-                # scan backwards from min(d1, end_of_month) up to 31 days
-                end = _end_of_month(y, m)
-                dd = min(d1, end)
-                found = None
-                for k in range(0, 32):
-                    dtry = dd.fromordinal(dd.toordinal() - k)
-                    if dtry.month != m:
-                        break
-                    if dtry in ut1_by_date:
-                        found = dtry
-                        ut1 = ut1_by_date[dtry]
-                        d_use = dtry
-                        break
-                if found is None:
-                    continue
 
-            tai_utc = tai_minus_utc_for_day(leaps, d_use)
+            ut1 = eops[j].ut1_utc
+            tai_utc = _tai_minus_utc_at(leap_ords, leap_vals, d_use.toordinal())
             delta_t = (tai_utc + 32.184) - ut1  # seconds
             out.append((_month_center_decimal_year(y, m), y, m, d_use, tai_utc, float(ut1), float(delta_t)))
 
@@ -318,13 +359,17 @@ def main(argv: Optional[List[str]] = None) -> int:
     p.add_argument("--out", default=None, help="Output CSV path (default: ~/.cache/caltib/deltat_iers_monthly.csv)")
     p.add_argument("--also-write-package", action="store_true",
                    help="Also overwrite src/caltib/reference/data/deltat_iers_monthly.csv (for repo maintenance).")
+    p.add_argument("--no-cache", action="store_true",
+                   help="Always download in full instead of revalidating the cached copies.")
     args = p.parse_args(argv)
 
+    cache_dir = None if args.no_cache else default_output_path().parent / "http_cache"
+
     print("Downloading IERS C04 CSV ...")
-    iers_text = _fetch(IERS_C04_CSV_URL)
+    iers_text = _fetch(IERS_C04_CSV_URL, cache_dir)
 
     print("Downloading leap-seconds.list ...")
-    leap_text = _fetch(LEAP_SECONDS_URL)
+    leap_text = _fetch(LEAP_SECONDS_URL, cache_dir)
 
     print("Parsing ...")
     eops = _parse_iers_c04_csv(iers_text)
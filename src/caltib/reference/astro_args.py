@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from math import fmod
 from typing import Literal
 
 import math
 
+from caltib.core.jit import maybe_njit
 
 # ------------------------------------------------------------
 # Units & helpers
@@ -21,6 +23,11 @@ def wrap_turn(x_turn: float) -> float:
     """Wrap turns to [0,1)."""
     return frac01(x_turn)
 
+@maybe_njit
+def _wrap_turn_f64(x):
+    # frac01, spelled so numba compiles it to the same operations
+    return x - float(int(x // 1.0))
+
 def wrap_deg(x_deg: float) -> float:
     """Wrap degrees to [0,360)."""
     # avoid slow % for huge values; fmod is fine
@@ -156,10 +163,15 @@ def fundamental_args(T: float) -> FundamentalArgs:
     (The exact higher-order terms are usually negligible for your L1–L5 target,
     but included here since you asked for “more accurate” fundamentals.)
     """
+    return FundamentalArgs(*_fundamental_args_f64(float(T)))
+
+
+@maybe_njit
+def _fundamental_args_f64(T):
+    """fundamental_args as a 6-tuple of turns (numba-jitted when available)."""
     T2 = T * T
     T3 = T2 * T
     T4 = T2 * T2
-
     Lp = (
         218.3164477
         + 481267.88123421 * T
@@ -200,16 +212,49 @@ def fundamental_args(T: float) -> FundamentalArgs:
     #   Ω = 125.04452 - 1934.136261 T + 0.0020708 T^2 + T^3/450000
     Omega = 125.04452 - 1934.136261 * T + 0.0020708 * T2 + (T3 / 450000.0)
 
-    return FundamentalArgs(
-        Lp_turn=wrap_turn(deg_to_turn(Lp)),
-        D_turn=wrap_turn(deg_to_turn(D)),
-        M_turn=wrap_turn(deg_to_turn(M)),
-        Mp_turn=wrap_turn(deg_to_turn(Mp)),
-        F_turn=wrap_turn(deg_to_turn(F)),
-        Omega_turn=wrap_turn(deg_to_turn(Omega)),
+    return (
+        _wrap_turn_f64(Lp / 360.0),
+        _wrap_turn_f64(D / 360.0),
+        _wrap_turn_f64(M / 360.0),
+        _wrap_turn_f64(Mp / 360.0),
+        _wrap_turn_f64(F / 360.0),
+        _wrap_turn_f64(Omega / 360.0),
     )
 
 
+# The same polynomials as coefficient rows (degrees, ascending powers of T),
+# in FundamentalArgs field order, for the array evaluator below.
+_FA_COEFS = (
+    (218.3164477, 481267.88123421, -0.0015786, 1.0 / 538841.0, -1.0 / 65194000.0),   # L'
+    (297.8501921, 445267.1114034, -0.0018819, 1.0 / 545868.0, -1.0 / 113065000.0),   # D
+    (357.5291092, 35999.0502909, -0.0001536, 1.0 / 24490000.0, 0.0),                # M
+    (134.9633964, 477198.8675055, 0.0087414, 1.0 / 69699.0, -1.0 / 14712000.0),      # M'
+    (93.2720950, 483202.0175233, -0.0036539, -1.0 / 3526000.0, 1.0 / 863310000.0),   # F
+    (125.04452, -1934.136261, 0.0020708, 1.0 / 450000.0, 0.0),                       # Omega
+)
+
+
+def fundamental_args_array(T) -> FundamentalArgs:
+    """
+    fundamental_args over a NumPy array of T: the six polynomials are one
+    (6, 5) coefficient table evaluated by Horner's rule across the whole
+    array, and each field of the result is an array of turns in [0,1).
+
+    Agrees with fundamental_args to float64 rounding (Horner order differs).
+    """
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise RuntimeError("This function needs numpy. Install: pip install numpy") from e
+
+    T = np.asarray(T, dtype=np.float64)
+    coefs = np.array(_FA_COEFS)
+    deg = np.polynomial.polynomial.polyval(T, coefs.T, tensor=True)
+    turns = deg / 360.0
+    turns -= np.floor(turns)
+    return FundamentalArgs(*turns)
+
+
 # ------------------------------------------------------------
 # Mean obliquity epsilon (turns or degrees)
 # ------------------------------------------------------------
@@ -271,13 +316,16 @@ def solar_mean_elements(T: float) -> SolarMean:
     """
     Meeus-style geometric mean longitude L0 and mean anomaly M (degrees -> turns).
     """
+    return SolarMean(*_solar_mean_f64(float(T)))
+
+
+@maybe_njit
+def _solar_mean_f64(T):
+    """solar_mean_elements as (L0, M) turns (numba-jitted when available)."""
     T2 = T * T
     L0 = 280.46646 + 36000.76983 * T + 0.0003032 * T2
     M = 357.52911 + 35999.05029 * T - 0.0001537 * T2
-    return SolarMean(
-        L0_turn=wrap_turn(deg_to_turn(L0)),
-        M_turn=wrap_turn(deg_to_turn(M)),
-    )
+    return _wrap_turn_f64(L0 / 360.0), _wrap_turn_f64(M / 360.0)
 
 
 # ------------------------------------------------------------
@@ -322,10 +370,16 @@ def eccentricity_factor(T: float) -> float:
 # Precession matrix
 # ------------------------------------------------------------
 
+@lru_cache(maxsize=64)
 def matrix_eq_j2000_to_ecl_date(T: float) -> tuple[tuple[float, ...], ...]:
     """
     Computes the rigorous 3x3 rotation matrix to transform a vector from 
     the Equatorial J2000 frame (ICRF) to the Mean Ecliptic of Date.
+
+    The product R_x(eps) R_z(-z) R_y(theta) R_z(-zeta) is written out entry
+    by entry (the zero/one entries of the factors dropped, the remaining
+    products in the same order), and memoized per T: planet and star
+    reductions at one instant share the matrix.
     """
     # 1. IAU 1976 Equatorial Precession Angles
     zeta = arcsec_to_rad(2306.2181 * T + 0.30188 * (T**2) + 0.017998 * (T**3))
@@ -335,33 +389,24 @@ def matrix_eq_j2000_to_ecl_date(T: float) -> tuple[tuple[float, ...], ...]:
     # 2. Obliquity of Date
     eps_date = math.radians(mean_obliquity_deg(T, model="iau2000"))
 
-    # Matrix multiplication helper
-    def matmul(A, B):
-        return tuple(
-            tuple(sum(A[i][k] * B[k][j] for k in range(3)) for j in range(3))
-            for i in range(3)
-        )
-
-    # Rotation matrices (Standard passive coordinate rotations)
-    def R_x(a):
-        c, s = math.cos(a), math.sin(a)
-        return ((1, 0, 0), (0, c, s), (0, -s, c))
-
-    def R_y(a):
-        c, s = math.cos(a), math.sin(a)
-        return ((c, 0, -s), (0, 1, 0), (s, 0, c))
-
-    def R_z(a):
-        c, s = math.cos(a), math.sin(a)
-        return ((c, s, 0), (-s, c, 0), (0, 0, 1))
+    c1, s1 = math.cos(-z), math.sin(-z)
+    cy, sy = math.cos(theta), math.sin(theta)
+    c2, s2 = math.cos(-zeta), math.sin(-zeta)
+    ce, se = math.cos(eps_date), math.sin(eps_date)
 
-    # 3. Transform: Eq J2000 -> Eq Date -> Ecl Date
-    eq_precession = matmul(R_z(-z), matmul(R_y(theta), R_z(-zeta)))
-    
-    # CRITICAL FIX: The rotation to the ecliptic requires a positive epsilon
-    eq_to_ecl_date = R_x(eps_date) 
+    # 3. Transform: Eq J2000 -> Eq Date (rows of R_z(-z) R_y(theta) R_z(-zeta))
+    a = (cy * c2, cy * s2, -sy)
+    b = (-s2, c2, 0.0)
+    p0 = tuple(c1 * a[j] + s1 * b[j] for j in range(3))
+    p1 = tuple((-s1) * a[j] + c1 * b[j] for j in range(3))
+    p2 = (sy * c2, sy * s2, cy)
 
-    return matmul(eq_to_ecl_date, eq_precession)
+    # Eq Date -> Ecl Date: R_x with a positive epsilon
+    return (
+        p0,
+        tuple(ce * p1[j] + se * p2[j] for j in range(3)),
+        tuple((-se) * p1[j] + ce * p2[j] for j in range(3)),
+    )
 
 def apply_matrix(M: tuple[tuple[float, ...], ...], v: tuple[float, float, float]) -> tuple[float, float, float]:
     """Applies a 3x3 matrix to a 3D vector."""
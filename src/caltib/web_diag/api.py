@@ -2,6 +2,7 @@ import json
 import datetime
 import math
 import bisect
+from collections import defaultdict
 from fractions import Fraction
 
 import caltib
@@ -370,12 +371,11 @@ def get_assign_day_payload(engine_name, jd_start, jd_end):
     x_lo = int((J_start - 2451545.0 - epoch_t2000) / mean_tithi) - 10
     x_hi = int((J_end - 2451545.0 - epoch_t2000) / mean_tithi) + 10
     
-    jdn_to_x = {J: [] for J in range(J_start, J_end + 1)}
+    hits = defaultdict(list)
     for x in range(x_lo - 15, x_hi + 16):
-        try:
-            J = eng.day.civil_jdn(x)
-            if J_start <= J <= J_end: jdn_to_x[J].append(x)
+        try: hits[eng.day.civil_jdn(x)].append(x)
         except: pass
+    jdn_to_x = {J: hits.get(J, []) for J in range(J_start, J_end + 1)}
             
     active_xs = [x for xs in jdn_to_x.values() for x in xs]
     if not active_xs: return {"traces": [], "layout_extras": {}}
@@ -384,9 +384,8 @@ def get_assign_day_payload(engine_name, jd_start, jd_end):
     def get_inherited_name(jdn: int) -> int:
         if jdn in jdn_to_x and jdn_to_x[jdn]: return sorted(jdn_to_x[jdn])[0]
         curr = jdn + 1
-        while curr <= max(jdn_to_x.keys()) + 15:
-            for x in range(x_lo - 15, x_hi + 16):
-                if getattr(eng.day, 'civil_jdn', lambda x: -1)(x) == curr: return x
+        while curr <= J_end + 15:
+            if hits.get(curr): return hits[curr][0]
             curr += 1
         return plot_x_min
         
@@ -0,0 +1,249 @@
+from fractions import Fraction
+
+import pytest
+
+from caltib.engines.astro.tables import QuarterWaveTable
+from caltib.engines.astro.affine_series import PICARD_TOL_BITS, PhaseT, TabTermT, AffineTabSeriesT
+
+SINE_TAB_QUARTER = (0, 228, 444, 638, 801, 923, 998, 1024)
+
+
+def _toy_series() -> AffineTabSeriesT:
+    """A contractive one-term elongation-like series (turns vs. days)."""
+    tab = QuarterWaveTable(quarter=SINE_TAB_QUARTER)
+    term = TabTermT(
+        amp=Fraction(1, 60),
+        phase=PhaseT(c0=Fraction(1, 7), c1=Fraction(1, 27)),
+        table_eval_turn=tab.eval_normalized_turn,
+    )
+    return AffineTabSeriesT(A=Fraction(0, 1), B=Fraction(1, 30), terms=(term,))
+
+
+def test_picard_early_exit_reaches_fixed_point():
+    """With a tolerance, a generous iteration cap stops at the fixed point, not after all rounds."""
+    series = _toy_series()
+    x0 = Fraction(17, 30)
+
+    t = series.picard_solve(x0, iterations=500, tol_bits=PICARD_TOL_BITS)
+
+    # The converged time solves x(t) = x0 to working precision
+    assert abs(series.eval(t) - x0) < Fraction(1, 2**40)
+
+    # Extra rounds beyond convergence must not change the answer
+    assert series.picard_solve(x0, iterations=1000, tol_bits=PICARD_TOL_BITS) == t
+
+
+def test_picard_fixed_count_unchanged_before_convergence():
+    """Small iteration counts still follow the fixed-count recurrence exactly."""
+    series = _toy_series()
+    x0 = Fraction(5, 1)
+
+    t0 = (x0 - series.A) / series.B
+    t = t0
+    for _ in range(2):
+        corr = series.terms[0].amp * series.terms[0].table_eval_turn(series.terms[0].phase.eval(t))
+        t = t0 - corr / series.B
+
+    assert series.picard_solve(x0, iterations=2) == t
+
+
+def test_picard_exact_repeat_exit_matches_full_count():
+    """By default (tol_bits=None) only an exact repeat stops early, so it equals the full fixed count."""
+    series = _toy_series()
+    x0 = Fraction(17, 30)
+
+    t0 = (x0 - series.A) / series.B
+    t = t0
+    for _ in range(12):
+        corr = series.terms[0].amp * series.terms[0].table_eval_turn(series.terms[0].phase.eval(t))
+        t = t0 - corr / series.B
+
+    assert series.picard_solve(x0, iterations=12, tol_bits=None) == t
+    assert series.picard_solve(x0, iterations=12) == t
+    assert abs(series.picard_solve(x0, iterations=12, tol_bits=PICARD_TOL_BITS) - t) < Fraction(1, 2**40)
+
+
+def test_picard_sweep_matches_cold_converged_solves():
+    """Warm-started sweeps land on the same converged roots as cold solves."""
+    series = _toy_series()
+    targets = [Fraction(k, 30) for k in range(40, 50)]
+
+    swept = series.picard_sweep(targets, max_iterations=500)
+    cold = [series.picard_solve(x0, iterations=500, tol_bits=PICARD_TOL_BITS) for x0 in targets]
+
+    for t_w, t_c in zip(swept, cold):
+        assert abs(t_w - t_c) < Fraction(1, 2**40)
+
+
+def test_shared_phase_terms_looked_up_once():
+    """Terms sharing phase and table reuse one lookup without changing results."""
+    calls = []
+    tab = QuarterWaveTable(quarter=SINE_TAB_QUARTER)
+
+    def counting_eval(x):
+        calls.append(x)
+        return tab.eval_normalized_turn(x)
+
+    phase = PhaseT(c0=Fraction(1, 7), c1=Fraction(1, 27))
+    split = AffineTabSeriesT(
+        A=Fraction(0, 1),
+        B=Fraction(1, 30),
+        terms=(
+            TabTermT(amp=Fraction(1, 100), phase=phase, table_eval_turn=counting_eval),
+            TabTermT(amp=Fraction(2, 300), phase=phase, table_eval_turn=counting_eval),
+        ),
+    )
+    t = Fraction(123, 4)
+    assert split.eval(t) == _toy_series().eval(t)
+    assert len(calls) == 1
+
+
+def test_compiled_correction_matches_term_loop():
+    """The unrolled correction sum equals the per-term loop, amp1 and C included."""
+    tab = QuarterWaveTable(quarter=SINE_TAB_QUARTER)
+    terms = (
+        TabTermT(amp=Fraction(1, 60), phase=PhaseT(Fraction(1, 7), Fraction(1, 27)),
+                 table_eval_turn=tab.eval_normalized_turn, amp1=Fraction(1, 10**6)),
+        TabTermT(amp=Fraction(-1, 90), phase=PhaseT(Fraction(2, 9), Fraction(1, 365)),
+                 table_eval_turn=tab.eval_normalized_turn),
+    )
+    series = AffineTabSeriesT(A=Fraction(1, 3), B=Fraction(1, 30), terms=terms, C=Fraction(1, 10**9))
+    t = Fraction(-4567, 3)
+
+    expected = series.C * t * t
+    for term in terms:
+        expected += (term.amp + term.amp1 * t) * term.table_eval_turn(term.phase.eval(t))
+    assert series._picard_corr(t) == expected
+
+    expected_eval = series.base(t) + sum(
+        term.amp * term.table_eval_turn(term.phase.eval(t)) for term in terms
+    )
+    assert series.eval(t) == expected_eval
+
+
+def test_float_picard_approximates_exact_root():
+    """The float64 pre-solver lands next to the exact converged root."""
+    series = _toy_series()
+    x0 = Fraction(1234, 30)
+
+    t_exact = series.picard_solve(x0, iterations=500)
+    t_f64 = series.picard_solve_f64(float(x0), iterations=50)
+
+    assert abs(t_f64 - float(t_exact)) < 1e-9
+
+
+def test_frac_turn_is_canonical():
+    """The gcd-free wrap matches x - floor(x) and stays in lowest terms."""
+    from caltib.engines.astro.affine_series import frac_turn
+
+    for x in (Fraction(7, 3), Fraction(-7, 3), Fraction(6, 3), Fraction(-5, 1), Fraction(0), 4, -3):
+        r = frac_turn(x)
+        expected = Fraction(x) - (Fraction(x).numerator // Fraction(x).denominator)
+        assert r == expected and hash(r) == hash(expected)
+        assert (r.numerator, r.denominator) == (expected.numerator, expected.denominator)
+
+
+def test_frac_turn_wraps_floats_as_floats():
+    """Float turns wrap with floor and keep their type."""
+    import math
+    from caltib.engines.astro.rational import frac_turn
+
+    for x in (2.25, -2.25, 0.0, -0.0, 5.0, -0.125, 123456.789):
+        r = frac_turn(x)
+        assert type(r) is float and 0.0 <= r < 1.0
+        assert r == x - math.floor(x)
+
+
+def test_frac_turn_nd_reduces_unnormalized_pairs():
+    """The common-denominator wrap equals frac_turn of the reduced Fraction."""
+    from caltib.engines.astro.rational import frac_turn, frac_turn_nd
+
+    for num, den in ((14, 6), (-14, 6), (12, 6), (-30, 10), (0, 4), (7, 1), (123456789, 3600)):
+        r = frac_turn_nd(num, den)
+        expected = frac_turn(Fraction(num, den))
+        assert (r.numerator, r.denominator) == (expected.numerator, expected.denominator)
+
+
+def test_eval_f64_array_tracks_exact_eval():
+    """The batch float64 evaluator agrees with eval and with the scalar kernel."""
+    np = pytest.importorskip("numpy")
+
+    series = _toy_series()
+    ts = np.linspace(-5000.0, 5000.0, 257)
+
+    got = series.eval_f64_array(ts)
+    exact = [float(series.eval(Fraction(float(t)))) for t in ts]
+    assert np.max(np.abs(got - exact)) < 1e-12
+
+    tab = series.terms[0].table_eval_turn.__self__
+    phases = np.linspace(-2.0, 2.0, 1001)
+    scalar = [tab.eval_normalized_turn_f64(float(x)) for x in phases]
+    assert np.array_equal(tab.eval_normalized_turn_f64_array(phases), scalar)
+
+
+def test_eval_f64_tracks_exact_eval():
+    """The scalar float64 evaluator stays within a few ulps of the exact series."""
+    series = _toy_series()
+    for k in range(-50, 50):
+        t = Fraction(k * 997, 7)
+        assert abs(series.eval_f64(float(t)) - float(series.eval(t))) < 1e-12
+
+
+def test_float_run_kernel_matches_term_loop():
+    """The per-run float64 correction reproduces the per-term loop bit for bit."""
+    tab = QuarterWaveTable(quarter=SINE_TAB_QUARTER)
+    terms = (
+        TabTermT(amp=Fraction(1, 60), phase=PhaseT(Fraction(1, 7), Fraction(1, 27)),
+                 table_eval_turn=tab.eval_normalized_turn, amp1=Fraction(1, 10**6)),
+        TabTermT(amp=Fraction(-1, 90), phase=PhaseT(Fraction(2, 9), Fraction(1, 365)),
+                 table_eval_turn=tab.eval_normalized_turn),
+    )
+    series = AffineTabSeriesT(A=Fraction(1, 3), B=Fraction(1, 30), terms=terms, C=Fraction(1, 10**9))
+
+    for k in range(-40, 40):
+        t = k * 1234.567
+        expected = float(series.A) + t * (float(series.B) + t * float(series.C))
+        for c0, c1, amp, _amp1, f in series._f64_terms:
+            expected += amp * f(c0 + c1 * t)
+        assert series.eval_f64(t) == expected
+
+        corr = 0.5
+        for c0, c1, amp, amp1, f in series._f64_terms:
+            corr += (amp + amp1 * t) * f(c0 + c1 * t)
+        assert series._corr_f64(0.5, t, True) == corr
+
+
+def test_dn_series_integer_plan_matches_fraction_formula():
+    """AffineTabSeriesDN.eval_nd equals base + sum of amp*table(phase) in Fractions."""
+    from caltib.engines.astro.affine_series import AffineTabSeriesDN, PhaseDN, TabTermDN
+
+    tab = QuarterWaveTable(quarter=SINE_TAB_QUARTER)
+    terms = (
+        TabTermDN(Fraction(1, 60), PhaseDN(Fraction(3, 7), Fraction(2, 13), Fraction(1, 28)), tab.eval_turn),
+        TabTermDN(Fraction(-1, 60), PhaseDN(Fraction(-1, 4), Fraction(5, 67), Fraction(1, 360)), tab.eval_turn),
+        # A lookup without an integer kernel goes through the Fraction adapter
+        TabTermDN(Fraction(2, 9), PhaseDN(Fraction(1, 3), Fraction(1, 5), Fraction(0)), lambda u: u * u),
+    )
+    series = AffineTabSeriesDN(Fraction(2451000, 7), Fraction(295306, 10000), Fraction(1, 30), terms)
+
+    for n in (-40, -1, 0, 1, 123):
+        for d in (Fraction(0), Fraction(7), Fraction(29), Fraction(13, 3)):
+            want = series.base(d, n) + sum(
+                t.amp * t.table_eval_turn(t.phase.eval(d, n)) for t in terms
+            )
+            num, den = series.eval_nd(n, d.numerator, d.denominator)
+            assert Fraction(num, den) == want
+            assert series.eval(d, n) == want
+
+
+def test_table_eval_turn_dispatches_floats_to_f64_kernel():
+    """Float phases go through the float64 kernel; exact phases keep the Fraction path."""
+    tab = QuarterWaveTable(quarter=SINE_TAB_QUARTER)
+    for k in range(-40, 41):
+        x = Fraction(k, 13)
+        exact = tab.eval_turn(x)
+        assert type(exact) is Fraction
+        got = tab.eval_turn(float(x))
+        assert type(got) is float
+        assert got == tab.eval_turn_f64(float(x))
+        assert abs(got - float(exact)) < 1e-9
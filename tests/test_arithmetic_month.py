@@ -0,0 +1,50 @@
+import warnings
+
+import pytest
+
+from caltib.engines.specs import ALL_SPECS
+from caltib.engines.factory import make_engine
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize("name", ["phugpa", "bhutan", "l0"])
+def test_label_array_matches_scalar_labels(name):
+    """Batch labels agree with label_from_lunation element by element, leap months included."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        month = make_engine(ALL_SPECS[name]).month
+
+    ns = np.arange(-20000, 20000, 7)
+    Y, M, leap = month.label_from_lunation_array(ns)
+
+    assert (leap != 0).any()
+    for i, n in enumerate(ns.tolist()):
+        assert (int(Y[i]), int(M[i]), int(leap[i])) == month.label_from_lunation(n)
+
+
+def test_lunation_kernel_matches_label_formulas():
+    """The jittable forward kernel agrees with n_plus / is_trigger_label and inverts labels."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        month = make_engine(ALL_SPECS["phugpa"]).month
+
+    for Y in range(1900, 2100):
+        for M in range(1, 13):
+            lunations = month.get_lunations(Y, M)
+            nplus = month.n_plus(Y, M)
+            expected = [nplus - 1, nplus] if month.is_trigger_label(Y, M) else [nplus]
+            assert lunations == expected
+            for n in lunations:
+                assert month.label_from_lunation(n)[:2] == (Y, M)
+
+
+def test_trigger_labels_roll_matches_per_label_check():
+    """The rolling intercalation residue flags the same leap labels as is_trigger_label."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        month = make_engine(ALL_SPECS["phugpa"]).month
+
+    rolled = month.trigger_labels(1900, 1, 12 * 200)
+    direct = [month.is_trigger_label(Y, M) for Y in range(1900, 2100) for M in range(1, 13)]
+    assert rolled == direct and any(rolled)
@@ -79,4 +79,73 @@ def test_mean_periods_consistency():
     assert aa.synodic_month_days(T) == pytest.approx(29.5305888, abs=1e-7)
     
     # Anomalistic month should be roughly 27.55455 days
-    assert aa.anomalistic_month_days(T) == pytest.approx(27.5545498, abs=1e-7)
\ No newline at end of file
+    assert aa.anomalistic_month_days(T) == pytest.approx(27.5545498, abs=1e-7)
+
+
+def test_fundamental_args_array_matches_scalar():
+    """The vectorized evaluator agrees with the scalar polynomials element by element."""
+    np = pytest.importorskip("numpy")
+
+    T = np.linspace(-30.0, 30.0, 241)
+    fa = aa.fundamental_args_array(T)
+    for i, t in enumerate(T):
+        ref = aa.fundamental_args(float(t))
+        for name in ("Lp_turn", "D_turn", "M_turn", "Mp_turn", "F_turn", "Omega_turn"):
+            got = getattr(fa, name)
+            assert got.shape == T.shape
+            d = abs(got[i] - getattr(ref, name))
+            assert min(d, 1.0 - d) < 1e-10, (name, t)  # ~1e7 deg at |T| = 30
+    assert np.all((fa.D_turn >= 0.0) & (fa.D_turn < 1.0))
+    assert np.allclose(fa.D_deg, 360.0 * fa.D_turn)
+
+
+def test_jitted_element_polynomials_match_python_bitwise():
+    """With numba, the jitted polynomials round exactly like the plain Python bodies."""
+    from caltib.core.jit import jit_enabled
+
+    if not jit_enabled():
+        pytest.skip("numba not installed")
+    import random
+
+    fa, sm = aa._fundamental_args_f64, aa._solar_mean_f64
+    # Plain functions under NUMBA_DISABLE_JIT=1: no py_func to compare against
+    fa_py, sm_py = getattr(fa, "py_func", fa), getattr(sm, "py_func", sm)
+    rng = random.Random(7)
+    for T in [rng.uniform(-40.0, 40.0) for _ in range(2000)] + [0.0, -0.0, 1e-9, -1e-9]:
+        assert fa(T) == fa_py(T)
+        assert sm(T) == sm_py(T)
+
+
+def test_ecliptic_of_date_matrix_matches_rotation_product():
+    """The closed-form matrix equals R_x(eps) R_z(-z) R_y(theta) R_z(-zeta) and is orthonormal."""
+    import math
+
+    def rx(a):
+        c, s = math.cos(a), math.sin(a)
+        return ((1.0, 0.0, 0.0), (0.0, c, s), (0.0, -s, c))
+
+    def ry(a):
+        c, s = math.cos(a), math.sin(a)
+        return ((c, 0.0, -s), (0.0, 1.0, 0.0), (s, 0.0, c))
+
+    def rz(a):
+        c, s = math.cos(a), math.sin(a)
+        return ((c, s, 0.0), (-s, c, 0.0), (0.0, 0.0, 1.0))
+
+    def mul(A, B):
+        return tuple(tuple(sum(A[i][k] * B[k][j] for k in range(3)) for j in range(3)) for i in range(3))
+
+    for T in (-12.5, -1.0, 0.0, 0.237, 3.0, 25.0):
+        zeta = aa.arcsec_to_rad(2306.2181 * T + 0.30188 * T**2 + 0.017998 * T**3)
+        z = aa.arcsec_to_rad(2306.2181 * T + 1.09468 * T**2 + 0.018203 * T**3)
+        theta = aa.arcsec_to_rad(2004.3109 * T - 0.42665 * T**2 - 0.041833 * T**3)
+        eps = math.radians(aa.mean_obliquity_deg(T, model="iau2000"))
+        ref = mul(rx(eps), mul(rz(-z), mul(ry(theta), rz(-zeta))))
+
+        M = aa.matrix_eq_j2000_to_ecl_date(T)
+        assert aa.matrix_eq_j2000_to_ecl_date(T) is M
+        for i in range(3):
+            for j in range(3):
+                assert M[i][j] == pytest.approx(ref[i][j], abs=1e-15)
+                dot = sum(M[i][k] * M[j][k] for k in range(3))
+                assert dot == pytest.approx(1.0 if i == j else 0.0, abs=1e-14)
@@ -0,0 +1,23 @@
+import warnings
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore")
+    from caltib.engines.specs import ALL_SPECS
+
+from caltib.engines import calendar
+from caltib.engines.factory import make_engine
+
+
+def test_day_index_evicts_oldest_entry(monkeypatch):
+    """A full jdn index drops its oldest record, not the warm month being walked."""
+    monkeypatch.setattr(calendar, "_DAY_INDEX_SIZE", 40)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        cal = make_engine(ALL_SPECS["phugpa"])
+
+    start = 2460000
+    records = {jdn: cal.from_jdn(jdn) for jdn in range(start, start + 100)}
+    assert len(cal._day_index) == 40
+    assert list(cal._day_index) == list(range(start + 60, start + 100))
+    for jdn, rec in records.items():
+        assert cal.from_jdn(jdn) == rec
@@ -0,0 +1,171 @@
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from caltib.ephemeris.de422 import DE422Elongation, find_new_moon_near, wrap180
+
+
+class _CircularEph:
+    """Toy ephemeris: Sun and Moon on circular equatorial-frame orbits (jplephem-like compute)."""
+
+    def compute(self, name, jd):
+        jd = np.asarray(jd, dtype=np.float64)
+        if name == "moon":
+            th, r = 2 * math.pi * (jd / 27.321661 + 0.1), 384400.0
+        elif name == "sun":
+            th, r = 2 * math.pi * (jd / 365.256363 + 0.3), 1.496e8
+        else:  # earthmoon barycentre near the origin
+            th, r = 2 * math.pi * jd / 27.321661, 4670.0
+        x, y = r * np.cos(th), r * np.sin(th)
+        return np.array([x, y * 0.9, y * 0.4, x * 0, x * 0, x * 0])
+
+
+def test_elong_deg_batches_like_scalar_calls():
+    """An array of days gives the same elongations as one call per day."""
+    el = DE422Elongation(eph=_CircularEph(), emrat=81.3)
+    grid = np.linspace(2451545.0 - 25.0, 2451545.0 + 25.0, 201)
+    batched = el.elong_deg(grid)
+    scalar = [el.elong_deg(float(t)) for t in grid]
+    assert np.allclose(batched, scalar, rtol=0, atol=1e-9)
+
+    t = find_new_moon_near(el, 2451545.0)
+    assert abs(wrap180(el.elong_deg(t))) < 1e-6
+
+
+def test_tithi_boundary_brent_converges_in_few_calls():
+    """Brent's refinement hits the 12*d degree target to bisection accuracy in far fewer calls."""
+    from caltib.ephemeris.de422 import tithi_boundary_in_lunation
+
+    el = DE422Elongation(eph=_CircularEph(), emrat=81.3)
+    t0 = find_new_moon_near(el, 2451545.0)
+    t1 = find_new_moon_near(el, t0 + 29.5)
+
+    calls = []
+    el_count = DE422Elongation(eph=el.eph, emrat=el.emrat)
+    el_count.elong_deg = lambda t: calls.append(t) or el.elong_deg(t)
+
+    for d in (1, 7, 15, 29):
+        got = tithi_boundary_in_lunation(el_count, t0, t1, d)
+        assert t0 < got < t1
+        # ~0.5 deg/hour of elongation: 1e-6 deg is well below a 1e-9 day step
+        assert abs(wrap180(el.elong_deg(got) - 12.0 * d)) < 1e-6
+    assert len(calls) < 4 * 20
+
+
+class _PositionEph(_CircularEph):
+    """jplephem-like position(): (3, N) for arrays and (3, 1) for a scalar day."""
+
+    def compute(self, name, jd):
+        raise AssertionError("elong_deg should not evaluate velocities")
+
+    def position(self, name, jd):
+        return _CircularEph.compute(self, name, np.atleast_1d(jd))[:3]
+
+
+def test_elong_deg_uses_positions_only():
+    """With a position() method the velocity series is skipped and scalar days stay scalar."""
+    ref = DE422Elongation(eph=_CircularEph(), emrat=81.3)
+    el = DE422Elongation(eph=_PositionEph(), emrat=81.3)
+    grid = np.linspace(2451545.0 - 25.0, 2451545.0 + 25.0, 201)
+    assert np.array_equal(el.elong_deg(grid), ref.elong_deg(grid))
+
+    got = el.elong_deg(2451550.25)
+    assert type(got) is float
+    assert got == ref.elong_deg(2451550.25)
+    t = find_new_moon_near(el, 2451545.0)
+    assert type(t) is float
+
+
+def test_find_new_moon_near_bootstraps_from_phase():
+    """The mean-phase bootstrap lands on the nearest new moon in a handful of evaluations."""
+    el = DE422Elongation(eph=_CircularEph(), emrat=81.3)
+    calls = []
+    el_count = DE422Elongation(eph=el.eph, emrat=el.emrat)
+    el_count.elong_deg = lambda t: calls.append(t) or el.elong_deg(t)
+
+    for jd0 in np.linspace(2451545.0, 2451545.0 + 60.0, 13):
+        del calls[:]
+        t = find_new_moon_near(el_count, float(jd0))
+        assert abs(wrap180(el.elong_deg(t))) < 1e-6
+        assert abs(t - jd0) <= 0.5 * 29.6
+        assert len(calls) < 20
+
+
+def test_fused_elongation_kernel_matches_numpy_path():
+    """The fused (3, N) kernel reproduces the NumPy elongation path for arrays and scalars."""
+    from caltib.ephemeris import de422
+
+    if not de422.jit_enabled():
+        pytest.skip("numba not installed")
+    el = DE422Elongation(eph=_PositionEph(), emrat=81.3)
+    grid = np.linspace(2451545.0 - 25.0, 2451545.0 + 25.0, 201)
+
+    r_emb, r_em, r_sun = (el._position(b, grid) for b in ("earthmoon", "moon", "sun"))
+    r_es = r_sun - (r_emb - r_em / (el.emrat + 1.0))
+    ref = (de422._lon_ecl_deg(r_em) - de422._lon_ecl_deg(r_es)) % 360.0
+
+    got = el.elong_deg(grid)
+    assert got.shape == grid.shape
+    assert np.allclose(got, ref, rtol=0, atol=1e-9)
+    assert type(el.elong_deg(float(grid[7]))) is float
+    assert el.elong_deg(float(grid[7])) == got[7]
+
+
+def test_lunation_boundaries_share_one_grid():
+    """All tithi boundaries of a lunation come from one batched grid plus short Brent solves."""
+    from caltib.ephemeris.de422 import tithi_boundaries_in_lunation, tithi_boundary_in_lunation
+
+    el = DE422Elongation(eph=_CircularEph(), emrat=81.3)
+    t0 = find_new_moon_near(el, 2451545.0)
+    t1 = find_new_moon_near(el, t0 + 29.5)
+    days = list(range(1, 31))
+
+    calls = []
+    el_count = DE422Elongation(eph=el.eph, emrat=el.emrat)
+    el_count.elong_deg = lambda t: calls.append(np.size(t)) or el.elong_deg(t)
+    got = tithi_boundaries_in_lunation(el_count, t0, t1, days)
+
+    assert got[-1] == t1
+    for d, t in zip(days[:-1], got):
+        assert t0 < t < t1
+        assert abs(t - tithi_boundary_in_lunation(el, t0, t1, d)) < 1e-8
+    assert calls[0] == 61 and max(calls[1:]) == 1
+    assert len(calls) < 1 + 29 * 8
+
+
+def test_numpy_path_rotates_stacked_vectors(monkeypatch):
+    """Without numba, the stacked single-rotation path matches per-vector longitudes exactly."""
+    from caltib.ephemeris import de422
+
+    monkeypatch.setattr(de422, "jit_enabled", lambda: False)
+    el = DE422Elongation(eph=_CircularEph(), emrat=81.3)
+    grid = np.linspace(2451545.0 - 25.0, 2451545.0 + 25.0, 201)
+
+    r_emb, r_em, r_sun = (el._position(b, grid) for b in ("earthmoon", "moon", "sun"))
+    r_es = r_sun - (r_emb - r_em / (el.emrat + 1.0))
+    ref = (de422._lon_ecl_deg(r_em) - de422._lon_ecl_deg(r_es)) % 360.0
+
+    assert np.array_equal(el.elong_deg(grid), ref)
+    assert el.elong_deg(float(grid[3])) == ref[3]
+
+
+def test_scalar_days_stay_on_plain_floats(monkeypatch):
+    """A scalar day never reaches the array kernel and returns a Python float."""
+    from caltib.ephemeris import de422
+
+    el = DE422Elongation(eph=_PositionEph(), emrat=81.3)
+    grid = np.linspace(2451545.0 - 25.0, 2451545.0 + 25.0, 41)
+    r_emb, r_em, r_sun = (el._position(b, grid) for b in ("earthmoon", "moon", "sun"))
+    r_es = r_sun - (r_emb - r_em / (el.emrat + 1.0))
+    ref = (de422._lon_ecl_deg(r_em) - de422._lon_ecl_deg(r_es)) % 360.0
+
+    def _no_kernel(*args):
+        raise AssertionError("scalar day went through the array kernel")
+
+    monkeypatch.setattr(de422, "_elong_f64", _no_kernel)
+    for k, t in enumerate(grid.tolist()):
+        got = el.elong_deg(t)
+        assert type(got) is float
+        assert abs(got - ref[k]) < 1e-9
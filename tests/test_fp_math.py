@@ -0,0 +1,23 @@
+import pytest
+
+from caltib.engines.astro.fp_math import QuarterWavePolynomial, reduce_to_quarter_turn
+
+np = pytest.importorskip("numpy")
+
+SINE_POLY = (6.283185307179586, -41.341702240399755, 81.60524927607504, -76.70585975306136)
+
+
+def test_quarter_turn_reduction_array_matches_scalar_bitwise():
+    """The branchless array reduction reproduces the scalar branches exactly."""
+    from caltib.engines.astro.fp_math import reduce_to_quarter_turn_array
+
+    edges = [0.0, 0.25, 0.5, 0.75, 1.0, -0.25, -0.5, -0.75, 0.2500000000000001, 123.75, -1e6 + 0.3]
+    xs = np.concatenate([np.array(edges), np.random.default_rng(0).uniform(-50.0, 50.0, 2000)])
+
+    got = reduce_to_quarter_turn_array(xs)
+    poly = QuarterWavePolynomial(coeffs=SINE_POLY)
+    vals = poly.eval_normalized_turn_array(xs)
+
+    for x, u, v in zip(xs.tolist(), got.tolist(), vals.tolist()):
+        assert u.hex() == reduce_to_quarter_turn(x).hex()
+        assert v.hex() == poly.eval_normalized_turn(x).hex()
@@ -0,0 +1,20 @@
+import warnings
+
+from caltib.engines.specs import ALL_SPECS
+from caltib.engines.factory import make_engine
+
+
+def _month_engine(name: str):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return make_engine(ALL_SPECS[name]).month
+
+
+def test_sgang_index_is_exact_floor_far_from_epoch():
+    """The transit count is the exact rational floor, even millennia from J2000."""
+    month = _month_engine("l4")
+    base = month.p.sgang_base
+
+    for n in list(range(-30, 30)) + list(range(-60000, -59970)) + list(range(60000, 60030)):
+        z = (month.true_sun_tt(month.true_date(n)) - base) * 12
+        assert month.sgang_index(n) == z.numerator // z.denominator
@@ -0,0 +1,128 @@
+import warnings
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore")
+    from caltib.engines import specs
+
+
+def test_all_specs_registry_is_built_once():
+    """Each spec object is constructed once; aliases point at the same objects."""
+    assert set(specs.ALL_SPECS) == (
+        set(specs.TRAD_SPECS) | set(specs.REFORM_SPECS) | set(specs.ALIASES)
+    )
+    assert len(specs.TRAD_SPECS) == 5
+    assert len(specs.REFORM_SPECS) == 6
+
+    for alias, spec in specs.ALIASES.items():
+        assert specs.ALL_SPECS[alias] is spec
+        assert specs.REFORM_SPECS[f"reform-{alias}"] is spec
+    assert specs.ALL_SPECS["phugpa"] is specs.PHUGPA_SPEC
+
+
+def test_mongol_sgang_anchor_is_pre_reduced():
+    """The Mongol sgang1 anchor (308 2/3 degrees) stays a single canonical literal."""
+    from fractions import Fraction
+
+    assert specs.MONGOL_SPEC.month_params.sgang1_deg == Fraction(926, 3)
+    assert specs.MONGOL_SPEC.month_params.sgang1_deg == Fraction(308) + Fraction(2, 3)
+
+
+def test_spec_constants_are_built_lazily_and_cached():
+    """Spec constants resolve through the module __getattr__ once, then stay module globals."""
+    import pytest
+
+    assert set(specs.ALL_SPECS.names.values()) <= set(specs._SPEC_BUILDERS)
+    for name in specs._SPEC_BUILDERS:
+        spec = getattr(specs, name)
+        assert vars(specs)[name] is spec
+        assert getattr(specs, name) is spec
+
+    with pytest.raises(AttributeError):
+        specs.NOT_A_SPEC
+    with pytest.raises(KeyError):
+        specs.ALL_SPECS["not-a-spec"]
+
+
+def test_planet_engines_share_interned_tables():
+    """Planet engines built from different specs reuse one table instance per sample tuple."""
+    from caltib.engines.trad_planets import TraditionalPlanetsEngine
+
+    a = TraditionalPlanetsEngine(specs.PHUGPA_SPEC.planets_params)
+    b = TraditionalPlanetsEngine(specs.TSURPHU_SPEC.planets_params)
+    for k in a.sighra:
+        assert a.sighra[k] is b.sighra[k]
+    for k in a.manda:
+        assert a.manda[k] is b.manda[k]
+
+
+def test_engine_params_are_slotted():
+    """Day and planet params are slotted dataclasses: no per-instance __dict__."""
+    import sys
+    import pytest
+
+    if sys.version_info < (3, 10):
+        pytest.skip("dataclass slots need Python 3.10+")
+    for name in specs.ALL_SPECS.names.values():
+        spec = getattr(specs, name)
+        for params in (spec.day_params, spec.planets_params):
+            if params is not None:
+                assert not hasattr(params, "__dict__"), (name, type(params).__name__)
+
+
+def test_registries_are_read_only_and_membership_is_lazy():
+    """Registry names are frozen views, and `in` checks never build a spec."""
+    import pytest
+
+    with pytest.raises(TypeError):
+        specs.ALL_SPECS.names["x"] = "PHUGPA_SPEC"
+    with pytest.raises(TypeError):
+        specs.ALL_SPECS["x"] = specs.PHUGPA_SPEC
+
+    built = []
+    registry = specs._LazySpecs({"probe": "PROBE_SPEC"})
+    specs._SPEC_BUILDERS["PROBE_SPEC"] = lambda: built.append(1) or specs.PHUGPA_SPEC
+    try:
+        assert "probe" in registry and "other" not in registry
+        assert built == []
+        assert registry["probe"] is specs.PHUGPA_SPEC
+        assert built == [1]
+    finally:
+        del specs._SPEC_BUILDERS["PROBE_SPEC"]
+        vars(specs).pop("PROBE_SPEC", None)
+
+
+def test_import_and_traditional_year_do_not_load_numba():
+    """numba is imported on the first float-kernel call, not by `import caltib` or exact engines."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, warnings; warnings.simplefilter('ignore')\n"
+        "import caltib\n"
+        "caltib.get_calendar('phugpa').year_info(2024)\n"
+        "print('numba' in sys.modules)\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_lazy_spec_build_does_not_warn():
+    """Building a shipped spec inside a user call emits no construction-time alignment warnings."""
+    import warnings
+
+    for name in ("PHUGPA_SPEC", "MONGOL_SPEC"):
+        cached = vars(specs).pop(name)
+        try:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                rebuilt = getattr(specs, name)
+            assert caught == [], [str(w.message) for w in caught]
+            assert rebuilt == cached
+        finally:
+            vars(specs)[name] = cached
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        specs.arith_month(Y0=1927, M0=3, beta_star=55, tau=48, m0=specs.PHUGPA_E1927_M0,
+                          s0=specs.PHUGPA_E1927_S0, sgang1_deg=specs._F308)
+    assert any("Phase Alignment" in str(w.message) for w in caught)
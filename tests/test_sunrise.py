@@ -81,4 +81,31 @@ def test_nrel_spa_sunrise_sunset(mock_delta_t):
     # NREL Target: 00:20:19.19
     target_set_hours = 0.0 + (20.0 / 60.0) + (19.19 / 3600.0)
     
-    assert civil_times.set_utc_hours == pytest.approx(target_set_hours, abs=0.03)
\ No newline at end of file
+    assert civil_times.set_utc_hours == pytest.approx(target_set_hours, abs=0.03)
+
+def test_engine_sunrise_site_terms_are_bounded():
+    """Per-latitude site terms live in one bounded cache, not on the shared sunrise models."""
+    import warnings
+    from fractions import Fraction
+
+    from caltib.core.types import LocationSpec
+    from caltib.engines.astro import sunrise
+    from caltib.engines.rational_day import _bind_sunrise
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        from caltib.engines.specs import DAWN_SPHERICAL_DEF
+
+    model = _bind_sunrise(DAWN_SPHERICAL_DEF)
+    sun = Fraction(1, 7)
+    ref = None
+    for k in range(600):
+        loc = LocationSpec(name="probe", lon_turn=Fraction(0), lat_turn=Fraction(k - 300, 3600))
+        lmt, _ = model.sunrise_lmt_fraction(loc, sun, sun)
+        if k == 390:
+            ref = (loc, lmt)
+    assert sunrise._site_terms.cache_info().currsize <= sunrise._site_terms.cache_info().maxsize
+    assert "_site" not in vars(model)
+
+    sunrise._site_terms.cache_clear()
+    assert model.sunrise_lmt_fraction(ref[0], sun, sun)[0] == ref[1]
@@ -0,0 +1,76 @@
+import warnings
+from fractions import Fraction
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore")
+    from caltib.engines.specs import ALL_SPECS
+
+from caltib.engines.trad_day import TraditionalDayEngine
+
+
+def test_get_x_from_t2000_encloses_target():
+    """The returned tithi x satisfies true_date(x-1) <= t < true_date(x), for any input type."""
+    for name in ("phugpa", "mongol", "karana"):
+        engine = TraditionalDayEngine(ALL_SPECS[name].day_params)
+        for k in range(-60, 61):
+            for t in (k * 4111.37, k * 4111, Fraction(k * 28777, 7)):
+                x = engine.get_x_from_t2000(t)
+                assert engine.true_date(x - 1) <= Fraction(t) < engine.true_date(x)
+
+
+def test_true_date_memo_is_value_keyed():
+    """Memoized boundaries agree for equal tithis given as int, Fraction or float."""
+    engine = TraditionalDayEngine(ALL_SPECS["phugpa"].day_params)
+    for x in (-31, 0, 29, 12345):
+        want = engine.true_date(x)
+        assert engine.true_date(Fraction(x)) == want
+        assert engine.true_date(float(x)) == want
+        assert engine.true_date(Fraction(2 * x + 1, 2)) > want
+        assert engine.true_sun(Fraction(x)) == engine.true_sun(x)
+
+
+def test_true_dates_sweep_matches_pointwise():
+    """The incremental sweep reproduces true_date tithi by tithi, across month wraps."""
+    for name in ("phugpa", "bhutan"):
+        engine = TraditionalDayEngine(ALL_SPECS[name].day_params)
+        x0 = -95
+        sweep = engine.true_dates(x0, 200)
+        assert sweep == [engine.true_date(x0 + i) for i in range(200)]
+
+        n, d = divmod(x0, 30)
+        pairs = list(engine.series.eval_nd_run(n, d, 200))
+        assert pairs == [engine.series.eval_nd(*divmod(x0 + i, 30), 1) for i in range(200)]
+
+
+def test_to_nd_float_matches_fraction_coercion():
+    """Float tithis split exactly like their Fraction value."""
+    eng = TraditionalDayEngine(ALL_SPECS["phugpa"].day_params)
+    for x in (0.5, -0.5, 12345.75, -31.125, 1e-3, 59.999):
+        assert eng._to_nd(x) == eng._to_nd(Fraction(x))
+        assert eng.true_date(x) == eng.true_date(Fraction(x))
+        assert eng.mean_sun(x) == eng.mean_sun(Fraction(x))
+
+
+def test_local_civil_date_is_not_shadowed():
+    """local_civil_date stays a real method, so subclass overrides take effect."""
+    engine = TraditionalDayEngine(ALL_SPECS["phugpa"].day_params)
+    assert "local_civil_date" not in vars(engine)
+    assert engine.local_civil_date(100) == engine.true_date(100)
+
+    class Shifted(TraditionalDayEngine):
+        def local_civil_date(self, x):
+            return super().local_civil_date(x) + 1
+
+    shifted = Shifted(ALL_SPECS["phugpa"].day_params)
+    assert shifted.local_civil_date(100) == engine.true_date(100) + 1
+    for x in (-31, 0, 100, Fraction(201, 2)):
+        assert shifted.civil_jdn(x) == engine.civil_jdn(x) + 1
+
+
+def test_true_sun_memo_keeps_the_method():
+    """true_sun stays a class method; the memo lives on a private attribute."""
+    engine = TraditionalDayEngine(ALL_SPECS["phugpa"].day_params)
+    assert "true_sun" not in vars(engine)
+    for x in (-31, 0, 29, 12345):
+        assert engine.true_sun(x) == engine._solve_true_sun(x)
+    assert engine._true_sun_cached.cache_info().currsize == 4
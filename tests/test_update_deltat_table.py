@@ -0,0 +1,162 @@
+from datetime import date
+
+from caltib.ephemeris.update_deltat_table import (
+    _parse_iers_c04_csv,
+    _parse_leap_seconds_list,
+    EOPRow,
+    build_monthly_table,
+    tai_minus_utc_for_day,
+)
+
+
+_C04 = """# IERS C04 daily series
+MJD;Year;Month;Day;Type;x_pole;y_pole;UT1-UTC;LOD
+41318;1972;01;02;final;0.1;0.2; 0.1234567;0.001
+41317;1972;01;01;final;0.1;0.2;-0.0456789;0.001
+
+41319;1972;01;03;final;0.1;0.2;;0.001
+41320;1972;01;04;final;0.1;0.2;bad;0.001
+41321;1972;01
+"""
+
+_LEAPS = """#\tLeap seconds list
+2272060800\t10\t# 1 Jan 1972
+2287785600\t11\t# 1 Jul 1972
+2303683200\t12\t# 1 Jan 1973
+3644697600\t36\t# 1 Jul 2015
+3692217600\t37\t# 1 Jan 2017
+#h\t16edd0f0 3f5f6e1e
+"""
+
+
+def test_parse_iers_c04_csv_rows_are_sorted_and_filtered():
+    """Blank, comment, short and non-numeric rows are skipped; rows come back sorted by date."""
+    rows = _parse_iers_c04_csv(_C04)
+    assert [(r.d, r.ut1_utc) for r in rows] == [
+        (date(1972, 1, 1), -0.0456789),
+        (date(1972, 1, 2), 0.1234567),
+    ]
+
+
+def test_parse_iers_c04_csv_delimiters_quotes_and_mjd_only():
+    """Comma files, quoted fields and MJD-only layouts parse to the same rows."""
+    want = [(r.d, r.ut1_utc) for r in _parse_iers_c04_csv(_C04)]
+
+    comma = _C04.replace(";", ",")
+    assert [(r.d, r.ut1_utc) for r in _parse_iers_c04_csv(comma)] == want
+
+    quoted = comma.replace("final", '"final"')
+    assert [(r.d, r.ut1_utc) for r in _parse_iers_c04_csv(quoted)] == want
+
+    mjd_only = "\n".join(
+        ";".join(f for i, f in enumerate(ln.split(";")) if i not in (1, 2, 3))
+        for ln in _C04.splitlines()
+    )
+    assert [(r.d, r.ut1_utc) for r in _parse_iers_c04_csv(mjd_only)] == want
+
+
+def test_tai_minus_utc_for_day_steps_on_leap_dates():
+    """TAI-UTC is the last step on or before the day, clamped before 1972."""
+    from datetime import timedelta
+
+    leaps = _parse_leap_seconds_list(_LEAPS)
+    d = date(1971, 6, 1)
+    while d < date(2018, 6, 1):
+        want = leaps[0].tai_minus_utc
+        for e in leaps:
+            if e.utc_date <= d:
+                want = e.tai_minus_utc
+        assert tai_minus_utc_for_day(leaps, d) == want, d
+        d += timedelta(days=11)
+    assert tai_minus_utc_for_day(leaps, date(2016, 12, 31)) == 36
+    assert tai_minus_utc_for_day(leaps, date(2017, 1, 1)) == 37
+
+
+def test_build_monthly_table_picks_nearest_day_and_tail_fallback():
+    """Months sample the 15th, else the nearest day within 3 (earlier on ties), else the month's last day."""
+    from datetime import timedelta
+
+    leaps = _parse_leap_seconds_list(_LEAPS)
+    start = date(1972, 1, 1)
+    eops = []
+    for i in range(0, 200):
+        d = start + timedelta(days=i)
+        if (d.month == 2 and d.day in (15, 16)) or (d.month == 3 and 12 <= d.day <= 18):
+            continue
+        eops.append(EOPRow(d, 0.001 * i))
+    eops.append(EOPRow(date(1972, 8, 10), 0.5))  # tail: data stops before the 15th
+
+    rows = build_monthly_table(eops, leaps)
+    picked = {(y, m): d for _, y, m, d, *_ in rows}
+    assert picked[(1972, 1)] == date(1972, 1, 15)
+    assert picked[(1972, 2)] == date(1972, 2, 14)
+    assert picked[(1972, 3)] == date(1972, 3, 31)  # no day within 3: last day of the month
+    assert picked[(1972, 7)] == date(1972, 7, 15)
+    assert (1972, 8) not in picked  # the 15th lies past the last EOP day
+
+    tai = {(y, m): t for _, y, m, _, t, *_ in rows}
+    assert tai[(1972, 6)] == 10 and tai[(1972, 7)] == 11
+    for _, _, _, _, t, ut1, dt in rows:
+        assert dt == (t + 32.184) - ut1
+
+
+def test_parse_leap_seconds_list_skips_malformed_lines():
+    """Only '<ntp> <tai-utc> # <d> <Mon> <yyyy>' lines with a real date count; repeated dates keep the last."""
+    text = _LEAPS + (
+        "2287785600 11x # 1 Jul 1972\n"
+        "2303683200 12 # 31 Feb 1973\n"
+        "2303683200 12 # 1 Foo 1973\n"
+        "2303683200\n"
+        "2303683200 13# 1 January 1974\n"
+        "3692217600 38 # 1 Jan 2017\n"
+    )
+    leaps = _parse_leap_seconds_list(text)
+    assert [(e.utc_date, e.tai_minus_utc) for e in leaps] == [
+        (date(1972, 1, 1), 10),
+        (date(1972, 7, 1), 11),
+        (date(1973, 1, 1), 12),
+        (date(1974, 1, 1), 13),
+        (date(2015, 7, 1), 36),
+        (date(2017, 1, 1), 38),
+    ]
+
+
+def test_fetch_revalidates_from_disk_cache(tmp_path, monkeypatch):
+    """A cached body is revalidated with its ETag and reused on 304; gzip transfers are unpacked."""
+    import gzip
+    import io
+    import urllib.error
+    from email.message import Message
+
+    from caltib.ephemeris import update_deltat_table as udt
+
+    sent = []
+    body = "body v1 ΔT".encode("utf-8")
+
+    class _Resp(io.BytesIO):
+        def __init__(self, data, headers):
+            super().__init__(data)
+            self.headers = Message()
+            for k, v in headers.items():
+                self.headers[k] = v
+
+    def fake_urlopen(req):
+        headers = dict(req.header_items())
+        sent.append(headers)
+        if headers.get("If-none-match") == '"v1"':
+            raise urllib.error.HTTPError(req.full_url, 304, "Not Modified", Message(), None)
+        if headers.get("Accept-encoding") == "gzip":
+            return _Resp(gzip.compress(body), {"ETag": '"v1"', "Content-Encoding": "gzip"})
+        return _Resp(body, {"ETag": '"v1"'})
+
+    monkeypatch.setattr(udt.urllib.request, "urlopen", fake_urlopen)
+    url = "https://example.invalid/eop.csv"
+
+    assert udt._fetch(url, tmp_path) == "body v1 ΔT"
+    assert sent[-1] == {"Accept-encoding": "gzip"}
+    assert udt._fetch(url, tmp_path) == "body v1 ΔT"
+    assert sent[-1]["If-none-match"] == '"v1"'
+
+    assert udt._fetch(url) == "body v1 ΔT"
+    assert sent[-1] == {"Accept-encoding": "gzip"}
+    assert len(sent) == 3